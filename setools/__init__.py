@@ -16,7 +16,7 @@ import logging
 # Python classes for policy representation
 from .policyrep import SELinuxPolicy, BoundsRuletype, ConstraintRuletype, DefaultRuletype, \
     DefaultRangeValue, DefaultValue, FSUseRuletype, HandleUnknown, IbpkeyconRange, MLSRuletype, \
-    NodeconIPVersion, PolicyTarget, PortconProtocol, RBACRuletype, TERuletype
+    NodeconIPVersion, PolicyTarget, PortconProtocol, RBACRuletype, TERuletype, load_policies
 
 # Policy representation classes for type checking purposes.  Few can be instantiated
 # outside of this library.
@@ -34,8 +34,14 @@ from . import exception
 # Base class for policy queries for type checking purposes
 from .query import PolicyQuery
 
+# Progress reporting and cancellation of analyses
+from .progress import Progress
+
+# Limits of path searches of graph analyses
+from .pathsearch import PathBudget
+
 # utility functions
-from .util import xperm_str_to_tuple_ranges
+from .util import boolean_str_to_dict, xperm_str_to_tuple_ranges
 
 # Component Queries
 from .boolquery import BoolQuery
@@ -54,6 +60,7 @@ from .userquery import UserQuery
 from .mlsrulequery import MLSRuleQuery
 from .rbacrulequery import RBACRuleQuery
 from .terulequery import TERuleQuery
+from .batchquery import BatchRuleQuery, read_batch_specs
 
 # Constraint queries
 from .constraintquery import ConstraintQuery
@@ -84,6 +91,12 @@ from .permmap import PermissionMap, RuleWeight, Mapping
 # Domain Transition Analysis
 from .dta import *
 
+# Graph result export
+from .graphexport import GRAPH_FORMATS, export_graph, graph_format_from_filename, save_graph
+
+# Reachability of analysis graphs
+from .reachability import ReachabilityIndex
+
 # Policy difference
 from .diff import PolicyDifference
 
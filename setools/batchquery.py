@@ -0,0 +1,238 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+#
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+import csv
+import inspect
+import json
+import typing
+
+from . import policyrep, query, util
+from .progress import track
+from .mlsrulequery import MLSRuleQuery
+from .rbacrulequery import RBACRuleQuery
+from .terulequery import TERuleQuery
+
+__all__: typing.Final[tuple[str, ...]] = ("BatchRuleQuery", "read_batch_specs")
+
+RuleQuery = TERuleQuery | RBACRuleQuery | MLSRuleQuery
+AnyRule = policyrep.AnyTERule | policyrep.AnyRBACRule | policyrep.MLSRule
+
+# Rule type names in batch specifications.  These are
+# the same as the sesearch rule type options.
+_RULETYPES: typing.Final[dict[str, tuple[type[RuleQuery], policyrep.PolicyEnum]]] = {
+    **{rt.name: (TERuleQuery, rt) for rt in policyrep.TERuletype},
+    "role_allow": (RBACRuleQuery, policyrep.RBACRuletype.allow),
+    "role_transition": (RBACRuleQuery, policyrep.RBACRuletype.role_transition),
+    "range_transition": (MLSRuleQuery, policyrep.MLSRuletype.range_transition)}
+
+# Criteria which are lists, and the regex setting which
+# makes the criteria a single regular expression.
+_LIST_CRITERIA: typing.Final[dict[str, str | None]] = {"tclass": "tclass_regex",
+                                                       "perms": "perms_regex",
+                                                       "boolean": "boolean_regex"}
+
+
+class BatchRuleQuery(query.PolicyQuery):
+
+    """
+    Run many TE, RBAC, and MLS rule queries in one pass over the rules.
+
+    Each rule of the policy is only tested against the queries
+    which match its rule type.
+
+    Parameter:
+    policy      The policy to query.
+
+    Keyword Parameters:
+    queries     A mapping of query ids to TERuleQuery, RBACRuleQuery,
+                or MLSRuleQuery objects.
+    """
+
+    def __init__(self, policy: policyrep.SELinuxPolicy,
+                 queries: Mapping[str, RuleQuery] | None = None) -> None:
+        super().__init__(policy)
+        self.queries: dict[str, RuleQuery] = {}
+        for query_id, rule_query in (queries or {}).items():
+            self.add(query_id, rule_query)
+
+    @classmethod
+    def from_specs(cls, policy: policyrep.SELinuxPolicy,
+                   specs: Iterable[Mapping[str, typing.Any]]) -> "BatchRuleQuery":
+        """
+        Create a batch query from query specifications, such as those
+        from read_batch_specs().
+
+        Each specification has an "id", a "ruletype" list using the sesearch
+        rule type names (e.g. allow, role_allow, range_transition), and the
+        keyword parameters of the rule query.  List criteria and Boolean
+        settings may be strings, as read from CSV.
+
+        Parameter:
+        policy      The policy to query.
+        specs       The query specifications.
+
+        Exceptions:
+        ValueError  The specification is invalid.
+        """
+        batch = cls(policy)
+        for spec in specs:
+            batch.add(*_query_from_spec(policy, spec))
+
+        return batch
+
+    def add(self, query_id: str, rule_query: RuleQuery) -> None:
+        """Add a query to the batch."""
+        if query_id in self.queries:
+            raise ValueError(f"Duplicate batch query id: {query_id}")
+
+        if rule_query.policy is not self.policy:
+            raise ValueError(f"Batch query {query_id} is on a different policy.")
+
+        self.queries[query_id] = rule_query
+
+    def _build_repr_args(self) -> list[str]:
+        return [f"queries={self.queries!r}"]
+
+    def results(self) -> Iterable[tuple[str, AnyRule]]:
+        """Generator which yields (query id, rule) for all matching rules."""
+        self.log.info(f"Generating batch rule results from {self.policy} for "
+                      f"{len(self.queries)} queries")
+
+        rulesets: list[tuple[typing.Callable[[], Iterable[AnyRule]], type[RuleQuery],
+                             type[policyrep.PolicyEnum]]] = [
+            (self.policy.terules, TERuleQuery, policyrep.TERuletype),
+            (self.policy.rbacrules, RBACRuleQuery, policyrep.RBACRuletype),
+            (self.policy.mlsrules, MLSRuleQuery, policyrep.MLSRuletype)]
+
+        for rules, query_class, ruletype_enum in rulesets:
+            # dispatch each rule only to the queries of its rule type
+            dispatch: dict[policyrep.PolicyEnum, list[tuple[str, RuleQuery]]] = defaultdict(list)
+            for query_id, rule_query in self.queries.items():
+                if isinstance(rule_query, query_class):
+                    for ruletype in rule_query.ruletype or ruletype_enum:
+                        dispatch[ruletype].append((query_id, rule_query))
+
+            if not dispatch:
+                continue
+
+            for rule in track(self.progress, f"Matching {ruletype_enum.__name__} rules", rules()):
+                for query_id, rule_query in dispatch.get(rule.ruletype, ()):
+                    if rule_query._match_rule(rule):  # type: ignore[arg-type]
+                        yield query_id, rule
+
+
+def read_batch_specs(lines: Iterable[str]) -> list[dict[str, typing.Any]]:
+    """
+    Read batch query specifications.
+
+    The specifications are either JSON lines, with one JSON object
+    per line, or CSV with a header row of the specification keys.
+    Empty lines and lines starting with # are ignored.
+
+    Parameter:
+    lines       An iterable of lines, such as an open file.
+
+    Return:     A list of query specifications.
+    """
+    content = [line for line in lines if line.strip() and not line.lstrip().startswith("#")]
+    if not content:
+        return []
+
+    if content[0].lstrip().startswith("{"):
+        specs: list[dict[str, typing.Any]] = []
+        for lineno, line in enumerate(content, start=1):
+            try:
+                spec = json.loads(line)
+            except json.JSONDecodeError as ex:
+                raise ValueError(f"Invalid batch query on line {lineno}: {ex}") from ex
+
+            if not isinstance(spec, dict):
+                raise ValueError(f"Batch query on line {lineno} is not an object.")
+
+            specs.append(spec)
+
+        return specs
+
+    return [{k: v for k, v in row.items() if k and v} for row in csv.DictReader(content)]
+
+
+def _as_bool(value: typing.Any) -> bool:
+    """Convert a specification value to a bool."""
+    if isinstance(value, bool):
+        return value
+
+    if str(value).strip().lower() in ("1", "true", "yes", "y"):
+        return True
+
+    if str(value).strip().lower() in ("", "0", "false", "no", "n"):
+        return False
+
+    raise ValueError(f"Invalid Boolean value: {value}")
+
+
+def _as_list(value: typing.Any) -> list[str]:
+    """Convert a specification value to a list of strings."""
+    if isinstance(value, str):
+        return [v.strip() for v in value.split(",") if v.strip()]
+
+    return [str(v) for v in value]
+
+
+def _query_from_spec(policy: policyrep.SELinuxPolicy,
+                     spec: Mapping[str, typing.Any]) -> tuple[str, RuleQuery]:
+    """Create a rule query from a batch specification."""
+    spec = dict(spec)
+    try:
+        query_id = str(spec.pop("id"))
+    except KeyError as ex:
+        raise ValueError(f"Batch query is missing an id: {spec}") from ex
+
+    query_classes: set[type[RuleQuery]] = set()
+    ruletypes: list[policyrep.PolicyEnum] = []
+    for name in _as_list(spec.pop("ruletype", [])):
+        try:
+            query_class, ruletype = _RULETYPES[name]
+        except KeyError as ex:
+            raise ValueError(f"{query_id}: Invalid rule type: {name}") from ex
+
+        query_classes.add(query_class)
+        ruletypes.append(ruletype)
+
+    if not query_classes:
+        raise ValueError(f"{query_id}: At least one rule type must be specified.")
+
+    if len(query_classes) > 1:
+        raise ValueError(f"{query_id}: TE, RBAC, and MLS rule types cannot be mixed in a query.")
+
+    query_class = query_classes.pop()
+
+    # settings first, since list criteria depend on the regex settings.
+    kwargs: dict[str, typing.Any] = {}
+    for name, value in spec.items():
+        try:
+            # static lookup, since criteria descriptors only work on instances
+            attr = inspect.getattr_static(query_class, name)
+        except AttributeError as ex:
+            raise ValueError(f"{query_id}: Invalid {query_class.__name__} criteria: "
+                             f"{name}") from ex
+
+        if name == "policy" or callable(attr):
+            raise ValueError(f"{query_id}: Invalid {query_class.__name__} criteria: {name}")
+
+        if isinstance(attr, bool):
+            kwargs[name] = _as_bool(value)
+
+    for name, value in spec.items():
+        if name in kwargs or value is None or value == "":
+            continue
+
+        if name in _LIST_CRITERIA:
+            regex = _LIST_CRITERIA[name]
+            kwargs[name] = value if regex and kwargs.get(regex) else _as_list(value)
+        elif name == "xperms" and isinstance(value, str):
+            kwargs[name] = util.xperm_str_to_tuple_ranges(value)
+        else:
+            kwargs[name] = value
+
+    return query_id, query_class(policy, ruletype=ruletypes, **kwargs)
@@ -11,6 +11,7 @@ import typing
 
 from ..exception import InvalidCheckerConfig, InvalidCheckerModule
 from ..policyrep import SELinuxPolicy
+from ..progress import Progress, track
 
 from .checkermodule import CHECKER_REGISTRY, CheckerModule
 from .globalkeys import CHECK_TYPE_KEY
@@ -23,6 +24,9 @@ class PolicyChecker:
 
     """Configuration file-driven automated policy analysis checks."""
 
+    # Progress reporting and cancellation of the checks, if set.
+    progress: Progress | None = None
+
     def __init__(self, policy: SELinuxPolicy, configpath: str) -> None:
         assert CHECKER_REGISTRY, "No checks are loaded, this is a bug."
 
@@ -90,7 +94,7 @@ class PolicyChecker:
         output.write(f"Start time: {datetime.now(timezone.utc)}\n\n")
 
         result_summary = []
-        for check in self.checks:
+        for check in track(self.progress, "Running checks", self.checks, len(self.checks)):
 
             check_failures = 0
             try:
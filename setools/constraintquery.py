@@ -5,13 +5,14 @@
 from collections.abc import Iterable
 import typing
 
-from . import exception, mixins, policyrep, query, util
+from . import exception, mixins, parallel, policyrep, query, util
 from .descriptors import CriteriaDescriptor, CriteriaSetDescriptor
 
 __all__: typing.Final[tuple[str, ...]] = ("ConstraintQuery",)
 
 
-class ConstraintQuery(mixins.MatchObjClass, mixins.MatchPermission, query.PolicyQuery):
+class ConstraintQuery(mixins.MatchObjClass, mixins.MatchPermission, parallel.ParallelScan,
+                      query.PolicyQuery):
 
     """
     Query constraint rules, (mls)constrain/(mls)validatetrans.
@@ -59,6 +60,7 @@ class ConstraintQuery(mixins.MatchObjClass, mixins.MatchPermission, query.Policy
     type_ = CriteriaDescriptor[policyrep.Type]("type_regex", "lookup_type_or_attr")
     type_regex: bool = False
     type_indirect: bool = True
+    _shard_rules = "constraints"
 
     def _build_repr_args(self) -> list[str]:
         return [f"user={self.user!r}", f"user_regex={self.user_regex!r}", f"role={self.role!r}",
@@ -101,7 +103,12 @@ class ConstraintQuery(mixins.MatchObjClass, mixins.MatchPermission, query.Policy
         self.log.debug(f"{self.role=}, {self.role_regex=}")
         self.log.debug(f"{self.type_=}, {self.type_regex=}")
 
-        for c in self.policy.constraints():
+        yield from self._match_rules(self.policy.constraints())
+
+    def _match_rules(self, rules: Iterable[policyrep.AnyConstraint]) -> \
+            Iterable[policyrep.AnyConstraint]:
+        """Generator which yields the constraints matching the criteria."""
+        for c in rules:
             if self.ruletype:
                 if c.ruletype not in self.ruletype:
                     continue
@@ -0,0 +1,503 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+"""
+Local daemon for the command line tools.
+
+The daemon keeps policies, permission maps, and analysis graphs loaded
+between runs of sesearch, seinfo, sedta, and seinfoflow.  When the
+daemon is running, these tools forward their arguments to it over a
+Unix socket.  The daemon runs the tool and sends its output back, so
+the output is the same as running the tool directly.
+
+The socket path is taken from the SETOOLS_DAEMON_SOCKET environment
+variable.  If it is not set, the socket is in $XDG_RUNTIME_DIR, or
+the temporary directory.  Setting SETOOLS_DAEMON_SOCKET to an empty
+string disables forwarding.
+"""
+import builtins
+import contextlib
+import copy
+import io
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import tempfile
+import threading
+import traceback
+import typing
+import warnings
+from collections.abc import Iterable, Mapping
+
+from .dta import DomainTransitionAnalysis
+from .infoflow import InfoFlowAnalysis
+from .permmap import PermissionMap
+from .policyrep import SELinuxPolicy, Type
+
+__all__: typing.Final[tuple[str, ...]] = ("SEToolsDaemon", "daemon_socket_path",
+                                          "domain_transition_analysis", "forward",
+                                          "infoflow_analysis", "load_policy", "permission_map")
+
+# The tools that can be run by the daemon.
+TOOLS: typing.Final[frozenset[str]] = frozenset(("sesearch", "seinfo", "sedta", "seinfoflow"))
+
+SOCKET_ENV: typing.Final[str] = "SETOOLS_DAEMON_SOCKET"
+
+# Messages are framed by a channel byte and the payload length.
+_FRAME: typing.Final = struct.Struct("!cI")
+_REQUEST: typing.Final[bytes] = b"r"
+_STDOUT: typing.Final[bytes] = b"o"
+_STDERR: typing.Final[bytes] = b"e"
+_EXIT: typing.Final[bytes] = b"x"
+
+# The cache of the daemon while it runs a tool.  It is None
+# otherwise, so the tools load everything themselves.
+_cache: "AnalysisCache | None" = None
+
+
+def daemon_socket_path() -> str:
+    """Return the path of the daemon socket."""
+    with contextlib.suppress(KeyError):
+        return os.environ[SOCKET_ENV]
+
+    rundir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(rundir, f"setools-{os.getuid()}.sock")
+
+
+def forward(tool: str, argv: list[str]) -> int | None:
+    """
+    Run the tool in the daemon, if it is running.
+
+    The output of the tool is written to stdout and stderr.
+
+    Parameters:
+    tool    The name of the tool, e.g. "sesearch".
+    argv    The command line arguments of the tool.
+
+    Return: The exit status of the tool, or None if the daemon
+            is not running and the tool should run normally.
+    """
+    if _cache is not None:
+        # already running in the daemon.
+        return None
+
+    path = daemon_socket_path()
+    if not path:
+        return None
+
+    # only use a socket owned by this user.
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+
+    outputs = {_STDOUT: sys.stdout, _STDERR: sys.stderr}
+    with sock, sock.makefile("rb") as rfile:
+        _send_frame(sock, _REQUEST, json.dumps(
+            {"tool": tool, "argv": argv, "cwd": os.getcwd(),
+             "stdout": (sys.stdout.encoding, sys.stdout.errors),
+             "stderr": (sys.stderr.encoding, sys.stderr.errors)}).encode())
+
+        while True:
+            header = rfile.read(_FRAME.size)
+            if len(header) < _FRAME.size:
+                sys.stdout.flush()
+                print("Lost connection to the SETools daemon.", file=sys.stderr)
+                return 1
+
+            channel, length = _FRAME.unpack(header)
+            payload = rfile.read(length)
+            if channel == _EXIT:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                return int(payload)
+
+            # flush the other output to keep the order of the outputs
+            output = outputs[channel]
+            outputs[_STDERR if channel == _STDOUT else _STDOUT].flush()
+            output.flush()
+            output.buffer.write(payload)
+
+
+def _send_frame(sock: socket.socket, channel: bytes, payload: bytes) -> None:
+    # the tools set SIGPIPE to the default action, so do
+    # not raise SIGPIPE if the client has disconnected.
+    sock.sendall(_FRAME.pack(channel, len(payload)) + payload, socket.MSG_NOSIGNAL)
+
+
+#
+# Cached loaders for the tools
+#
+def load_policy(policyfile: str | None) -> SELinuxPolicy:
+    """Load a policy, using the daemon's cache if running in the daemon."""
+    if _cache is None:
+        return SELinuxPolicy(policyfile)
+
+    return _cache.policy(policyfile)
+
+
+def permission_map(permmapfile: str | None) -> PermissionMap:
+    """Load a permission map, using the daemon's cache if running in the daemon."""
+    if _cache is None:
+        return PermissionMap(permmapfile)
+
+    return _cache.permission_map(permmapfile)
+
+
+def domain_transition_analysis(policy: SELinuxPolicy,
+                               exclude: Iterable[Type | str] | None = None,
+                               booleans: Mapping[str, bool] | None = None) -> \
+        DomainTransitionAnalysis:
+    """
+    Create a domain transition analysis.  If running in the daemon, the
+    analysis shares the graph of a cached analysis.
+    """
+    if _cache is None:
+        return DomainTransitionAnalysis(policy, exclude=exclude, booleans=booleans)
+
+    return _cache.domain_transition_analysis(policy, exclude, booleans)
+
+
+def infoflow_analysis(policy: SELinuxPolicy, perm_map: PermissionMap, *,
+                      min_weight: int = 1,
+                      exclude: Iterable[Type | str] | None = None,
+                      booleans: Mapping[str, bool] | None = None) -> InfoFlowAnalysis:
+    """
+    Create an information flow analysis.  If running in the daemon, the
+    analysis shares the graph of a cached analysis.
+    """
+    if _cache is None:
+        return InfoFlowAnalysis(policy, perm_map, min_weight=min_weight, exclude=exclude,
+                                booleans=booleans)
+
+    return _cache.infoflow_analysis(policy, perm_map, min_weight, exclude, booleans)
+
+
+def _file_stamp(path: str | None) -> tuple[int, ...] | None:
+    """Return a stamp of the file, which changes if the file changes."""
+    if not path:
+        return None
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class AnalysisCache:
+
+    """
+    Cache of policies, permission maps, and analyses.
+
+    Policies and permission maps are reloaded if their file changes.
+    Analyses are cached with their graphs built.  A shallow copy of the
+    cached analysis is returned, so the caller's settings do not change
+    the cached analysis, while the graphs are shared.
+    """
+
+    def __init__(self) -> None:
+        self.log = logging.getLogger(__name__)
+        self.policies: dict[str | None, tuple[tuple[int, ...] | None, SELinuxPolicy]] = {}
+        self.perm_maps: dict[str | None, tuple[tuple[int, ...] | None, PermissionMap]] = {}
+        self.analyses: dict[tuple, DomainTransitionAnalysis | InfoFlowAnalysis] = {}
+
+    def policy(self, policyfile: str | None) -> SELinuxPolicy:
+        """Get a policy, loading it if it is not cached or has changed."""
+        # the stamp is of the loaded file, since the running
+        # policy is found when it is loaded.
+        key = os.path.realpath(policyfile) if policyfile else None
+        with contextlib.suppress(KeyError):
+            stamp, policy = self.policies[key]
+            if _file_stamp(policy.path) == stamp:
+                return policy
+
+            self.log.info(f"Policy {policy} has changed, reloading.")
+            self._drop(policy)
+
+        policy = SELinuxPolicy(policyfile)
+        self.policies[key] = (_file_stamp(policy.path), policy)
+        return policy
+
+    def permission_map(self, permmapfile: str | None) -> PermissionMap:
+        """Get a permission map, loading it if it is not cached or has changed."""
+        key = os.path.realpath(permmapfile) if permmapfile else None
+        stamp = _file_stamp(key)
+        with contextlib.suppress(KeyError):
+            cached_stamp, perm_map = self.perm_maps[key]
+            if cached_stamp == stamp:
+                return perm_map
+
+            self.log.info(f"Permission map {perm_map} has changed, reloading.")
+            self._drop(perm_map)
+
+        perm_map = PermissionMap(permmapfile)
+        self.perm_maps[key] = (stamp, perm_map)
+        return perm_map
+
+    def domain_transition_analysis(self, policy: SELinuxPolicy,
+                                   exclude: Iterable[Type | str] | None,
+                                   booleans: Mapping[str, bool] | None = None) -> \
+            DomainTransitionAnalysis:
+        """
+        Get a domain transition analysis sharing a cached graph.  The
+        graph has all rules, so it is shared by all boolean values.
+        """
+        exclude = list(exclude or ())
+        key = ("dta", policy, frozenset(str(e) for e in exclude))
+        try:
+            analysis = self.analyses[key]
+        except KeyError:
+            analysis = DomainTransitionAnalysis(policy, exclude=exclude)
+            analysis._build_subgraph()
+            self.analyses[key] = analysis
+
+        dta = copy.copy(typing.cast(DomainTransitionAnalysis, analysis))
+        if booleans is not None:
+            dta.booleans = booleans
+
+        return dta
+
+    def infoflow_analysis(self, policy: SELinuxPolicy, perm_map: PermissionMap,
+                          min_weight: int, exclude: Iterable[Type | str] | None,
+                          booleans: Mapping[str, bool] | None) -> InfoFlowAnalysis:
+        """Get an information flow analysis sharing a cached graph."""
+        exclude = list(exclude or ())
+        key = ("infoflow", policy, perm_map, min_weight, frozenset(str(e) for e in exclude),
+               None if booleans is None else frozenset(booleans.items()))
+        try:
+            analysis = self.analyses[key]
+        except KeyError:
+            analysis = InfoFlowAnalysis(policy, perm_map, min_weight=min_weight,
+                                        exclude=exclude, booleans=booleans)
+            analysis._build_subgraph()
+            self.analyses[key] = analysis
+
+        return copy.copy(typing.cast(InfoFlowAnalysis, analysis))
+
+    def _drop(self, obj: SELinuxPolicy | PermissionMap) -> None:
+        """Drop the analyses of a policy or permission map."""
+        self.analyses = {k: v for k, v in self.analyses.items()
+                         if not any(o is obj for o in k)}
+
+
+class _OutputBuffer:
+
+    """Buffer of output frames for the client."""
+
+    size: typing.Final[int] = 65536
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.data = bytearray()
+
+    def write(self, channel: bytes, payload: bytes) -> None:
+        self.data += _FRAME.pack(channel, len(payload))
+        self.data += payload
+        if len(self.data) >= self.size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.data:
+            self.sock.sendall(self.data, socket.MSG_NOSIGNAL)
+            self.data.clear()
+
+
+class _OutputChannel(io.RawIOBase):
+
+    """Raw stream writing to one output channel of the client."""
+
+    def __init__(self, output: _OutputBuffer, channel: bytes) -> None:
+        super().__init__()
+        self.output = output
+        self.channel = channel
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self.output.write(self.channel, bytes(data))
+        return len(data)
+
+    @classmethod
+    def stream(cls, output: _OutputBuffer, channel: bytes, encoding: str,
+               errors: str) -> typing.TextIO:
+        """Create a text stream for the channel, encoded the same as the client."""
+        return io.TextIOWrapper(typing.cast(typing.BinaryIO, cls(output, channel)),
+                                encoding=encoding, errors=errors, write_through=True)
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+
+    """Handle a request to run a tool."""
+
+    server: "SEToolsDaemon"
+
+    def handle(self) -> None:
+        output = _OutputBuffer(self.request)
+        try:
+            with self.request.makefile("rb") as rfile:
+                channel, length = _FRAME.unpack(rfile.read(_FRAME.size))
+                if channel != _REQUEST:
+                    raise ValueError(f"Invalid request channel: {channel!r}")
+
+                request = json.loads(rfile.read(length))
+
+            stdout = _OutputChannel.stream(output, _STDOUT, *request["stdout"])
+            stderr = _OutputChannel.stream(output, _STDERR, *request["stderr"])
+            status = self.server.run_tool(request["tool"], request["argv"], request["cwd"],
+                                          stdout, stderr)
+            stdout.flush()
+            stderr.flush()
+
+            output.write(_EXIT, str(status).encode())
+            output.flush()
+
+        except (OSError, ValueError, TypeError, LookupError, struct.error) as err:
+            # client error or disconnected client
+            self.server.log.warning(f"Failed to handle request: {err}")
+
+
+class SEToolsDaemon(socketserver.UnixStreamServer):
+
+    """
+    Daemon which runs the command line tools with cached policies
+    and analyses.
+
+    Tools are run one at a time, since the tool's stdout, stderr,
+    and working directory are replaced while it runs.
+
+    Parameters:
+    path        The path of the Unix socket.  The default is
+                from daemon_socket_path().
+    tooldir     The directory containing the tools.  The default is
+                the directory of the running script.
+    """
+
+    def __init__(self, path: str | None = None, tooldir: str | None = None) -> None:
+        self.log = logging.getLogger(__name__)
+        self.path = path or daemon_socket_path()
+        self.tooldir = tooldir or os.path.dirname(os.path.abspath(sys.argv[0]))
+        self.cache = AnalysisCache()
+        self._code: dict[str, tuple[tuple[int, ...] | None, typing.Any]] = {}
+
+        # remove a stale socket
+        with contextlib.suppress(OSError):
+            if stat.S_ISSOCK(os.lstat(self.path).st_mode):
+                os.unlink(self.path)
+
+        # only this user may connect.
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(self.path, _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+        self.log.info(f"SETools daemon listening on {self.path}")
+
+    def server_close(self) -> None:
+        super().server_close()
+        with contextlib.suppress(OSError):
+            os.unlink(self.path)
+
+    def run_tool(self, tool: str, argv: list[str], cwd: str, stdout: typing.TextIO,
+                 stderr: typing.TextIO) -> int:
+        """
+        Run a tool with the cached policies and analyses.
+
+        Parameters:
+        tool    The name of the tool.
+        argv    The command line arguments of the tool.
+        cwd     The working directory to run the tool in.
+        stdout  The stream to use for the tool's stdout.
+        stderr  The stream to use for the tool's stderr.
+
+        Return: The exit status of the tool.
+        """
+        global _cache
+
+        if tool not in TOOLS:
+            print(f"{tool} cannot be run by the SETools daemon.", file=stderr)
+            return 2
+
+        self.log.debug(f"Running {tool} {argv} in {cwd}")
+        code = self._compile(tool)
+
+        root_logger = logging.getLogger()
+        root_handlers = root_logger.handlers[:]
+        root_level = root_logger.level
+        saved_argv = sys.argv
+        saved_cwd = os.getcwd()
+
+        status: int
+        try:
+            with warnings.catch_warnings(), \
+                    contextlib.redirect_stdout(stdout), \
+                    contextlib.redirect_stderr(stderr):
+
+                # let the tool configure logging for this run
+                root_logger.handlers.clear()
+                sys.argv = [tool, *argv]
+                os.chdir(cwd)
+                _cache = self.cache
+
+                try:
+                    exec(code, {"__name__": "__main__",
+                                "__file__": os.path.join(self.tooldir, tool),
+                                "__builtins__": builtins})
+                    status = 0
+
+                except SystemExit as exc:
+                    if exc.code is None:
+                        status = 0
+                    elif isinstance(exc.code, int):
+                        status = exc.code
+                    else:
+                        print(exc.code, file=sys.stderr)
+                        status = 1
+
+                except Exception:
+                    traceback.print_exc()
+                    status = 1
+
+        finally:
+            _cache = None
+            os.chdir(saved_cwd)
+            sys.argv = saved_argv
+            root_logger.handlers[:] = root_handlers
+            root_logger.setLevel(root_level)
+            # the tools set SIGPIPE to the default action.
+            if threading.current_thread() is threading.main_thread():
+                signal.signal(signal.SIGPIPE, signal.SIG_IGN)
+
+        return status
+
+    def _compile(self, tool: str) -> typing.Any:
+        """Compile the tool, reusing the code unless the tool has changed."""
+        script = os.path.join(self.tooldir, tool)
+        stamp = _file_stamp(script)
+        with contextlib.suppress(KeyError):
+            cached_stamp, code = self._code[tool]
+            if cached_stamp == stamp:
+                return code
+
+        with open(script, "rb") as fd:
+            code = compile(fd.read(), script, "exec")
+
+        self._code[tool] = (stamp, code)
+        return code
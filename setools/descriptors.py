@@ -46,6 +46,12 @@ class CriteriaDescriptor(typing.Generic[T]):
                     is None.
     enum_class      The class of enumeration which supports a
                     lookup class method.
+    regex_symbols   The names of the SELinuxPolicy iterator functions,
+                    e.g. ("types", "typeattributes"), that yield the
+                    symbols this criteria can match.  If set, a regex
+                    criteria is evaluated once against these symbols
+                    and the names of the matching symbols are stored
+                    in the instance's _<name>_regex_matches attribute.
 
     Read-only instance attribute use (obj parameter):
     policy          The instance of SELinuxPolicy
@@ -57,7 +63,8 @@ class CriteriaDescriptor(typing.Generic[T]):
 
     def __init__(self, name_regex: str | None = None,
                  lookup_function: Callable | str | None = None,
-                 default_value=None, enum_class: type[policyrep.PolicyEnum] | None = None) -> None:
+                 default_value=None, enum_class: type[policyrep.PolicyEnum] | None = None,
+                 regex_symbols: Collection[str] | None = None) -> None:
 
         assert name_regex or lookup_function or enum_class, \
             "A simple attribute should be used if there is no regex, lookup function, or enum."
@@ -67,10 +74,13 @@ class CriteriaDescriptor(typing.Generic[T]):
         self.default_value = default_value
         self.lookup_function: Callable | str | None = lookup_function
         self.enum_class = enum_class
+        self.regex_symbols: Collection[str] | None = regex_symbols
         self.name: str
+        self.matches_name: str
 
     def __set_name__(self, owner, name: str) -> None:
         self.name = f"_internal_{name}"
+        self.matches_name = f"_{name}_regex_matches"
 
     def __get__(self, obj, objtype=None) -> T:
         if obj is None:
@@ -78,11 +88,25 @@ class CriteriaDescriptor(typing.Generic[T]):
 
         return getattr(obj, self.name, self.default_value)
 
+    def _set_regex(self, obj, value) -> None:
+        """Compile the regex criteria and precompute the matching symbol names."""
+        pattern = re.compile(value)
+        setattr(obj, self.name, pattern)
+
+        if self.regex_symbols:
+            setattr(obj, self.matches_name,
+                    frozenset(str(s) for func in self.regex_symbols
+                              for s in getattr(obj.policy, func)()
+                              if pattern.search(str(s))))
+
     def __set__(self, obj, value) -> None:
+        if self.regex_symbols:
+            setattr(obj, self.matches_name, None)
+
         if not value:
             setattr(obj, self.name, self.default_value)
         elif self.regex and getattr(obj, self.regex, False):
-            setattr(obj, self.name, re.compile(value))
+            self._set_regex(obj, value)
         elif self.lookup_function:
             if callable(self.lookup_function):
                 lookup = self.lookup_function
@@ -100,10 +124,13 @@ class CriteriaSetDescriptor(CriteriaDescriptor[set[T]]):
     """Descriptor for a set of criteria."""
 
     def __set__(self, obj, value):
+        if self.regex_symbols:
+            setattr(obj, self.matches_name, None)
+
         if not value:
             setattr(obj, self.name, self.default_value)
         elif self.regex and getattr(obj, self.regex, False):
-            setattr(obj, self.name, re.compile(value))
+            self._set_regex(obj, value)
         elif self.lookup_function:
             if callable(self.lookup_function):
                 lookup = self.lookup_function
@@ -141,6 +168,7 @@ class CriteriaPermissionSetDescriptor(CriteriaDescriptor[set[str]]):
     def __init__(self, name_regex: str | None = None, default_value=None) -> None:
         self.regex = name_regex
         self.default_value = default_value
+        self.regex_symbols = None
 
     def __set__(self, obj, value) -> None:
         if not value:
@@ -212,6 +240,18 @@ class NetworkXGraphEdgeDescriptor(ABC):
         pass
 
 
+class EdgeAttrBool(NetworkXGraphEdgeDescriptor):
+
+    """A descriptor for edge attributes that are booleans."""
+
+    def __set__(self, obj, value):
+        # None initializes to False
+        obj.G[obj.source][obj.target][self.name] = bool(value)
+
+    def __delete__(self, obj):
+        obj.G[obj.source][obj.target][self.name] = False
+
+
 class EdgeAttrDict(NetworkXGraphEdgeDescriptor):
 
     """A descriptor for edge attributes that are dictionaries."""
@@ -261,6 +301,34 @@ class EdgeAttrList(NetworkXGraphEdgeDescriptor):
         obj.G[obj.source][obj.target][self.name].clear()
 
 
+class EdgeAttrRules(NetworkXGraphEdgeDescriptor):
+
+    """
+    A descriptor for edge attributes that are lists of rules.  The edge
+    attribute is the packed rule ids of the graph's RuleTable, which is the
+    "rule_table" graph attribute, and the rules are looked up on access.
+    """
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        try:
+            return obj.G.graph["rule_table"].rules(obj.G[obj.source][obj.target][self.name])
+        except KeyError:
+            raise AttributeError(self.name)
+
+    def __set__(self, obj, value):
+        # None is a special value to initialize
+        if value is None:
+            obj.G[obj.source][obj.target][self.name] = b""
+        else:
+            raise ValueError(f"{self.name} rule ids should not be assigned directly")
+
+    def __delete__(self, obj):
+        obj.G[obj.source][obj.target][self.name] = b""
+
+
 #
 # Permission map descriptors
 #
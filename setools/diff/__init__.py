@@ -7,6 +7,7 @@ from .bounds import BoundsDifference
 from .commons import CommonDifference
 from .constraints import ConstraintsDifference
 from .default import DefaultsDifference
+from .difference import DifferenceCounts
 from .fsuse import FSUsesDifference
 from .genfscon import GenfsconsDifference
 from .ibendportcon import IbendportconsDifference
@@ -27,7 +28,7 @@ from .typeattr import TypeAttributesDifference
 from .types import TypesDifference
 from .users import UsersDifference
 
-__all__ = ['PolicyDifference']
+__all__ = ['DifferenceCounts', 'PolicyDifference']
 
 
 class PolicyDifference(BooleansDifference,
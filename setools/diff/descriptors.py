@@ -6,6 +6,9 @@
 from collections.abc import Callable
 import typing
 
+if typing.TYPE_CHECKING:
+    from .difference import DifferenceCounts
+
 T = typing.TypeVar("T")
 
 
@@ -41,3 +44,30 @@ class DiffResultDescriptor(typing.Generic[T]):
 
     def __delete__(self, obj) -> None:
         setattr(obj, self.name, None)
+
+
+class DiffCountDescriptor:
+
+    """Descriptor for managing diff result counts."""
+
+    def __init__(self, count_function: Callable[[typing.Any], None]) -> None:
+        self.count_function = count_function
+        self.name: str
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = f"_internal_{name}"
+
+    def __get__(self, obj, objtype=None) -> "DifferenceCounts":
+        if obj is None:
+            raise AttributeError
+
+        if getattr(obj, self.name, None) is None:
+            self.count_function(obj)
+
+        return getattr(obj, self.name)
+
+    def __set__(self, obj, value: "DifferenceCounts") -> None:
+        setattr(obj, self.name, value)
+
+    def __delete__(self, obj) -> None:
+        setattr(obj, self.name, None)
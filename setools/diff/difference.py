@@ -5,16 +5,21 @@
 #
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Sized
+from dataclasses import dataclass
 import typing
 
 from ..policyrep import PolicyObject, PolicySymbol, SELinuxPolicy
+from ..progress import Progress, track
 
 
 class Difference:
 
     """Base class for all policy differences."""
 
+    # Progress reporting and cancellation of the difference, if set.
+    progress: Progress | None = None
+
     def __init__(self, left_policy: SELinuxPolicy, right_policy: SELinuxPolicy) -> None:
         self.log = logging.getLogger(__name__)
         self.left_policy = left_policy
@@ -53,13 +58,13 @@ class Difference:
         """Reset diff results on policy changes."""
         raise NotImplementedError
 
-    @staticmethod
-    def _expand_generator(rule_list: Iterable, wrapper_class) -> Iterable:
+    def _expand_generator(self, rule_list: Iterable, wrapper_class) -> Iterable:
         """Generator that yields a wrapped, expanded rule list."""
         # this is to delay creating any containers
         # as long as possible, since rule lists
         # are typically massive.
-        for unexpanded_rule in rule_list:
+        total = len(rule_list) if isinstance(rule_list, Sized) else None
+        for unexpanded_rule in track(self.progress, "Expanding rules", rule_list, total):
             for expanded_rule in unexpanded_rule.expand():
                 yield wrapper_class(expanded_rule)
 
@@ -119,6 +124,42 @@ class Difference:
         else:
             return added_items, removed_items, matched_items
 
+    @staticmethod
+    def _set_diff_counts(left, right, modified: Callable | None = None) -> "DifferenceCounts":
+        """
+        Count the differences of two sets, without building the
+        added, removed, and matched sets.
+
+        Parameters:
+        left        An iterable
+        right       An iterable
+        modified    A callable taking the matching items from left
+                    and right, which returns True if the item is
+                    modified.  If not specified, no items are modified.
+
+        Return:     DifferenceCounts
+        """
+
+        # map each item to itself so the matching left item
+        # can be found for each right item without sorting
+        left_items = {i: i for i in left}
+        right_items = set(right)
+
+        added = 0
+        modified_count = 0
+        for right_item in right_items:
+            try:
+                left_item = left_items[right_item]
+            except KeyError:
+                added += 1
+                continue
+
+            if modified is not None and modified(left_item, right_item):
+                modified_count += 1
+
+        removed = len(left_items) - (len(right_items) - added)
+        return DifferenceCounts(added, removed, modified_count)
+
 
 class DifferenceResult:
 
@@ -127,6 +168,16 @@ class DifferenceResult:
     pass
 
 
+@dataclass(frozen=True)
+class DifferenceCounts:
+
+    """The number of added, removed, and modified items in a difference."""
+
+    added: int
+    removed: int
+    modified: int
+
+
 T = typing.TypeVar("T", bound=PolicyObject)
 
 
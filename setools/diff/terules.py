@@ -12,10 +12,11 @@ from enum import Enum
 import typing
 
 from .. import exception, policyrep
+from ..progress import track
 
 from .conditional import conditional_wrapper_factory
-from .descriptors import DiffResultDescriptor
-from .difference import Difference, DifferenceResult, Wrapper
+from .descriptors import DiffCountDescriptor, DiffResultDescriptor
+from .difference import Difference, DifferenceCounts, DifferenceResult, Wrapper
 from .types import type_wrapper_factory, type_or_attr_wrapper_factory
 from .typing import RuleList
 from .objclass import class_wrapper_factory
@@ -88,7 +89,7 @@ CondBlock = bool | str
 RuleDB = dict[CondExp, dict[CondBlock, dict[str, dict[str, dict[str, RuleDBSidesRecord]]]]]
 
 
-def _avrule_expand_generator(rule_list: list[policyrep.AVRule], rule_db: RuleDB,
+def _avrule_expand_generator(rule_list: Iterable[policyrep.AVRule], rule_db: RuleDB,
                              type_db: TypeDBRecord, side: Side) -> None:
     """
     Using rule_list, build up rule_db which is a data structure which consists
@@ -256,6 +257,56 @@ def _av_generate_diffs(rule_db: RuleDB, type_db: TypeDBRecord) -> \
     return added, removed, modified
 
 
+def _av_count_diffs(rule_db: RuleDB) -> DifferenceCounts:
+    """Count the added, removed, and modified rules without creating them."""
+    added = 0
+    removed = 0
+    modified = 0
+    for cond_blocks in rule_db.values():
+        for block in cond_blocks.values():
+            for src_data in block.values():
+                for tgt_data in src_data.values():
+                    for side_data in tgt_data.values():
+                        if side_data.left and side_data.right:
+                            if side_data.left.perms != side_data.right.perms:
+                                modified += 1
+                        elif side_data.left:
+                            removed += 1
+                        elif side_data.right:
+                            added += 1
+
+    return DifferenceCounts(added, removed, modified)
+
+
+def _av_build_rule_db(diff: "TERulesDifference", ruletype: policyrep.TERuletype) -> \
+        tuple[RuleDB, TypeDBRecord]:
+    """Build the expanded rule and type databases for the rule type from both policies."""
+    if diff._left_te_rules is None or diff._right_te_rules is None:
+        diff._create_te_rule_lists()
+
+    assert diff._left_te_rules is not None and diff._right_te_rules is not None
+    left_rules = typing.cast(list[policyrep.AVRule], diff._left_te_rules[ruletype])
+    right_rules = typing.cast(list[policyrep.AVRule], diff._right_te_rules[ruletype])
+
+    type_db = TypeDBRecord(dict(), dict())
+    rule_db: RuleDB = dict()
+    rule_db[TERULES_UNCONDITIONAL] = dict()
+    rule_db[TERULES_UNCONDITIONAL][TERULES_UNCONDITIONAL_BLOCK] = dict()
+
+    diff.log.info(f"Expanding AV rules from {diff.left_policy}.")
+    _avrule_expand_generator(track(diff.progress, "Expanding left policy AV rules",
+                                   left_rules, len(left_rules)), rule_db, type_db, Side.left)
+
+    diff.log.info(f"Expanding AV rules from {diff.right_policy}.")
+    _avrule_expand_generator(track(diff.progress, "Expanding right policy AV rules",
+                                   right_rules, len(right_rules)), rule_db, type_db, Side.right)
+
+    diff.log.info("Removing redundant AV rules.")
+    _av_remove_redundant_rules(rule_db)
+
+    return rule_db, type_db
+
+
 def av_diff_template(ruletype: policyrep.TERuletype) -> Callable[["TERulesDifference"], None]:
 
     """
@@ -270,22 +321,7 @@ def av_diff_template(ruletype: policyrep.TERuletype) -> Callable[["TERulesDiffer
         self.log.info(
             f"Generating {ruletype} differences from {self.left_policy} to {self.right_policy}")
 
-        if self._left_te_rules is None or self._right_te_rules is None:
-            self._create_te_rule_lists()
-
-        type_db = TypeDBRecord(dict(), dict())
-        rule_db: RuleDB = dict()
-        rule_db[TERULES_UNCONDITIONAL] = dict()
-        rule_db[TERULES_UNCONDITIONAL][TERULES_UNCONDITIONAL_BLOCK] = dict()
-
-        self.log.info(f"Expanding AV rules from {self.left_policy}.")
-        _avrule_expand_generator(self._left_te_rules[ruletype], rule_db, type_db, Side.left)
-
-        self.log.info(f"Expanding AV rules from {self.right_policy}.")
-        _avrule_expand_generator(self._right_te_rules[ruletype], rule_db, type_db, Side.right)
-
-        self.log.info("Removing redundant AV rules.")
-        _av_remove_redundant_rules(rule_db)
+        rule_db, type_db = _av_build_rule_db(self, ruletype)
 
         self.log.info("Generating AV rule diff.")
         added, removed, modified = _av_generate_diffs(rule_db, type_db)
@@ -301,6 +337,34 @@ def av_diff_template(ruletype: policyrep.TERuletype) -> Callable[["TERulesDiffer
     return diff
 
 
+def av_count_template(ruletype: policyrep.TERuletype) -> Callable[["TERulesDifference"], None]:
+
+    """
+    This is a template for the access vector diff count functions.
+
+    Parameters:
+    ruletype    The rule type, e.g. "allow".
+    """
+    def count(self) -> None:
+        """Count the difference in rules between the policies."""
+
+        self.log.info(
+            f"Counting {ruletype} differences from {self.left_policy} to {self.right_policy}")
+
+        rule_db, type_db = _av_build_rule_db(self, ruletype)
+
+        self.log.info("Counting AV rule diff.")
+        counts = _av_count_diffs(rule_db)
+
+        type_db.left.clear()
+        type_db.right.clear()
+        rule_db.clear()
+
+        setattr(self, f"{ruletype}_counts", counts)
+
+    return count
+
+
 def _avxrule_expand_generator(rule_list: Iterable[policyrep.AVRuleXperm]
                               ) -> Iterable["AVRuleXpermWrapper"]:
     """
@@ -376,6 +440,32 @@ def avx_diff_template(ruletype: policyrep.TERuletype) -> Callable[["TERulesDiffe
     return diff
 
 
+def avx_count_template(ruletype: policyrep.TERuletype) -> Callable[["TERulesDifference"], None]:
+
+    """
+    This is a template for the extended permission access vector diff count functions.
+
+    Parameters:
+    ruletype    The rule type, e.g. "allowxperm".
+    """
+    def count(self) -> None:
+        """Count the difference in rules between the policies."""
+
+        self.log.info(
+            f"Counting {ruletype} differences from {self.left_policy} "
+            f"to {self.right_policy}")
+
+        if not self._left_te_rules or not self._right_te_rules:
+            self._create_te_rule_lists()
+
+        setattr(self, f"{ruletype}_counts", self._set_diff_counts(
+            _avxrule_expand_generator(self._left_te_rules[ruletype]),
+            _avxrule_expand_generator(self._right_te_rules[ruletype]),
+            lambda left_rule, right_rule: left_rule.perms != right_rule.perms))
+
+    return count
+
+
 def te_diff_template(ruletype: policyrep.TERuletype) -> Callable[[typing.Any], None]:
 
     """
@@ -413,6 +503,33 @@ def te_diff_template(ruletype: policyrep.TERuletype) -> Callable[[typing.Any], N
     return diff
 
 
+def te_count_template(ruletype: policyrep.TERuletype) -> Callable[[typing.Any], None]:
+
+    """
+    This is a template for the type_* diff count functions.
+
+    Parameters:
+    ruletype    The rule type, e.g. "type_transition".
+    """
+    def count(self) -> None:
+        """Count the difference in rules between the policies."""
+
+        self.log.info(
+            f"Counting {ruletype} differences from {self.left_policy} to {self.right_policy}")
+
+        if self._left_te_rules is None or self._right_te_rules is None:
+            self._create_te_rule_lists()
+
+        setattr(self, f"{ruletype}_counts", self._set_diff_counts(
+            self._expand_generator(self._left_te_rules[ruletype], TERuleWrapper),
+            self._expand_generator(self._right_te_rules[ruletype], TERuleWrapper),
+            lambda left_rule, right_rule:
+                type_wrapper_factory(left_rule.origin.default) !=
+                type_wrapper_factory(right_rule.origin.default)))
+
+    return count
+
+
 class TERulesDifference(Difference):
 
     """
@@ -424,56 +541,78 @@ class TERulesDifference(Difference):
     added_allows = DiffResultDescriptor[policyrep.AVRule](diff_allows)
     removed_allows = DiffResultDescriptor[policyrep.AVRule](diff_allows)
     modified_allows = DiffResultDescriptor[ModifiedAVRule](diff_allows)
+    count_allows = av_count_template(policyrep.TERuletype.allow)
+    allow_counts = DiffCountDescriptor(count_allows)
 
     diff_auditallows = av_diff_template(policyrep.TERuletype.auditallow)
     added_auditallows = DiffResultDescriptor[policyrep.AVRule](diff_auditallows)
     removed_auditallows = DiffResultDescriptor[policyrep.AVRule](diff_auditallows)
     modified_auditallows = DiffResultDescriptor[ModifiedAVRule](diff_auditallows)
+    count_auditallows = av_count_template(policyrep.TERuletype.auditallow)
+    auditallow_counts = DiffCountDescriptor(count_auditallows)
 
     diff_neverallows = av_diff_template(policyrep.TERuletype.neverallow)
     added_neverallows = DiffResultDescriptor[policyrep.AVRule](diff_neverallows)
     removed_neverallows = DiffResultDescriptor[policyrep.AVRule](diff_neverallows)
     modified_neverallows = DiffResultDescriptor[ModifiedAVRule](diff_neverallows)
+    count_neverallows = av_count_template(policyrep.TERuletype.neverallow)
+    neverallow_counts = DiffCountDescriptor(count_neverallows)
 
     diff_dontaudits = av_diff_template(policyrep.TERuletype.dontaudit)
     added_dontaudits = DiffResultDescriptor[policyrep.AVRule](diff_dontaudits)
     removed_dontaudits = DiffResultDescriptor[policyrep.AVRule](diff_dontaudits)
     modified_dontaudits = DiffResultDescriptor[ModifiedAVRule](diff_dontaudits)
+    count_dontaudits = av_count_template(policyrep.TERuletype.dontaudit)
+    dontaudit_counts = DiffCountDescriptor(count_dontaudits)
 
     diff_allowxperms = avx_diff_template(policyrep.TERuletype.allowxperm)
     added_allowxperms = DiffResultDescriptor[policyrep.AVRuleXperm](diff_allowxperms)
     removed_allowxperms = DiffResultDescriptor[policyrep.AVRuleXperm](diff_allowxperms)
     modified_allowxperms = DiffResultDescriptor[ModifiedAVRuleXperm](diff_allowxperms)
+    count_allowxperms = avx_count_template(policyrep.TERuletype.allowxperm)
+    allowxperm_counts = DiffCountDescriptor(count_allowxperms)
 
     diff_auditallowxperms = avx_diff_template(policyrep.TERuletype.auditallowxperm)
     added_auditallowxperms = DiffResultDescriptor[policyrep.AVRuleXperm](diff_auditallowxperms)
     removed_auditallowxperms = DiffResultDescriptor[policyrep.AVRuleXperm](diff_auditallowxperms)
     modified_auditallowxperms = DiffResultDescriptor[ModifiedAVRuleXperm](diff_auditallowxperms)
+    count_auditallowxperms = avx_count_template(policyrep.TERuletype.auditallowxperm)
+    auditallowxperm_counts = DiffCountDescriptor(count_auditallowxperms)
 
     diff_neverallowxperms = avx_diff_template(policyrep.TERuletype.neverallowxperm)
     added_neverallowxperms = DiffResultDescriptor[policyrep.AVRuleXperm](diff_neverallowxperms)
     removed_neverallowxperms = DiffResultDescriptor[policyrep.AVRuleXperm](diff_neverallowxperms)
     modified_neverallowxperms = DiffResultDescriptor[ModifiedAVRuleXperm](diff_neverallowxperms)
+    count_neverallowxperms = avx_count_template(policyrep.TERuletype.neverallowxperm)
+    neverallowxperm_counts = DiffCountDescriptor(count_neverallowxperms)
 
     diff_dontauditxperms = avx_diff_template(policyrep.TERuletype.dontauditxperm)
     added_dontauditxperms = DiffResultDescriptor[policyrep.AVRuleXperm](diff_dontauditxperms)
     removed_dontauditxperms = DiffResultDescriptor[policyrep.AVRuleXperm](diff_dontauditxperms)
     modified_dontauditxperms = DiffResultDescriptor[ModifiedAVRuleXperm](diff_dontauditxperms)
+    count_dontauditxperms = avx_count_template(policyrep.TERuletype.dontauditxperm)
+    dontauditxperm_counts = DiffCountDescriptor(count_dontauditxperms)
 
     diff_type_transitions = te_diff_template(policyrep.TERuletype.type_transition)
     added_type_transitions = DiffResultDescriptor[policyrep.TERule](diff_type_transitions)
     removed_type_transitions = DiffResultDescriptor[policyrep.TERule](diff_type_transitions)
     modified_type_transitions = DiffResultDescriptor[ModifiedTERule](diff_type_transitions)
+    count_type_transitions = te_count_template(policyrep.TERuletype.type_transition)
+    type_transition_counts = DiffCountDescriptor(count_type_transitions)
 
     diff_type_changes = te_diff_template(policyrep.TERuletype.type_change)
     added_type_changes = DiffResultDescriptor[policyrep.TERule](diff_type_changes)
     removed_type_changes = DiffResultDescriptor[policyrep.TERule](diff_type_changes)
     modified_type_changes = DiffResultDescriptor[ModifiedTERule](diff_type_changes)
+    count_type_changes = te_count_template(policyrep.TERuletype.type_change)
+    type_change_counts = DiffCountDescriptor(count_type_changes)
 
     diff_type_members = te_diff_template(policyrep.TERuletype.type_member)
     added_type_members = DiffResultDescriptor[policyrep.TERule](diff_type_members)
     removed_type_members = DiffResultDescriptor[policyrep.TERule](diff_type_members)
     modified_type_members = DiffResultDescriptor[ModifiedTERule](diff_type_members)
+    count_type_members = te_count_template(policyrep.TERuletype.type_member)
+    type_member_counts = DiffCountDescriptor(count_type_members)
 
     _left_te_rules: RuleList[policyrep.TERuletype, policyrep.AnyTERule] = None
     _right_te_rules: RuleList[policyrep.TERuletype, policyrep.AnyTERule] = None
@@ -487,7 +626,8 @@ class TERulesDifference(Difference):
         # use down as long as possible
         self.log.debug(f"Building TE rule lists from {self.left_policy}")
         self._left_te_rules = defaultdict(list)
-        for rule in self.left_policy.terules():
+        for rule in track(self.progress, "Loading left policy TE rules",
+                          self.left_policy.terules()):
             self._left_te_rules[rule.ruletype].append(rule)
 
         for ruletype, rules in self._left_te_rules.items():
@@ -495,7 +635,8 @@ class TERulesDifference(Difference):
 
         self.log.debug(f"Building TE rule lists from {self.right_policy}")
         self._right_te_rules = defaultdict(list)
-        for rule in self.right_policy.terules():
+        for rule in track(self.progress, "Loading right policy TE rules",
+                          self.right_policy.terules()):
             self._right_te_rules[rule.ruletype].append(rule)
 
         for ruletype, rules in self._right_te_rules.items():
@@ -539,6 +680,17 @@ class TERulesDifference(Difference):
         del self.added_type_members
         del self.removed_type_members
         del self.modified_type_members
+        del self.allow_counts
+        del self.auditallow_counts
+        del self.neverallow_counts
+        del self.dontaudit_counts
+        del self.allowxperm_counts
+        del self.auditallowxperm_counts
+        del self.neverallowxperm_counts
+        del self.dontauditxperm_counts
+        del self.type_transition_counts
+        del self.type_change_counts
+        del self.type_member_counts
 
         # Lists of rules for each policy
         self._left_te_rules = None
@@ -6,7 +6,7 @@
 import itertools
 import logging
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable, Mapping
 from contextlib import suppress
 from dataclasses import dataclass, InitVar
 import typing
@@ -19,7 +19,11 @@ except ImportError as iex:
     logging.getLogger(__name__).debug(f"{iex.name} failed to import.")
 
 from . import exception, mixins, policyrep, query
-from .descriptors import CriteriaDescriptor, EdgeAttrDict, EdgeAttrList
+from .descriptors import CriteriaDescriptor, EdgeAttrBool, EdgeAttrDict, EdgeAttrList
+from .graphview import GraphOverlay
+from .pathsearch import bounded_simple_paths, paths_subgraph
+from .progress import track
+from .reachability import ReachabilityIndex
 
 __all__: typing.Final[tuple[str, ...]] = ('DomainTransitionAnalysis',
                                           'DomainTransition',
@@ -123,6 +127,10 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
     mode        The analysis mode (see DomainTransitionAnalysis.Mode)
     exclude     The types excluded from the domain transition analysis.
                 (default is none)
+    booleans    If None, all rules will be added to the analysis (default).
+                otherwise it should be set to a dict with keys corresponding
+                to boolean names and values of True/False. Any unspecified
+                booleans will use the policy's default values.
     """
 
     class Mode(policyrep.PolicyEnum):
@@ -131,6 +139,7 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
 
         ShortestPaths = "All shortest paths"
         AllPaths = "All paths up to"  # N steps
+        AllPathsSubgraph = "Union of all paths up to"  # N steps
         TransitionsOut = "Transitions out of the source domain."
         TransitionsIn = "Transitions into the target domain."
 
@@ -147,16 +156,18 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
                  target: policyrep.Type | str | None = None,
                  mode: Mode = Mode.ShortestPaths,
                  depth_limit: int | None = 1,
-                 exclude: Iterable[policyrep.Type | str] | None = None) -> None:
+                 exclude: Iterable[policyrep.Type | str] | None = None,
+                 booleans: Mapping[str, bool] | None = None) -> None:
 
         super().__init__(policy, reverse=reverse, source=source, target=target, mode=mode,
-                         depth_limit=depth_limit, exclude=exclude)
+                         depth_limit=depth_limit, exclude=exclude, booleans=booleans)
 
         self._min_weight: int
         self._depth_limit: int | None
 
         self.rebuildgraph = True
         self.rebuildsubgraph = True
+        self._reachability: ReachabilityIndex | None = None
 
         try:
             self.G = nx.DiGraph()
@@ -201,10 +212,22 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
 
         self.rebuildsubgraph = True
 
+    @property
+    def booleans(self) -> Mapping[str, bool] | None:
+        return self._booleans
+
+    @booleans.setter
+    def booleans(self, values: Mapping[str, bool] | None) -> None:
+        # The graph has all rules, so only the
+        # subgraph is rebuilt for new boolean values.
+        self._booleans = values
+        self.rebuildsubgraph = True
+
     def _build_repr_args(self) -> list[str]:
         return [f"source={self.source!r}", f"target={self.target!r}",
                 f"mode={self.mode!r}", f"depth_limit={self.depth_limit!r}",
-                f"exclude={self.exclude!r}", f"reverse={self.reverse!r}"]
+                f"exclude={self.exclude!r}", f"reverse={self.reverse!r}",
+                f"booleans={self.booleans!r}"]
 
     def results(self) -> Iterable[DTAPath] | Iterable[DomainTransition]:
         if self.rebuildsubgraph:
@@ -224,9 +247,10 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
                     self.log.info("Generating all shortest domain transition paths from "
                                   f"{self.source} to {self.target}...")
 
-                    for path in nx.all_shortest_paths(self.subG,
-                                                      self.source,
-                                                      self.target):
+                    for path in track(self.progress, "Finding shortest domain transition paths",
+                                      nx.all_shortest_paths(self.subG,
+                                                            self.source,
+                                                            self.target)):
 
                         yield self._generate_steps(path)
 
@@ -237,13 +261,29 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
                     self.log.info(f"Generating all domain transition paths from {self.source} "
                                   f"to {self.target}, max length {self.depth_limit}...")
 
-                    for path in nx.all_simple_paths(self.subG,
-                                                    self.source,
-                                                    self.target,
-                                                    cutoff=self.depth_limit):
+                    for path in track(self.progress, "Finding domain transition paths",
+                                      bounded_simple_paths(self.subG,
+                                                           self.source,
+                                                           self.target,
+                                                           self.depth_limit,
+                                                           self.path_budget)):
 
                         yield self._generate_steps(path)
 
+                case DomainTransitionAnalysis.Mode.AllPathsSubgraph:
+                    if not all((self.source, self.target)):
+                        raise ValueError("Source and target types must be specified.")
+
+                    self.log.info("Generating the union of all domain transition paths from "
+                                  f"{self.source} to {self.target}, "
+                                  f"max length {self.depth_limit}...")
+
+                    union = paths_subgraph(self.subG, self.source, self.target, self.depth_limit)
+                    for edge in track(self.progress, "Finding domain transitions",
+                                      union.edges(), union.number_of_edges()):
+
+                        yield from self._generate_steps(edge)
+
                 case DomainTransitionAnalysis.Mode.TransitionsOut:
                     if not self.source:
                         raise ValueError("Source type must be specified.")
@@ -311,10 +351,9 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
                     self.log.info("Generating graphical all shortest domain transition paths from "
                                   f"{self.source} to {self.target}...")
                     paths = nx.all_shortest_paths(self.subG, self.source, self.target)
-                    edges = [pair for path in paths for pair in nx.utils.misc.pairwise(path)]
-
                     out = nx.DiGraph()
-                    out.add_edges_from(edges)
+                    out.add_edges_from(pair for path in paths
+                                       for pair in nx.utils.misc.pairwise(path))
                     return out
 
                 case DomainTransitionAnalysis.Mode.AllPaths:
@@ -323,14 +362,23 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
 
                     self.log.info(f"Generating all domain transition paths from {self.source} "
                                   f"to {self.target}, max length {self.depth_limit}...")
-                    paths = nx.all_simple_paths(self.subG, self.source, self.target,
-                                                cutoff=self.depth_limit)
-                    edges = [pair for path in paths for pair in nx.utils.misc.pairwise(path)]
-
+                    paths = bounded_simple_paths(self.subG, self.source, self.target,
+                                                 self.depth_limit, self.path_budget)
+                    # each edge is added once, regardless of the number of paths
                     out = nx.DiGraph()
-                    out.add_edges_from(edges)
+                    out.add_edges_from(pair for path in paths
+                                       for pair in nx.utils.misc.pairwise(path))
                     return out
 
+                case DomainTransitionAnalysis.Mode.AllPathsSubgraph:
+                    if not all((self.source, self.target)):
+                        raise ValueError("Source and target types must be specified.")
+
+                    self.log.info("Generating the union of all domain transition paths from "
+                                  f"{self.source} to {self.target}, "
+                                  f"max length {self.depth_limit}...")
+                    return paths_subgraph(self.subG, self.source, self.target, self.depth_limit)
+
                 case DomainTransitionAnalysis.Mode.TransitionsOut:
                     if not self.source:
                         raise ValueError("Source type must be specified.")
@@ -355,6 +403,44 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
             raise exception.AnalysisException(
                 f"Unable to generate graphical results: {ex}") from ex
 
+    def build_graph(self) -> "nx.DiGraph":
+        """
+        Build the full domain transition graph, if needed, and return it.
+
+        The graph can be shared with other analyses of the same
+        policy by use_graph().
+        """
+        if self.rebuildgraph:
+            self._build_graph()
+
+        return self.G
+
+    def use_graph(self, graph: "nx.DiGraph") -> None:
+        """
+        Use a full domain transition graph from build_graph() of another analysis
+        of the same policy.  The graph is not modified.
+        """
+        if graph is not self.G:
+            self.G = graph
+            self.rebuildgraph = False
+            self.rebuildsubgraph = True
+
+    def reachability(self) -> ReachabilityIndex:
+        """
+        Get the reachability index of the domain transition subgraph,
+        building it if needed.  The index answers reachability questions
+        of the current analysis settings, e.g. excluded types, without
+        further graph searches.  It is rebuilt if the settings change.
+        If the analysis is reversed, the reachability is also reversed.
+        """
+        if self.rebuildsubgraph:
+            self._build_subgraph()
+
+        if self._reachability is None:
+            self._reachability = ReachabilityIndex(self.subG, progress=self.progress)
+
+        return self._reachability
+
     def get_stats(self) -> str:  # pragma: no cover
         """
         Get the domain transition graph statistics.
@@ -483,7 +569,9 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
     #      lists on the edge.
     #
     def _build_graph(self) -> None:
-        self.G.clear()
+        # new graph rather than clearing, since the
+        # graph may be shared by use_graph().
+        self.G = nx.DiGraph()
         self.G.name = f"Domain transition graph for {self.policy}."
 
         self.log.info(f"Building domain transition graph from {self.policy}...")
@@ -502,11 +590,18 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
         type_trans: defaultdict[policyrep.Type, defaultdict[policyrep.Type, RuleHash]] = \
             defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
 
-        for rule in self.policy.terules():
+        # Only the relevant rules are read from the policy,
+        # rather than filtering all of the TE rules here.
+        rules = itertools.chain(
+            self.policy.terules_by_class("process", (policyrep.TERuletype.allow,),
+                                         ("transition", "dyntransition", "setexec",
+                                          "setcurrent")),
+            self.policy.terules_by_class("file", (policyrep.TERuletype.allow,),
+                                         ("execute", "entrypoint")),
+            self.policy.terules_by_class("process", (policyrep.TERuletype.type_transition,)))
+
+        for rule in track(self.progress, "Building domain transition graph", rules):
             if rule.ruletype == policyrep.TERuletype.allow:
-                if rule.tclass not in ["process", "file"]:
-                    continue
-
                 if rule.tclass == "process":
                     if "transition" in rule.perms:
                         for s, t in itertools.product(rule.source.expand(), rule.target.expand()):
@@ -543,10 +638,7 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
                         for s, t in itertools.product(rule.source.expand(), rule.target.expand()):
                             entrypoint[s][t].append(rule)
 
-            elif rule.ruletype == policyrep.TERuletype.type_transition:
-                if rule.tclass != "process":
-                    continue
-
+            else:
                 d = rule.default
                 for s, t in itertools.product(rule.source.expand(), rule.target.expand()):
                     type_trans[s][t][d].append(rule)
@@ -555,7 +647,8 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
         clear_transition: list[Edge] = []
         clear_dyntransition: list[Edge] = []
 
-        for s, t in self.G.edges():
+        for s, t in track(self.progress, "Validating domain transitions",
+                          self.G.edges(), self.G.number_of_edges()):
             edge = Edge(self.G, s, t)
             invalid_trans = False
             invalid_dyntrans = False
@@ -570,22 +663,22 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
                     # there are no valid entrypoints
                     invalid_trans = True
                 else:
-                    # TODO try to improve the
-                    # efficiency in this loop
                     for m in match:
-                        # pylint: disable=unsupported-assignment-operation
-                        if s in setexec or type_trans[s][m]:
+                        trans = type_trans[s][m][t]
+                        if self._valid_entrypoint(entrypoint[t][m], execute[s][m], trans,
+                                                  s in setexec):
+                            # pylint: disable=unsupported-assignment-operation
                             # add key for each entrypoint
                             edge.entrypoint[m] += entrypoint[t][m]
                             edge.execute[m] += execute[s][m]
-
-                        if type_trans[s][m][t]:
-                            edge.type_transition[m] += type_trans[s][m][t]
+                            if trans:
+                                edge.type_transition[m] += trans
 
                     if s in setexec:
                         edge.setexec.extend(setexec[s])
 
-                    if not edge.setexec and not edge.type_transition:
+                    if not edge.entrypoint:
+                        # there are no valid entrypoints
                         invalid_trans = True
             else:
                 invalid_trans = True
@@ -623,6 +716,15 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
             del edge.dyntransition
             del edge.setcurrent
 
+        # Tag the edges which have conditional rules, so the
+        # subgraph for boolean values only revalidates them.
+        for s, t in self.G.edges():
+            edge = Edge(self.G, s, t)
+            edge.conditional = any(self._is_conditional(r) for r in itertools.chain(
+                edge.transition, edge.setexec, edge.dyntransition, edge.setcurrent,
+                *edge.entrypoint.values(), *edge.execute.values(),
+                *edge.type_transition.values()))
+
         self.rebuildgraph = False
         self.rebuildsubgraph = True
         self.log.info("Completed building domain transition graph.")
@@ -630,54 +732,172 @@ class DomainTransitionAnalysis(query.DirectedGraphAnalysis):
             f"Graph stats: nodes: {nx.number_of_nodes(self.G)}, "
             f"edges: {nx.number_of_edges(self.G)}.")
 
-    def _remove_excluded_entrypoints(self) -> None:
-        invalid_edges: list[Edge] = []
-        for source, target in self.subG.edges():
-            edge = Edge(self.subG, source, target)
-            entrypoints = set(edge.entrypoint)
-            entrypoints.intersection_update(self.exclude)
+    @staticmethod
+    def _valid_entrypoint(entrypoint: Collection[policyrep.AnyTERule],
+                          execute: Collection[policyrep.AnyTERule],
+                          type_transition: Collection[policyrep.AnyTERule],
+                          setexec: bool) -> bool:
+        """
+        Determine if an entrypoint type is valid for a domain transition.
+        The source domain must be able to execute it, the target domain
+        must be able to be entered by it, and the source domain must either
+        have setexec or a type_transition to the target domain for it.
+
+        Parameters:
+        entrypoint      The entrypoint rules of the target domain.
+        execute         The execute rules of the source domain.
+        type_transition The type_transition rules to the target domain.
+        setexec         The source domain has setexec.
+        """
+        return bool(entrypoint and execute and (setexec or type_transition))
+
+    @staticmethod
+    def _is_conditional(rule: policyrep.AnyTERule) -> bool:
+        """Determine if the rule is conditional."""
+        try:
+            rule.conditional
+            return True
+        except exception.RuleNotConditional:
+            return False
+
+    def _remove_disabled_transitions(self, overlay: GraphOverlay) -> None:
+        """
+        Remove the disabled rules for the boolean values from the subgraph,
+        and then the transitions which are no longer valid.  Only edges
+        tagged as having conditional rules are revalidated.
+        """
+        assert self.booleans is not None
+        booleans = self.booleans
+
+        # each conditional expression is evaluated once
+        truth: dict[policyrep.Conditional, bool] = {}
+
+        def enabled(rules: Iterable[policyrep.AnyTERule]) -> list[policyrep.AnyTERule]:
+            result: list[policyrep.AnyTERule] = []
+            for rule in rules:
+                try:
+                    cond = rule.conditional
+                except exception.RuleNotConditional:
+                    result.append(rule)
+                    continue
+
+                try:
+                    value = truth[cond]
+                except KeyError:
+                    value = truth[cond] = cond.evaluate(**booleans)
+
+                if value == rule.conditional_block:
+                    result.append(rule)
+
+            return result
+
+        # cannot change the overlay while iterating over the view
+        invalid_edges: list[tuple[policyrep.Type, policyrep.Type]] = []
+        changed_edges: list[tuple[policyrep.Type, policyrep.Type, dict[str, typing.Any]]] = []
+        for s, t, data in track(self.progress, "Removing disabled domain transitions",
+                                self.subG.edges(data=True), self.subG.number_of_edges()):
+            if not data.get("conditional"):
+                continue
+
+            transition = enabled(data["transition"])
+            setexec = enabled(data["setexec"])
+            entrypoint: defaultdict[policyrep.Type, list[policyrep.AnyTERule]] = \
+                defaultdict(list)
+            execute: defaultdict[policyrep.Type, list[policyrep.AnyTERule]] = defaultdict(list)
+            type_transition: defaultdict[policyrep.Type, list[policyrep.AnyTERule]] = \
+                defaultdict(list)
+
+            if transition:
+                for e, rules in data["entrypoint"].items():
+                    entry = enabled(rules)
+                    exe = enabled(data["execute"].get(e, ()))
+                    trans = enabled(data["type_transition"].get(e, ()))
+                    if self._valid_entrypoint(entry, exe, trans, bool(setexec)):
+                        entrypoint[e] = entry
+                        execute[e] = exe
+                        if trans:
+                            type_transition[e] = trans
+
+            if not entrypoint:
+                # no valid entrypoints, so no transition
+                transition = []
+                setexec = []
+
+            dyntransition = enabled(data["dyntransition"])
+            setcurrent = enabled(data["setcurrent"])
+            if not dyntransition or not setcurrent:
+                dyntransition = []
+                setcurrent = []
+
+            if not transition and not dyntransition:
+                invalid_edges.append((s, t))
+            else:
+                changed_edges.append((s, t, dict(
+                    transition=transition, setexec=setexec, entrypoint=entrypoint,
+                    execute=execute, type_transition=type_transition,
+                    dyntransition=dyntransition, setcurrent=setcurrent)))
+
+        for s, t in invalid_edges:
+            overlay.remove_edge(s, t)
 
-            if not entrypoints:
+        for s, t, attrs in changed_edges:
+            overlay.replace_data(s, t, **attrs)
+
+    def _remove_excluded_entrypoints(self, overlay: GraphOverlay) -> None:
+        excluded = set(self.exclude)
+
+        # cannot change the overlay while iterating over the view
+        invalid_edges: list[tuple[policyrep.Type, policyrep.Type]] = []
+        changed_edges: list[tuple[policyrep.Type, policyrep.Type, dict[str, typing.Any]]] = []
+        for source, target, data in self.subG.edges(data=True):
+            if excluded.isdisjoint(data["entrypoint"]):
                 # short circuit if there are no
                 # excluded entrypoint types on
                 # this edge.
                 continue
 
-            for e in entrypoints:
-                # clear the entrypoint data
-                # pylint: disable=unsupported-delete-operation
-                del edge.entrypoint[e]
-                del edge.execute[e]
+            # new entrypoint data without the excluded entrypoints,
+            # since the data is shared with the graph.
+            attrs: dict[str, typing.Any] = {}
+            for name in ("entrypoint", "execute", "type_transition"):
+                attrs[name] = defaultdict(list, ((e, rules) for e, rules in data[name].items()
+                                                 if e not in excluded))
 
-                with suppress(KeyError):  # setexec
-                    del edge.type_transition[e]
+            if not attrs["entrypoint"] and not data["dyntransition"]:
+                invalid_edges.append((source, target))
+            else:
+                changed_edges.append((source, target, attrs))
 
-            # cannot delete the edges while iterating over them
-            if not edge.entrypoint and not edge.dyntransition:
-                invalid_edges.append(edge)
+        for s, t in invalid_edges:
+            overlay.remove_edge(s, t)
 
-        self.subG.remove_edges_from(invalid_edges)
+        for s, t, attrs in changed_edges:
+            overlay.replace_data(s, t, **attrs)
 
     def _build_subgraph(self) -> None:
         if self.rebuildgraph:
             self._build_graph()
 
         self.log.info("Building domain transition subgraph.")
-        self.log.debug(f"{self.reverse=} {self.exclude=}")
+        self.log.debug(f"{self.reverse=} {self.exclude=} {self.booleans=}")
 
-        # reverse graph for reverse DTA
-        if self.reverse:
-            self.subG = self.G.reverse(copy=True)
-        else:
-            self.subG = self.G.copy()
+        # The subgraph is a view of the graph, so reversing
+        # and exclusions do not copy or modify the graph.
+        graph = self.G.reverse(copy=False) if self.reverse else self.G
 
-        if self.exclude:
-            # delete excluded domains from subgraph
-            self.subG.remove_nodes_from(self.exclude)
+        # delete excluded domains from subgraph
+        overlay = GraphOverlay(graph, exclude=self.exclude)
+        self.subG = overlay.view()
 
+        if self.booleans is not None:
+            # delete rules and transitions disabled by the booleans
+            self._remove_disabled_transitions(overlay)
+
+        if self.exclude:
             # delete excluded entrypoints from subgraph
-            self._remove_excluded_entrypoints()
+            self._remove_excluded_entrypoints(overlay)
 
+        self._reachability = None
         self.rebuildsubgraph = False
         self.log.info("Completed building domain transition subgraph.")
         self.log.debug(
@@ -712,11 +932,13 @@ class Edge(mixins.NetworkXGraphEdge):
     entrypoint = EdgeAttrDict()
     execute = EdgeAttrDict()
     type_transition = EdgeAttrDict()
+    conditional = EdgeAttrBool()
 
     def __post_init__(self, create) -> None:
         if not self.G.has_edge(self.source, self.target):
             if create:
                 self.G.add_edge(self.source, self.target)
+                self.conditional = False
                 self.transition = None
                 self.entrypoint = None
                 self.execute = None
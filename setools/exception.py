@@ -368,3 +368,9 @@ class AnalysisException(SEToolsException):
 
     """Base class for all analysis exceptions."""
     pass
+
+
+class AnalysisCanceled(AnalysisException):
+
+    """Exception for an analysis canceled by its Progress."""
+    pass
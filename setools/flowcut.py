@@ -0,0 +1,126 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+"""
+Maximum flow and minimum cuts of analysis graphs.
+
+The flows are computed by the preflow-push (push-relabel) algorithm
+on a compact copy of the graph, which has integer nodes and only the
+edge capacities, rather than on the analysis graph and its rule lists.
+"""
+from collections.abc import Hashable, Iterable
+import logging
+import typing
+
+try:
+    import networkx as nx
+    from networkx.algorithms.flow import preflow_push
+
+except ImportError as iex:
+    logging.getLogger(__name__).debug(f"{iex.name} failed to import.")
+
+__all__: typing.Final[tuple[str, ...]] = ("minimum_edge_cut", "minimum_node_cut")
+
+N = typing.TypeVar("N", bound=Hashable)
+
+
+def _endpoints(graph: "nx.DiGraph", sources: Iterable[N],
+               targets: Iterable[N]) -> tuple[set[N], set[N]]:
+    """Get the sources and targets in the graph, which must not overlap."""
+    source_set = set(n for n in sources if n in graph)
+    target_set = set(n for n in targets if n in graph)
+    if source_set & target_set:
+        raise ValueError(f"Sources and targets overlap: {source_set & target_set}")
+
+    return source_set, target_set
+
+
+def minimum_edge_cut(graph: "nx.DiGraph", sources: Iterable[N], targets: Iterable[N],
+                     capacity: str = "capacity") -> tuple[int, list[tuple[N, N]]]:
+    """
+    Get the maximum flow from the source nodes to the target nodes, and
+    the edges of a minimum cut, which is a set of edges of the least total
+    capacity that disconnects the targets from the sources.  Nodes which
+    are not in the graph are ignored.
+
+    Parameters:
+    graph       The directed graph.
+    sources     The source nodes.
+    targets     The target nodes.
+    capacity    The edge attribute of the capacity.
+
+    Return:     A tuple of the maximum flow and the list of cut edges.
+
+    Exceptions:
+    ValueError  The sources and targets overlap.
+    """
+    source_set, target_set = _endpoints(graph, sources, targets)
+    if not source_set or not target_set:
+        return 0, []
+
+    nodes = list(graph)
+    index = {n: i for i, n in enumerate(nodes)}
+    supersource, supersink = len(nodes), len(nodes) + 1
+
+    compact = nx.DiGraph()
+    compact.add_nodes_from(range(len(nodes) + 2))
+    compact.add_edges_from((index[u], index[v], {"capacity": c})
+                           for u, v, c in graph.edges(data=capacity))
+    # edges without a capacity have infinite capacity
+    compact.add_edges_from((supersource, index[s]) for s in source_set)
+    compact.add_edges_from((index[t], supersink) for t in target_set)
+
+    flow, (reachable, _) = nx.minimum_cut(compact, supersource, supersink,
+                                          flow_func=preflow_push)
+
+    cut = [(nodes[u], nodes[v]) for u in reachable if u != supersource
+           for v in compact.succ[u] if v not in reachable and v != supersink]
+
+    return int(flow), cut
+
+
+def minimum_node_cut(graph: "nx.DiGraph", sources: Iterable[N],
+                     targets: Iterable[N]) -> list[N] | None:
+    """
+    Get a minimum node cut, which is the fewest nodes, other than the
+    sources and targets, that disconnect the targets from the sources.
+    Nodes which are not in the graph are ignored.
+
+    Parameters:
+    graph       The directed graph.
+    sources     The source nodes.
+    targets     The target nodes.
+
+    Return:     The list of cut nodes, or None if there is no node cut,
+                since a source has an edge to a target.
+
+    Exceptions:
+    ValueError  The sources and targets overlap.
+    """
+    source_set, target_set = _endpoints(graph, sources, targets)
+    if not source_set or not target_set:
+        return []
+
+    # each node is split into an in node (2i) and an out node (2i + 1),
+    # so the capacity of a node is the capacity of the edge between them.
+    nodes = list(graph)
+    index = {n: i for i, n in enumerate(nodes)}
+    supersource, supersink = 2 * len(nodes), 2 * len(nodes) + 1
+
+    compact = nx.DiGraph()
+    compact.add_nodes_from(range(2 * len(nodes) + 2))
+    # edges without a capacity have infinite capacity
+    compact.add_edges_from((2 * i, 2 * i + 1, {"capacity": 1})
+                           for n, i in index.items()
+                           if n not in source_set and n not in target_set)
+    compact.add_edges_from((2 * index[n], 2 * index[n] + 1) for n in source_set | target_set)
+    compact.add_edges_from((2 * index[u] + 1, 2 * index[v]) for u, v in graph.edges())
+    compact.add_edges_from((supersource, 2 * index[s]) for s in source_set)
+    compact.add_edges_from((2 * index[t] + 1, supersink) for t in target_set)
+
+    try:
+        _, (reachable, _) = nx.minimum_cut(compact, supersource, supersink,
+                                           flow_func=preflow_push)
+    except nx.NetworkXUnbounded:
+        return None
+
+    return [nodes[i] for i in range(len(nodes))
+            if 2 * i in reachable and 2 * i + 1 not in reachable]
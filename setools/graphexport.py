@@ -0,0 +1,224 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+"""
+Streaming exporters for analysis result graphs.
+
+These write the graphs from graphical_results() of the graph analyses
+without a graph layout, so large results can be loaded into external
+graph tools.  Nodes are identified by their string representation, e.g.
+the type name.  Edge attributes which are bool, int, float, or str are
+exported; other edge attributes are skipped.
+"""
+from collections.abc import Callable, Iterable
+import logging
+import os
+import typing
+from xml.sax.saxutils import escape, quoteattr
+
+try:
+    import networkx as nx
+
+except ImportError as iex:
+    logging.getLogger(__name__).debug(f"{iex.name} failed to import.")
+
+__all__: typing.Final[tuple[str, ...]] = ("GRAPH_FORMATS", "export_graph",
+                                          "graph_format_from_filename", "save_graph",
+                                          "write_dot", "write_edgelist", "write_gexf",
+                                          "write_graphml")
+
+Scalar = bool | int | float | str
+
+_FILE_EXTENSIONS: typing.Final[dict[str, str]] = {".graphml": "graphml",
+                                                  ".gexf": "gexf",
+                                                  ".dot": "dot",
+                                                  ".gv": "dot",
+                                                  ".edgelist": "edgelist",
+                                                  ".edges": "edgelist"}
+
+
+def _edge_attrs(data: dict[str, typing.Any]) -> dict[str, Scalar]:
+    """Return the exportable attributes of an edge."""
+    return {k: v for k, v in data.items() if isinstance(v, Scalar)}
+
+
+def _edge_attr_types(graph: "nx.DiGraph") -> dict[str, type]:
+    """Determine the types of the exportable edge attributes."""
+    attr_types: dict[str, type] = {}
+    for _, _, data in graph.edges(data=True):
+        for key, value in _edge_attrs(data).items():
+            prev = attr_types.setdefault(key, type(value))
+            if prev is not type(value):
+                # mixed types are exported as strings
+                attr_types[key] = str
+
+    return attr_types
+
+
+def write_graphml(graph: "nx.DiGraph", fd: typing.TextIO) -> None:
+    """Write the graph as GraphML."""
+    type_names = {bool: "boolean", int: "long", float: "double", str: "string"}
+    attr_types = _edge_attr_types(graph)
+
+    fd.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+             '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+             '  <key id="label" for="node" attr.name="label" attr.type="string"/>\n')
+    for i, (key, value_type) in enumerate(attr_types.items()):
+        fd.write(f'  <key id="e{i}" for="edge" attr.name={quoteattr(key)} '
+                 f'attr.type="{type_names[value_type]}"/>\n')
+
+    key_ids = {key: f"e{i}" for i, key in enumerate(attr_types)}
+
+    fd.write('  <graph edgedefault="directed">\n')
+    for node in graph.nodes():
+        fd.write(f'    <node id={quoteattr(str(node))}>'
+                 f'<data key="label">{escape(str(node))}</data></node>\n')
+
+    for source, target, data in graph.edges(data=True):
+        attrs = _edge_attrs(data)
+        fd.write(f'    <edge source={quoteattr(str(source))} target={quoteattr(str(target))}')
+        if attrs:
+            fd.write(">")
+            for key, value in attrs.items():
+                text = str(value).lower() if isinstance(value, bool) else str(value)
+                fd.write(f'<data key="{key_ids[key]}">{escape(text)}</data>')
+            fd.write("</edge>\n")
+        else:
+            fd.write("/>\n")
+
+    fd.write("  </graph>\n</graphml>\n")
+
+
+def write_gexf(graph: "nx.DiGraph", fd: typing.TextIO) -> None:
+    """Write the graph as GEXF 1.3."""
+    type_names = {bool: "boolean", int: "long", float: "double", str: "string"}
+    attr_types = _edge_attr_types(graph)
+
+    fd.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+             '<gexf xmlns="http://gexf.net/1.3" version="1.3">\n'
+             '  <graph defaultedgetype="directed" mode="static">\n')
+    if attr_types:
+        fd.write('    <attributes class="edge">\n')
+        for i, (key, value_type) in enumerate(attr_types.items()):
+            fd.write(f'      <attribute id="{i}" title={quoteattr(key)} '
+                     f'type="{type_names[value_type]}"/>\n')
+        fd.write("    </attributes>\n")
+
+    key_ids = {key: str(i) for i, key in enumerate(attr_types)}
+
+    fd.write("    <nodes>\n")
+    for node in graph.nodes():
+        fd.write(f"      <node id={quoteattr(str(node))} label={quoteattr(str(node))}/>\n")
+
+    fd.write("    </nodes>\n    <edges>\n")
+    for i, (source, target, data) in enumerate(graph.edges(data=True)):
+        attrs = _edge_attrs(data)
+        fd.write(f'      <edge id="{i}" source={quoteattr(str(source))} '
+                 f'target={quoteattr(str(target))}')
+        if attrs:
+            fd.write("><attvalues>")
+            for key, value in attrs.items():
+                text = str(value).lower() if isinstance(value, bool) else str(value)
+                fd.write(f'<attvalue for="{key_ids[key]}" value={quoteattr(text)}/>')
+            fd.write("</attvalues></edge>\n")
+        else:
+            fd.write("/>\n")
+
+    fd.write("    </edges>\n  </graph>\n</gexf>\n")
+
+
+def _dot_quote(value: typing.Any) -> str:
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def write_dot(graph: "nx.DiGraph", fd: typing.TextIO) -> None:
+    """Write the graph as Graphviz DOT text, without a layout."""
+    fd.write("digraph {\n")
+    for node in graph.nodes():
+        fd.write(f"  {_dot_quote(node)};\n")
+
+    for source, target, data in graph.edges(data=True):
+        fd.write(f"  {_dot_quote(source)} -> {_dot_quote(target)}")
+        if attrs := _edge_attrs(data):
+            fd.write(" [" + ", ".join(f"{k}={_dot_quote(v)}" for k, v in attrs.items()) + "]")
+        fd.write(";\n")
+
+    fd.write("}\n")
+
+
+def write_edgelist(graph: "nx.DiGraph", fd: typing.TextIO) -> None:
+    """
+    Write the graph as a tab-separated edge list.
+
+    Each line has the source and target, followed by the edge
+    attributes as key=value.  Nodes without edges are written
+    on a line by themselves.
+    """
+    for node in graph.nodes():
+        if not graph.degree(node):
+            fd.write(f"{node}\n")
+
+    for source, target, data in graph.edges(data=True):
+        fields: Iterable[str] = (str(source), str(target),
+                                 *(f"{k}={v}" for k, v in _edge_attrs(data).items()))
+        fd.write("\t".join(fields) + "\n")
+
+
+GRAPH_FORMATS: typing.Final[dict[str, Callable[["nx.DiGraph", typing.TextIO], None]]] = {
+    "graphml": write_graphml,
+    "gexf": write_gexf,
+    "dot": write_dot,
+    "edgelist": write_edgelist}
+
+
+def graph_format_from_filename(filename: str) -> str | None:
+    """Return the graph export format for the file extension, if any."""
+    return _FILE_EXTENSIONS.get(os.path.splitext(filename)[1].lower())
+
+
+def export_graph(graph: "nx.DiGraph", filename: str, fmt: str) -> None:
+    """
+    Export a graph to a file.
+
+    Parameters:
+    graph       The graph to export.
+    filename    The path of the output file.
+    fmt         The export format, one of GRAPH_FORMATS.
+
+    Exceptions:
+    ValueError  The format is invalid.
+    """
+    try:
+        writer = GRAPH_FORMATS[fmt]
+    except KeyError as ex:
+        raise ValueError(f"Invalid graph export format: {fmt}") from ex
+
+    logging.getLogger(__name__).info(
+        f"Exporting graph with {graph.number_of_nodes()} nodes and "
+        f"{graph.number_of_edges()} edges to {filename} ({fmt})")
+
+    with open(filename, "w", encoding="utf-8") as fd:
+        writer(graph, fd)
+
+
+def save_graph(graph: "nx.DiGraph", filename: str, fmt: str | None = None) -> None:
+    """
+    Save a graph to a file, either rendered as a PNG image or exported.
+
+    Parameters:
+    graph       The graph to save.
+    filename    The path of the output file.
+
+    Keyword Parameters:
+    fmt         The output format, "png" or one of GRAPH_FORMATS.  If
+                None, the format is determined from the file extension,
+                defaulting to "png".
+
+    Exceptions:
+    ValueError  The format is invalid.
+    """
+    fmt = fmt or graph_format_from_filename(filename) or "png"
+    if fmt == "png":
+        pgv = nx.nx_agraph.to_agraph(graph)
+        pgv.draw(path=filename, prog="dot", format="png")
+    else:
+        export_graph(graph, filename, fmt)
@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+"""
+Copy-free views of analysis graphs.
+
+An analysis subgraph, e.g. with excluded types, is a read-only view of
+the analysis graph with an overlay of changes, rather than a copy of
+the graph.  The graph, including its edge attributes, is not modified,
+so it can be shared by several analyses.
+"""
+from collections.abc import Hashable, Iterator, Mapping
+import logging
+import typing
+
+try:
+    import networkx as nx
+
+except ImportError as iex:
+    logging.getLogger(__name__).debug(f"{iex.name} failed to import.")
+
+__all__: typing.Final[tuple[str, ...]] = ("GraphOverlay",)
+
+EdgeKey = tuple[Hashable, Hashable]
+
+
+class GraphOverlay:
+
+    """
+    Changes to a directed graph which are applied in a read-only view
+    of the graph, without copying or modifying the graph.
+
+    Parameters:
+    graph       The graph.  This may also be a view, such as the
+                reverse view of a graph.
+
+    Keyword Parameters:
+    exclude     The nodes excluded from the view.
+    """
+
+    def __init__(self, graph: "nx.DiGraph", /, *, exclude: typing.Iterable = ()) -> None:
+        self.graph: typing.Final = graph
+        self.excluded_nodes: typing.Final[set] = set(exclude)
+        self.removed_edges: typing.Final[set[EdgeKey]] = set()
+        self.edge_data: typing.Final[dict[EdgeKey, dict[str, typing.Any]]] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} excluded_nodes={len(self.excluded_nodes)} " \
+               f"removed_edges={len(self.removed_edges)} edge_data={len(self.edge_data)}>"
+
+    def node_ok(self, node: Hashable) -> bool:
+        """Determine if the node is in the view."""
+        return node not in self.excluded_nodes
+
+    def edge_ok(self, source: Hashable, target: Hashable) -> bool:
+        """Determine if the edge is in the view, if it is in the graph."""
+        return source not in self.excluded_nodes and target not in self.excluded_nodes and \
+            (source, target) not in self.removed_edges
+
+    def data(self, source: Hashable, target: Hashable) -> dict[str, typing.Any]:
+        """Get the attributes of an edge, with the overlay applied."""
+        try:
+            return self.edge_data[source, target]
+        except KeyError:
+            return self.graph._succ[source][target]
+
+    def remove_edge(self, source: Hashable, target: Hashable) -> None:
+        """Remove an edge from the view."""
+        self.removed_edges.add((source, target))
+
+    def replace_data(self, source: Hashable, target: Hashable, **attrs: typing.Any) -> None:
+        """
+        Replace attributes of an edge in the view.  The other attributes
+        of the edge are unchanged.  The values should be new objects,
+        rather than modified attribute values of the graph.
+        """
+        data = dict(self.data(source, target))
+        data.update(attrs)
+        self.edge_data[source, target] = data
+
+    def view(self) -> "nx.DiGraph":
+        """
+        Get a read-only view of the graph with this overlay.  Later changes
+        to the overlay are reflected in existing views.
+        """
+        view = nx.freeze(self.graph.__class__())
+        view._graph = self.graph
+        view.graph = self.graph.graph
+        view._node = _NodeAtlas(self.graph._node, self)
+        # view._adj is synced with _succ
+        view._succ = _Adjacency(self.graph._succ, self, reverse=False)
+        view._pred = _Adjacency(self.graph._pred, self, reverse=True)
+        return view
+
+
+class _NodeAtlas(Mapping):
+
+    """The nodes of a graph view, with their attributes."""
+
+    __slots__ = ("_atlas", "_overlay")
+
+    def __init__(self, atlas: Mapping, overlay: GraphOverlay) -> None:
+        self._atlas = atlas
+        self._overlay = overlay
+
+    def __getitem__(self, node):
+        if node in self._atlas and self._overlay.node_ok(node):
+            return self._atlas[node]
+
+        raise KeyError(f"Key {node} not found")
+
+    def __iter__(self) -> Iterator:
+        return (n for n in self._atlas if self._overlay.node_ok(n))
+
+    def __len__(self) -> int:
+        return len(self._atlas) - len(self._overlay.excluded_nodes & self._atlas.keys())
+
+
+class _Adjacency(Mapping):
+
+    """The successors or predecessors of each node of a graph view."""
+
+    __slots__ = ("_atlas", "_overlay", "_reverse")
+
+    def __init__(self, atlas: Mapping, overlay: GraphOverlay, reverse: bool) -> None:
+        self._atlas = atlas
+        self._overlay = overlay
+        self._reverse = reverse
+
+    def __getitem__(self, node):
+        if node in self._atlas and self._overlay.node_ok(node):
+            return _Neighbors(self._atlas[node], node, self._overlay, self._reverse)
+
+        raise KeyError(f"Key {node} not found")
+
+    def __iter__(self) -> Iterator:
+        return (n for n in self._atlas if self._overlay.node_ok(n))
+
+    def __len__(self) -> int:
+        return len(self._atlas) - len(self._overlay.excluded_nodes & self._atlas.keys())
+
+
+class _Neighbors(Mapping):
+
+    """The successors or predecessors of a node of a graph view, with the edge attributes."""
+
+    __slots__ = ("_atlas", "_node", "_overlay", "_reverse")
+
+    def __init__(self, atlas: Mapping, node, overlay: GraphOverlay, reverse: bool) -> None:
+        self._atlas = atlas
+        self._node = node
+        self._overlay = overlay
+        self._reverse = reverse
+
+    def _edge(self, nbr) -> EdgeKey:
+        return (nbr, self._node) if self._reverse else (self._node, nbr)
+
+    def __getitem__(self, nbr):
+        if nbr in self._atlas:
+            edge = self._edge(nbr)
+            if self._overlay.edge_ok(*edge):
+                return self._overlay.edge_data.get(edge, self._atlas[nbr])
+
+        raise KeyError(f"Key {nbr} not found")
+
+    def __iter__(self) -> Iterator:
+        return (n for n in self._atlas if self._overlay.edge_ok(*self._edge(n)))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
@@ -2,6 +2,9 @@
 #
 # SPDX-License-Identifier: LGPL-2.1-only
 #
+from array import array
+import collections
+import copy
 import itertools
 import logging
 from collections.abc import Iterable, Mapping
@@ -17,11 +20,17 @@ except ImportError as iex:
     logging.getLogger(__name__).debug(f"{iex.name} failed to import.")
 
 from . import exception, mixins, permmap, policyrep, query
-from .descriptors import CriteriaDescriptor, EdgeAttrIntMax, EdgeAttrList
+from .descriptors import CriteriaDescriptor, EdgeAttrIntMax, EdgeAttrRules
+from .flowcut import minimum_edge_cut, minimum_node_cut
+from .pathsearch import bounded_simple_paths, paths_subgraph, widest_paths
+from .progress import track
+from .reachability import ReachabilityIndex, bounded_reach_counts
+from .ruletable import RuleTable
 
 InfoFlowPath = Iterable['InfoFlowStep']
 
-__all__: typing.Final[tuple[str, ...]] = ("InfoFlowAnalysis", "InfoFlowStep", "InfoFlowPath")
+__all__: typing.Final[tuple[str, ...]] = ("InfoFlowAnalysis", "InfoFlowCut", "InfoFlowExposure",
+                                          "InfoFlowStep", "InfoFlowPath")
 
 
 class InfoFlowAnalysis(query.DirectedGraphAnalysis):
@@ -41,6 +50,8 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
                 (default is 1)
     exclude     The types excluded from the information flow analysis.
                 (default is none)
+    path_limit  The maximum number of paths of the strongest paths mode.
+                (default is 10)
     booleans    If None, all rules will be added to the analysis (default).
                 otherwise it should be set to a dict with keys corresponding
                 to boolean names and values of True/False. Any unspecified
@@ -53,12 +64,17 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
         """Information flow analysis modes"""
 
         ShortestPaths = "All shortest paths"
+        WidestPaths = "Widest paths"
+        StrongestPaths = "Strongest paths"
         AllPaths = "All paths up to"  # N steps
+        AllPathsSubgraph = "Union of all paths up to"  # N steps
+        MinimumCut = "Minimum cut of the flows"
         FlowsOut = "Flows out of the source type."
         FlowsIn = "Flows into the target type."
 
     DIRECT_MODES: typing.Final[tuple[Mode, ...]] = (Mode.FlowsIn, Mode.FlowsOut)
-    TRANSITIVE_MODES: typing.Final[tuple[Mode, ...]] = (Mode.ShortestPaths, Mode.AllPaths)
+    TRANSITIVE_MODES: typing.Final[tuple[Mode, ...]] = (
+        Mode.ShortestPaths, Mode.WidestPaths, Mode.StrongestPaths, Mode.AllPaths)
 
     source = CriteriaDescriptor[policyrep.Type](lookup_function="lookup_type")
     target = CriteriaDescriptor[policyrep.Type](lookup_function="lookup_type")
@@ -71,19 +87,24 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
                  target: policyrep.Type | str | None = None,
                  mode: Mode = Mode.ShortestPaths,
                  depth_limit: int | None = 1,
+                 path_limit: int | None = 10,
                  exclude: Iterable[policyrep.Type | str] | None = None,
                  booleans: Mapping[str, bool] | None = None) -> None:
 
         super().__init__(policy, perm_map=perm_map, min_weight=min_weight, source=source,
                          target=target, mode=mode, depth_limit=depth_limit,
-                         exclude=exclude, booleans=booleans)
+                         path_limit=path_limit, exclude=exclude, booleans=booleans)
 
         self._min_weight: int
         self._perm_map: permmap.PermissionMap
         self._depth_limit: int | None
+        self._path_limit: int | None
 
         self.rebuildgraph = True
         self.rebuildsubgraph = True
+        self._reachability: ReachabilityIndex | None = None
+        # the graph may be used by other analyses, so it is copied before it is updated.
+        self._graph_shared = False
 
         try:
             self.G = nx.DiGraph()
@@ -106,6 +127,18 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
         self._depth_limit = value
         # no subgraph rebuild needed.
 
+    @property
+    def path_limit(self) -> int | None:
+        return self._path_limit
+
+    @path_limit.setter
+    def path_limit(self, value: int | None) -> None:
+        if value is not None and value < 1:
+            raise ValueError("Information flow path limit must be positive.")
+
+        self._path_limit = value
+        # no subgraph rebuild needed.
+
     @property
     def min_weight(self) -> int:
         return self._min_weight
@@ -146,7 +179,8 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
         return [repr(self.perm_map),
                 f"source={self.source!r}", f"target={self.target!r}", f"mode={self.mode!r}",
                 f"min_weight={self.min_weight!r}", f"exclude={self.exclude!r}",
-                f"booleans={self.booleans!r}", f"depth_limit={self.depth_limit!r}"]
+                f"booleans={self.booleans!r}", f"depth_limit={self.depth_limit!r}",
+                f"path_limit={self.path_limit!r}"]
 
     def results(self) -> Iterable[InfoFlowPath] | Iterable["InfoFlowStep"]:
         if self.rebuildsubgraph:
@@ -155,7 +189,7 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
         self.log.info(f"Generating information flow results from {self.policy}")
         self.log.debug(f"{self.source=}")
         self.log.debug(f"{self.target=}")
-        self.log.debug(f"{self.mode=}, {self.depth_limit=}")
+        self.log.debug(f"{self.mode=}, {self.depth_limit=}, {self.path_limit=}")
 
         with suppress(NetworkXNoPath, NodeNotFound, NetworkXError):
             match self.mode:
@@ -166,7 +200,32 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
                     self.log.info("Generating all shortest information flow paths from "
                                   f"{self.source} to {self.target}...")
 
-                    for path in nx.all_shortest_paths(self.subG, self.source, self.target):
+                    for path in track(self.progress, "Finding shortest information flow paths",
+                                      nx.all_shortest_paths(self.subG, self.source, self.target)):
+                        yield (InfoFlowStep(self.subG, source, target)
+                               for source, target in nx.utils.misc.pairwise(path))
+
+                case InfoFlowAnalysis.Mode.WidestPaths:
+                    if not all((self.source, self.target)):
+                        raise ValueError("Source and target types must be specified.")
+
+                    self.log.info("Generating all widest information flow paths from "
+                                  f"{self.source} to {self.target}...")
+
+                    for path in track(self.progress, "Finding widest information flow paths",
+                                      widest_paths(self.subG, self.source, self.target)):
+                        yield (InfoFlowStep(self.subG, source, target)
+                               for source, target in nx.utils.misc.pairwise(path))
+
+                case InfoFlowAnalysis.Mode.StrongestPaths:
+                    if not all((self.source, self.target)):
+                        raise ValueError("Source and target types must be specified.")
+
+                    self.log.info(f"Generating the {self.path_limit} strongest information flow "
+                                  f"paths from {self.source} to {self.target}...")
+
+                    for path in track(self.progress, "Finding strongest information flow paths",
+                                      self._strongest_paths(), self.path_limit):
                         yield (InfoFlowStep(self.subG, source, target)
                                for source, target in nx.utils.misc.pairwise(path))
 
@@ -178,11 +237,31 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
                                   f"{self.source} to {self.target}, "
                                   f"max length {self.depth_limit}...")
 
-                    for path in nx.all_simple_paths(self.subG, self.source, self.target,
-                                                    cutoff=self.depth_limit):
+                    for path in track(self.progress, "Finding information flow paths",
+                                      bounded_simple_paths(self.subG, self.source, self.target,
+                                                           self.depth_limit, self.path_budget)):
                         yield (InfoFlowStep(self.subG, source, target)
                                for source, target in nx.utils.misc.pairwise(path))
 
+                case InfoFlowAnalysis.Mode.AllPathsSubgraph:
+                    if not all((self.source, self.target)):
+                        raise ValueError("Source and target types must be specified.")
+
+                    self.log.info("Generating the union of all information flow paths from "
+                                  f"{self.source} to {self.target}, "
+                                  f"max length {self.depth_limit}...")
+
+                    union = paths_subgraph(self.subG, self.source, self.target, self.depth_limit)
+                    for source, target in track(self.progress, "Finding information flow steps",
+                                                union.edges(), union.number_of_edges()):
+                        yield InfoFlowStep(self.subG, source, target)
+
+                case InfoFlowAnalysis.Mode.MinimumCut:
+                    if not all((self.source, self.target)):
+                        raise ValueError("Source and target types must be specified.")
+
+                    yield from self.minimum_cut().steps
+
                 case InfoFlowAnalysis.Mode.FlowsOut:
                     if not self.source:
                         raise ValueError("Source type must be specified.")
@@ -225,7 +304,7 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
         self.log.info(f"Generating graphical information flow results from {self.policy}")
         self.log.debug(f"{self.source=}")
         self.log.debug(f"{self.target=}")
-        self.log.debug(f"{self.mode=}, {self.depth_limit=}")
+        self.log.debug(f"{self.mode=}, {self.depth_limit=}, {self.path_limit=}")
 
         try:
             match self.mode:
@@ -236,10 +315,32 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
                     self.log.info("Generating all shortest information flow paths from "
                                   f"{self.source} to {self.target}...")
                     paths = nx.all_shortest_paths(self.subG, self.source, self.target)
-                    edges = [pair for path in paths for pair in nx.utils.misc.pairwise(path)]
+                    out = nx.DiGraph()
+                    out.add_edges_from(pair for path in paths
+                                       for pair in nx.utils.misc.pairwise(path))
+                    return out
+
+                case InfoFlowAnalysis.Mode.WidestPaths:
+                    if not all((self.source, self.target)):
+                        raise ValueError("Source and target types must be specified.")
+
+                    self.log.info("Generating all widest information flow paths from "
+                                  f"{self.source} to {self.target}...")
+                    paths = widest_paths(self.subG, self.source, self.target)
+                    out = nx.DiGraph()
+                    out.add_edges_from(pair for path in paths
+                                       for pair in nx.utils.misc.pairwise(path))
+                    return out
+
+                case InfoFlowAnalysis.Mode.StrongestPaths:
+                    if not all((self.source, self.target)):
+                        raise ValueError("Source and target types must be specified.")
 
+                    self.log.info(f"Generating the {self.path_limit} strongest information flow "
+                                  f"paths from {self.source} to {self.target}...")
                     out = nx.DiGraph()
-                    out.add_edges_from(edges)
+                    out.add_edges_from(pair for path in self._strongest_paths()
+                                       for pair in nx.utils.misc.pairwise(path))
                     return out
 
                 case InfoFlowAnalysis.Mode.AllPaths:
@@ -249,12 +350,29 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
                     self.log.info("Generating all information flow paths from "
                                   f"{self.source} to {self.target}, "
                                   f"max length {self.depth_limit}...")
-                    paths = nx.all_simple_paths(self.subG, self.source, self.target,
-                                                cutoff=self.depth_limit)
-                    edges = [pair for path in paths for pair in nx.utils.misc.pairwise(path)]
+                    paths = bounded_simple_paths(self.subG, self.source, self.target,
+                                                 self.depth_limit, self.path_budget)
+                    # each edge is added once, regardless of the number of paths
+                    out = nx.DiGraph()
+                    out.add_edges_from(pair for path in paths
+                                       for pair in nx.utils.misc.pairwise(path))
+                    return out
+
+                case InfoFlowAnalysis.Mode.AllPathsSubgraph:
+                    if not all((self.source, self.target)):
+                        raise ValueError("Source and target types must be specified.")
+
+                    self.log.info("Generating the union of all information flow paths from "
+                                  f"{self.source} to {self.target}, "
+                                  f"max length {self.depth_limit}...")
+                    return paths_subgraph(self.subG, self.source, self.target, self.depth_limit)
+
+                case InfoFlowAnalysis.Mode.MinimumCut:
+                    if not all((self.source, self.target)):
+                        raise ValueError("Source and target types must be specified.")
 
                     out = nx.DiGraph()
-                    out.add_edges_from(edges)
+                    out.add_edges_from((s.source, s.target) for s in self.minimum_cut().steps)
                     return out
 
                 case InfoFlowAnalysis.Mode.FlowsOut:
@@ -283,6 +401,141 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
             raise exception.AnalysisException(
                 f"Unable to generate graphical results: {ex}") from ex
 
+    def build_graph(self) -> "nx.DiGraph":
+        """
+        Build the full information flow graph, if needed, and return it.
+
+        The graph can be shared with other analyses of the same
+        policy by use_graph().
+        """
+        if self.rebuildgraph:
+            self._build_graph()
+
+        self._graph_shared = True
+        return self.G
+
+    def use_graph(self, graph: "nx.DiGraph") -> None:
+        """
+        Use a full information flow graph from build_graph() of another analysis
+        of the same policy.  The graph is not modified.  If the graph is from a
+        different permission map, the flows of the permissions which are mapped
+        differently are updated in a copy of the graph, rather than rebuilding
+        the graph.
+        """
+        if graph is not self.G:
+            self.G = graph
+            self._graph_shared = True
+            self.rebuildgraph = "perm_map" in graph.graph and \
+                bool(self.perm_map.differences(graph.graph["perm_map"]))
+            self.rebuildsubgraph = True
+
+    def minimum_cut(self, sources: Iterable[policyrep.TypeOrAttr | str] | None = None,
+                    targets: Iterable[policyrep.TypeOrAttr | str] | None = None) -> "InfoFlowCut":
+        """
+        Get the maximum information flow from the source types to the
+        target types, and the minimum cuts of the flow.  The flow is the
+        sum of the permission weights of the steps.  Excluded types and
+        the flows below the minimum weight are not included.
+
+        Parameters:
+        sources     The source types or attributes.  The default is the
+                    source type of the analysis.
+        targets     The target types or attributes.  The default is the
+                    target type of the analysis.
+
+        Return:     The cut.
+
+        Exceptions:
+        ValueError      No source or target types, or they overlap.
+        InvalidType     A source or target is not a valid type or attribute.
+        """
+        source_types = self._expand_types(sources, self.source)
+        target_types = self._expand_types(targets, self.target)
+        if not source_types or not target_types:
+            raise ValueError("Source and target types must be specified.")
+
+        if self.rebuildsubgraph:
+            self._build_subgraph()
+
+        self.log.info("Generating the minimum cut of the information flows from "
+                      f"{len(source_types)} source type(s) to {len(target_types)} "
+                      "target type(s)...")
+        flow, edges = minimum_edge_cut(self.subG, source_types, target_types)
+        types = minimum_node_cut(self.subG, source_types, target_types)
+        return InfoFlowCut(flow, sorted((InfoFlowStep(self.subG, s, t) for s, t in edges),
+                                        key=lambda step: (step.source, step.target)),
+                           None if types is None else sorted(types))
+
+    def exposure(self, targets: Iterable[policyrep.TypeOrAttr | str] | None = None, /, *,
+                 workers: int = 1) -> list["InfoFlowExposure"]:
+        """
+        Get the information flow exposure of every type, which is the
+        number of types it has information flows to and from within the
+        depth limit, and the total weight of those flows.  The weight of
+        the flow between two types is the highest minimum step weight of
+        the paths between them within the depth limit.  Excluded types
+        and the flows below the minimum weight are not included.
+
+        Parameters:
+        targets     The types or attributes which are counted, such as
+                    the sensitive types.  The default is all types.
+
+        Keyword Parameters:
+        workers     The number of worker processes.  The computation is
+                    split by flow direction and weight across worker
+                    processes forked from this process.
+
+        Return:     A list of the exposure of each type, sorted by type.
+
+        Exceptions:
+        InvalidType     A target is not a valid type or attribute.
+        """
+        target_types = None if targets is None else self._expand_types(targets, None)
+
+        if self.rebuildsubgraph:
+            self._build_subgraph()
+
+        self.log.info(f"Generating information flow exposure, max depth {self.depth_limit}...")
+
+        # The weight of a flow is the sum of one for each weight from 1 up
+        # to its weight, and a flow has a weight of at least w if there is
+        # a path of steps of at least weight w.  So the total weight is the
+        # sum of the counts of the flows of at least each distinct weight,
+        # multiplied by the span of weights below that weight.
+        weights = sorted(set(w for _, _, w in self.subG.edges(data="capacity")))
+        spans = [w - prev for prev, w in zip([0] + weights, weights)]
+        jobs = [(reverse, w) for reverse in (False, True) for w in weights]
+        counts = bounded_reach_counts(self.subG, jobs, depth=self.depth_limit,
+                                      targets=target_types, workers=workers,
+                                      progress=self.progress)
+
+        nodes = list(self.subG)
+        flows_out = counts[0] if weights else [0] * len(nodes)
+        flows_in = counts[len(weights)] if weights else [0] * len(nodes)
+        weight_out = [sum(span * c[i] for span, c in zip(spans, counts[:len(weights)]))
+                      for i in range(len(nodes))]
+        weight_in = [sum(span * c[i] for span, c in zip(spans, counts[len(weights):]))
+                     for i in range(len(nodes))]
+
+        return sorted((InfoFlowExposure(*row) for row in
+                       zip(nodes, flows_out, flows_in, weight_out, weight_in)),
+                      key=lambda e: e.type)
+
+    def reachability(self) -> ReachabilityIndex:
+        """
+        Get the reachability index of the information flow subgraph, building
+        it if needed.  The index answers reachability questions of the
+        current analysis settings, e.g. excluded types, without further
+        graph searches.  It is rebuilt if the settings change.
+        """
+        if self.rebuildsubgraph:
+            self._build_subgraph()
+
+        if self._reachability is None:
+            self._reachability = ReachabilityIndex(self.subG, progress=self.progress)
+
+        return self._reachability
+
     def get_stats(self) -> str:  # pragma: no cover
         """
         Get the information flow graph statistics.
@@ -300,6 +553,34 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
     # Internal functions follow
     #
 
+    def _expand_types(self, names: Iterable[policyrep.TypeOrAttr | str] | None,
+                      default: policyrep.Type | None) -> set[policyrep.Type]:
+        """Get the types of the types and attributes, or the default type if None."""
+        if names is None:
+            return {default} if default else set()
+
+        return set(t for n in names for t in self.policy.lookup_type_or_attr(n).expand())
+
+    @staticmethod
+    def _step_cost(source: policyrep.Type, target: policyrep.Type,
+                   data: dict[str, typing.Any]) -> int:
+        """
+        Get the cost of an information flow step for the strongest paths,
+        from 1 for a step of the maximum weight, increasing as the weight
+        decreases.  The strongest paths have the lowest total cost.
+        """
+        return permmap.MAX_WEIGHT + 1 - data["capacity"]
+
+    def _strongest_paths(self) -> Iterable[list[policyrep.Type]]:
+        """
+        Get the strongest paths, in order of increasing cost.  The paths
+        are generated lazily by Yen's algorithm, so only the paths up to
+        the path limit are found.
+        """
+        paths = nx.shortest_simple_paths(self.subG, self.source, self.target,
+                                         weight=self._step_cost)
+        return itertools.islice(paths, self.path_limit)
+
     def _generate_steps(self, path: list[policyrep.Type]) -> InfoFlowPath:
         """
         Generator which returns the source, target, and associated rules
@@ -326,26 +607,50 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
     #    rule and then expands the rule.  All information flows are
     #    included in this main graph: memory is traded off for efficiency
     #    as the main graph should only need to be rebuilt if permission
-    #    weights change.
+    #    weights change.  The rules of each edge are stored as packed ids of
+    #    the graph's RuleTable.  The graph keeps an index of the rules
+    #    by class and permission and the permission map it was built
+    #    from, so when the map changes, only the flows of the rules with
+    #    changed permissions are updated by _update_graph.
     # 2. _build_subgraph derives a subgraph which removes all excluded
     #    types (nodes) and edges (information flows) which are below the
     #    minimum weight. This subgraph is rebuilt only if the main graph
     #    is rebuilt or the minimum weight or excluded types change.
 
     def _build_graph(self) -> None:
-        self.G.clear()
-        self.G.name = f"Information flow graph for {self.policy}."
-
         self.perm_map.map_policy(self.policy)
 
+        if "perm_map" in self.G.graph:
+            self._update_graph(self.perm_map.differences(self.G.graph["perm_map"]))
+            return
+
+        # new graph rather than clearing, since the
+        # graph may be shared by use_graph().
+        self.G = nx.DiGraph()
+        self.G.name = f"Information flow graph for {self.policy}."
+        self._graph_shared = False
+
         self.log.info(f"Building information flow graph from {self.policy}...")
         self.log.debug(f"{self.perm_map=}")
 
-        for rule in self.policy.terules():
+        rule_table = self.G.graph["rule_table"] = RuleTable[policyrep.AVRule]()
+        perm_rules = collections.defaultdict[tuple[str, str], "array[int]"](lambda: array("I"))
+        # the rule ids of each edge are collected during the scan and packed
+        # once afterwards, rather than packing each partial list of ids.
+        edge_rules = collections.defaultdict[tuple[policyrep.Type, policyrep.Type],
+                                             "array[int]"](lambda: array("I"))
+        for rule in track(self.progress, "Building information flow graph",
+                          self.policy.terules()):
             if rule.ruletype != policyrep.TERuletype.allow:
                 continue
 
-            weight = self.perm_map.rule_weight(typing.cast(policyrep.AVRule, rule))
+            rule = typing.cast(policyrep.AVRule, rule)
+            rule_id = rule_table.id(rule)
+            class_name = str(rule.tclass)
+            for perm in rule.perms:
+                perm_rules[class_name, perm].append(rule_id)
+
+            weight = self.perm_map.rule_weight(rule)
 
             for s, t in itertools.product(rule.source.expand(), rule.target.expand()):
                 # only add flows if they actually flow
@@ -353,20 +658,117 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
                 if s != t:
                     if weight.write:
                         edge = InfoFlowStep(self.G, s, t, create=True)
-                        edge.rules.append(rule)
+                        edge_rules[s, t].append(rule_id)
                         edge.weight = weight.write
 
                     if weight.read:
                         edge = InfoFlowStep(self.G, t, s, create=True)
-                        edge.rules.append(rule)
+                        edge_rules[t, s].append(rule_id)
                         edge.weight = weight.read
 
+        for (s, t), rule_ids in edge_rules.items():
+            self.G.succ[s][t]["rules"] = rule_table.ids(rule_ids)
+
+        rule_table.release()
+
+        self.G.graph["perm_rules"] = dict(perm_rules)
+        self.G.graph["perm_map"] = copy.deepcopy(self.perm_map)
         self.rebuildgraph = False
         self.rebuildsubgraph = True
         self.log.info("Completed building information flow graph.")
         self.log.debug(f"Graph stats: nodes: {nx.number_of_nodes(self.G)}, "
                        f"edges: {nx.number_of_edges(self.G)}.")
 
+    def _update_graph(self, changes: set[tuple[str, str]]) -> None:
+        """
+        Update the flows of the rules with permissions which are mapped
+        differently than when the graph was built.
+
+        Parameter:
+        changes     The (class, permission) of the changed mappings.
+        """
+        self.log.info(f"Updating information flow graph for {len(changes)} changed "
+                      "permission mappings...")
+        old_map: permmap.PermissionMap = self.G.graph["perm_map"]
+        perm_rules: dict[tuple[str, str], "array[int]"] = self.G.graph["perm_rules"]
+        rule_table: RuleTable[policyrep.AVRule] = self.G.graph["rule_table"]
+        rules = dict.fromkeys(r for key in changes for r in perm_rules.get(key, ()))
+
+        weights = dict[int, permmap.RuleWeight]()
+        expanded = dict[int, tuple[set[policyrep.Type], set[policyrep.Type]]]()
+
+        def flows(rule_id: int) -> tuple[set[policyrep.Type], set[policyrep.Type]]:
+            try:
+                return expanded[rule_id]
+            except KeyError:
+                rule = rule_table.rule(rule_id)
+                ret = expanded[rule_id] = (set(rule.source.expand()), set(rule.target.expand()))
+                return ret
+
+        # the steps with a changed rule, and the changed rules of the step
+        dirty = collections.defaultdict[tuple[policyrep.Type, policyrep.Type], list[int]](list)
+        for rule in track(self.progress, "Updating information flow graph", rules, len(rules)):
+            old = old_map.rule_weight(rule_table.rule(rule))
+            new = weights[rule] = self.perm_map.rule_weight(rule_table.rule(rule))
+            if old == new:
+                continue
+
+            sources, targets = flows(rule)
+            for s, t in itertools.product(sources, targets):
+                if s != t:
+                    if old.write or new.write:
+                        dirty[s, t].append(rule)
+
+                    if old.read or new.read:
+                        dirty[t, s].append(rule)
+
+        if dirty:
+            if self._graph_shared:
+                self.G = self.G.copy()
+                self._graph_shared = False
+
+            for (s, t), changed_rules in dirty.items():
+                data = self.G.get_edge_data(s, t)
+                candidates = dict.fromkeys(rule_table.unpack(data["rules"]) if data else ())
+                candidates.update(dict.fromkeys(changed_rules))
+
+                # redo the step's flows, as in _build_graph
+                step_rules = []
+                capacity = 0
+                for rule in candidates:
+                    if rule not in weights:
+                        weights[rule] = self.perm_map.rule_weight(rule_table.rule(rule))
+
+                    weight = weights[rule]
+                    sources, targets = flows(rule)
+                    if weight.write and s in sources and t in targets:
+                        step_rules.append(rule)
+                        capacity = max(capacity, weight.write)
+
+                    if weight.read and t in sources and s in targets:
+                        step_rules.append(rule)
+                        capacity = max(capacity, weight.read)
+
+                if step_rules:
+                    self.G.add_edge(s, t, weight=1, rules=rule_table.ids(step_rules),
+                                    capacity=capacity)
+                elif data is not None:
+                    self.G.remove_edge(s, t)
+
+            rule_table.release()
+
+            # types without flows are not in a built graph
+            self.G.remove_nodes_from([n for n in {n for step in dirty for n in step}
+                                      if not self.G.pred[n] and not self.G.succ[n]])
+
+        if not self._graph_shared:
+            self.G.graph["perm_map"] = copy.deepcopy(self.perm_map)
+
+        self.rebuildgraph = False
+        self.rebuildsubgraph = True
+        self.log.info("Completed updating information flow graph.")
+        self.log.debug(f"Graph update stats: rules: {len(rules)}, steps: {len(dirty)}.")
+
     def _build_subgraph(self) -> None:
         if self.rebuildgraph:
             self._build_graph()
@@ -385,7 +787,8 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
         # does not exclude any edges.
         if self.min_weight > 1:
             delete_list = []
-            for s, t in self.subG.edges():
+            for s, t in track(self.progress, "Removing low weight information flows",
+                              self.subG.edges(), self.subG.number_of_edges()):
                 edge = InfoFlowStep(self.subG, s, t)
                 if edge.weight < self.min_weight:
                     delete_list.append(edge)
@@ -393,34 +796,72 @@ class InfoFlowAnalysis(query.DirectedGraphAnalysis):
             self.subG.remove_edges_from(delete_list)
 
         if self.booleans is not None:
+            rule_table: RuleTable[policyrep.AVRule] = self.subG.graph["rule_table"]
             delete_list = []
-            for s, t in self.subG.edges():
+            for s, t in track(self.progress, "Removing disabled information flows",
+                              self.subG.edges(), self.subG.number_of_edges()):
                 edge = InfoFlowStep(self.subG, s, t)
+                all_rule_ids = rule_table.unpack(self.subG.edges[s, t]["rules"])
 
-                # collect disabled rules
-                rule_list = []
-                # pylint: disable=not-an-iterable
-                for rule in edge.rules:
-                    if not rule.enabled(**self.booleans):
-                        rule_list.append(rule)
-
-                deleted_rules: list[policyrep.AVRule] = []
-                for rule in rule_list:
-                    if rule not in deleted_rules:
-                        edge.rules.remove(rule)
-                        deleted_rules.append(rule)
+                # remove disabled rules
+                rule_ids = [rule_id for rule_id in all_rule_ids
+                            if rule_table.rule(rule_id).enabled(**self.booleans)]
 
-                if not edge.rules:
+                if not rule_ids:
                     delete_list.append(edge)
+                elif len(rule_ids) < len(all_rule_ids):
+                    self.subG.edges[s, t]["rules"] = rule_table.ids(rule_ids)
 
+            rule_table.release()
             self.subG.remove_edges_from(delete_list)
 
+        self._reachability = None
         self.rebuildsubgraph = False
         self.log.info("Completed building information flow subgraph.")
         self.log.debug(f"Subgraph stats: nodes: {nx.number_of_nodes(self.subG)}, "
                        f"edges: {nx.number_of_edges(self.subG)}.")
 
 
+@dataclass
+class InfoFlowCut:
+
+    """
+    Minimum cuts of the information flows from source types to target types.
+
+    flow    The maximum information flow, which is the total permission
+            weight of the cut steps.
+    steps   The information flow steps of the minimum cut, which are
+            the steps of the least total weight which block the flow.
+    types   The fewest types, other than the source and target types,
+            which block the flow, or None if a source type has a
+            direct flow to a target type.
+    """
+
+    flow: int
+    steps: list["InfoFlowStep"]
+    types: list[policyrep.Type] | None
+
+
+@dataclass
+class InfoFlowExposure:
+
+    """
+    Information flow exposure of a type.
+
+    type        The type.
+    flows_out   The number of types this type has information flows to.
+    flows_in    The number of types this type has information flows from.
+    weight_out  The total weight of the flows to other types.
+    weight_in   The total weight of the flows from other types.
+    """
+
+    type: policyrep.Type
+    flows_out: int
+    flows_in: int
+    weight_out: int
+    weight_in: int
+
+
 @dataclass
 class InfoFlowStep(mixins.NetworkXGraphEdge):
 
@@ -441,7 +882,7 @@ class InfoFlowStep(mixins.NetworkXGraphEdge):
     source: policyrep.Type
     target: policyrep.Type
     create: InitVar[bool] = False
-    rules = EdgeAttrList()
+    rules = EdgeAttrRules()
 
     # use capacity to store the info flow weight so
     # we can use network flow algorithms naturally.
@@ -20,7 +20,7 @@ from .. import (BoolQuery, BoundsQuery, BoundsRuletype, CategoryQuery, CommonQue
                 GenfsconQuery, IbendportconQuery, IbpkeyconQuery, IbpkeyconRange,
                 InfoFlowAnalysis, InitialSIDQuery, IomemconQuery, IomemconRange,
                 IoportconQuery, IoportconRange, MLSRuleQuery, MLSRuletype, NetifconQuery,
-                NodeconIPVersion, NodeconQuery, ObjClassQuery, PcideviceconQuery,
+                NodeconIPVersion, NodeconQuery, ObjClassQuery, PathBudget, PcideviceconQuery,
                 PermissionMap, PolCapQuery, PolicyDifference, PolicyQuery, PortconProtocol,
                 PortconQuery, PortconRange, PirqconQuery, RBACRuleQuery, RBACRuletype, RoleQuery,
                 RoleTypesQuery, SELinuxPolicy, SensitivityQuery, TERuleQuery, TERuletype,
@@ -901,18 +901,20 @@ class SEToolsMCPServer:
             "Analysis mode.  One of:\n"
             "  ShortestPaths  — all shortest transition paths from source to target\n"
             "  AllPaths       — all paths up to depth_limit from source to target\n"
+            "  AllPathsSubgraph — the transitions on any path up to depth_limit from\n"
+            "                   source to target, without listing the paths\n"
             "  TransitionsOut — all transitions that originate from the source domain\n"
             "  TransitionsIn  — all transitions that arrive at the target domain",
         ] = "ShortestPaths",
         source: Annotated[
             str | None,
             "Source domain type.  Required for ShortestPaths, AllPaths, "
-            "and TransitionsOut.",
+            "AllPathsSubgraph, and TransitionsOut.",
         ] = None,
         target: Annotated[
             str | None,
             "Target domain type.  Required for ShortestPaths, AllPaths, "
-            "and TransitionsIn.",
+            "AllPathsSubgraph, and TransitionsIn.",
         ] = None,
         reverse: Annotated[
             bool,
@@ -931,6 +933,11 @@ class SEToolsMCPServer:
             int,
             "Maximum number of transitions or paths to return.",
         ] = 50,
+        max_seconds: Annotated[
+            float | None,
+            "Time limit of the AllPaths search, in seconds.  The paths found before "
+            "the limit are returned.  Set to None for unlimited.",
+        ] = 30,
         policy_path: Annotated[str | None, "Path to the policy file."] = None,
     ) -> str:
         """
@@ -941,8 +948,9 @@ class SEToolsMCPServer:
         intermediaries), and the SELinux rules that enable each transition.
 
         For transitive modes (ShortestPaths / AllPaths) each result is a
-        'path' — an ordered list of transition steps.  For direct modes
-        (TransitionsOut / TransitionsIn) each result is a single transition step.
+        'path' — an ordered list of transition steps.  For the other modes
+        (AllPathsSubgraph / TransitionsOut / TransitionsIn) each result is a
+        single transition step.
 
         Each transition step contains the source and target domain, the
         allow/type_transition rules that permit the transition, the entrypoint
@@ -958,6 +966,8 @@ class SEToolsMCPServer:
                                             reverse=reverse,
                                             depth_limit=depth_limit,
                                             exclude=exclude)
+        if max_seconds is not None:
+            analysis.path_budget = PathBudget(max_seconds=max_seconds)
 
         results: list[Any] = []
         truncated = False
@@ -983,17 +993,25 @@ class SEToolsMCPServer:
             str,
             "Analysis mode.  One of:\n"
             "  ShortestPaths — all shortest information flow paths from source to target\n"
+            "  WidestPaths   — the paths from source to target with the highest minimum\n"
+            "                  flow weight\n"
+            "  StrongestPaths — the max_results strongest paths from source to target,\n"
+            "                  strongest first\n"
             "  AllPaths      — all paths up to depth_limit from source to target\n"
+            "  AllPathsSubgraph — the flow steps on any path up to depth_limit from\n"
+            "                  source to target, without listing the paths\n"
+            "  MinimumCut    — the flow steps of the least total weight which block\n"
+            "                  all flows from source to target\n"
             "  FlowsOut      — all information flows originating from source\n"
             "  FlowsIn       — all information flows arriving at target",
         ] = "ShortestPaths",
         source: Annotated[
             str | None,
-            "Source type.  Required for ShortestPaths, AllPaths, and FlowsOut.",
+            "Source type.  Required for all modes except FlowsIn.",
         ] = None,
         target: Annotated[
             str | None,
-            "Target type.  Required for ShortestPaths, AllPaths, and FlowsIn.",
+            "Target type.  Required for all modes except FlowsOut.",
         ] = None,
         min_weight: Annotated[
             int,
@@ -1016,6 +1034,11 @@ class SEToolsMCPServer:
         max_results: Annotated[
             int, "Maximum number of flows or paths to return."
         ] = 50,
+        max_seconds: Annotated[
+            float | None,
+            "Time limit of the AllPaths search, in seconds.  The paths found before "
+            "the limit are returned.  Set to None for unlimited.",
+        ] = 30,
         policy_path: Annotated[str | None, "Path to the policy file."] = None,
     ) -> str:
         """
@@ -1025,8 +1048,9 @@ class SEToolsMCPServer:
         can move between types through the allow rules weighted by the permission
         map.
 
-        For transitive modes (ShortestPaths / AllPaths) each result is a
-        'path' — an ordered list of flow steps.  For direct modes (FlowsOut /
+        For transitive modes (ShortestPaths / WidestPaths / StrongestPaths /
+        AllPaths) each result is a 'path' — an ordered list of flow steps.
+        For the other modes (AllPathsSubgraph / MinimumCut / FlowsOut /
         FlowsIn) each result is a single flow step.
 
         Each step includes the source and target types, the combined flow weight,
@@ -1042,7 +1066,10 @@ class SEToolsMCPServer:
                                     mode=InfoFlowAnalysis.Mode.lookup(mode),
                                     min_weight=min_weight,
                                     depth_limit=depth_limit,
+                                    path_limit=max_results + 1,
                                     exclude=exclude)
+        if max_seconds is not None:
+            analysis.path_budget = PathBudget(max_seconds=max_seconds)
 
         results: list[Any] = []
         truncated = False
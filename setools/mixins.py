@@ -168,8 +168,10 @@ class MatchObjClass:
 
     """Mixin for matching an object's class."""
 
-    tclass = CriteriaSetDescriptor[policyrep.ObjClass]("tclass_regex", "lookup_class")
+    tclass = CriteriaSetDescriptor[policyrep.ObjClass]("tclass_regex", "lookup_class",
+                                                       regex_symbols=("classes",))
     tclass_regex: bool = False
+    _tclass_regex_matches: frozenset[str] | None = None
 
     def _build_object_class_repr_args(self) -> list[str]:
         return [f"tclass={self.tclass!r}", f"tclass_regex={self.tclass_regex!r}"]
@@ -191,6 +193,9 @@ class MatchObjClass:
             return True
         elif self.tclass_regex:
             assert isinstance(self.tclass, re.Pattern)
+            if self._tclass_regex_matches is not None:
+                return str(obj.tclass) in self._tclass_regex_matches
+
             return bool(self.tclass.search(str(obj.tclass)))
         else:
             return obj.tclass in self.tclass
@@ -7,6 +7,7 @@ import typing
 
 from . import mixins, policyrep, query, util
 from .descriptors import CriteriaDescriptor, CriteriaSetDescriptor
+from .progress import track
 
 __all__: typing.Final[tuple[str, ...]] = ("MLSRuleQuery",)
 
@@ -33,13 +34,18 @@ class MLSRuleQuery(mixins.MatchObjClass, query.PolicyQuery):
     """
 
     ruletype = CriteriaSetDescriptor[policyrep.MLSRuletype](enum_class=policyrep.MLSRuletype)
-    source = CriteriaDescriptor[policyrep.TypeOrAttr]("source_regex", "lookup_type_or_attr")
+    source = CriteriaDescriptor[policyrep.TypeOrAttr]("source_regex", "lookup_type_or_attr",
+                                                      regex_symbols=("types", "typeattributes"))
     source_regex: bool = False
     source_indirect: bool = True
-    target = CriteriaDescriptor[policyrep.TypeOrAttr]("target_regex", "lookup_type_or_attr")
+    _source_regex_matches: frozenset[str] | None = None
+    target = CriteriaDescriptor[policyrep.TypeOrAttr]("target_regex", "lookup_type_or_attr",
+                                                      regex_symbols=("types", "typeattributes"))
     target_regex: bool = False
     target_indirect: bool = True
-    tclass = CriteriaSetDescriptor[policyrep.ObjClass]("tclass_regex", "lookup_class")
+    _target_regex_matches: frozenset[str] | None = None
+    tclass = CriteriaSetDescriptor[policyrep.ObjClass]("tclass_regex", "lookup_class",
+                                                       regex_symbols=("classes",))
     tclass_regex: bool = False
     default = CriteriaDescriptor[policyrep.Range](lookup_function="lookup_range")
     default_overlap: bool = False
@@ -68,51 +74,58 @@ class MLSRuleQuery(mixins.MatchObjClass, query.PolicyQuery):
         self.log.debug(f"{self.default=}, {self.default_overlap=}, {self.default_subset=}, "
                        f"{self.default_superset=}, {self.default_proper=}")
 
-        for rule in self.policy.mlsrules():
-            #
-            # Matching on rule type
-            #
-            if self.ruletype:
-                if rule.ruletype not in self.ruletype:
-                    continue
-
-            #
-            # Matching on source type
-            #
-            if self.source and not util.match_indirect_regex(
-                    rule.source,
-                    self.source,
-                    self.source_indirect,
-                    self.source_regex):
-                continue
-
-            #
-            # Matching on target type
-            #
-            if self.target and not util.match_indirect_regex(
-                    rule.target,
-                    self.target,
-                    self.target_indirect,
-                    self.target_regex):
-                continue
-
-            #
-            # Matching on object class
-            #
-            if not self._match_object_class(rule):
-                continue
-
-            #
-            # Matching on range
-            #
-            if self.default and not util.match_range(
-                    rule.default,
-                    self.default,
-                    self.default_subset,
-                    self.default_overlap,
-                    self.default_superset,
-                    self.default_proper):
-                continue
-
-            # if we get here, we have matched all available criteria
-            yield rule
+        for rule in track(self.progress, "Matching MLS rules", self.policy.mlsrules()):
+            if self._match_rule(rule):
+                yield rule
+
+    def _match_rule(self, rule: policyrep.MLSRule) -> bool:
+        """Return true if the MLS rule matches the criteria."""
+        #
+        # Matching on rule type
+        #
+        if self.ruletype:
+            if rule.ruletype not in self.ruletype:
+                return False
+
+        #
+        # Matching on source type
+        #
+        if self.source and not util.match_indirect_regex(
+                rule.source,
+                self.source,
+                self.source_indirect,
+                self.source_regex,
+                self._source_regex_matches):
+            return False
+
+        #
+        # Matching on target type
+        #
+        if self.target and not util.match_indirect_regex(
+                rule.target,
+                self.target,
+                self.target_indirect,
+                self.target_regex,
+                self._target_regex_matches):
+            return False
+
+        #
+        # Matching on object class
+        #
+        if not self._match_object_class(rule):
+            return False
+
+        #
+        # Matching on range
+        #
+        if self.default and not util.match_range(
+                rule.default,
+                self.default,
+                self.default_subset,
+                self.default_overlap,
+                self.default_superset,
+                self.default_proper):
+            return False
+
+        # if we get here, we have matched all available criteria
+        return True
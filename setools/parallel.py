@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+"""
+Parallel, sharded scanning of policy rules.
+
+The rules are split into shards which are scanned by forked worker
+processes.  The workers return the compact positions of the matching
+rules, which are resolved back to rule objects in the parent process.
+"""
+from collections.abc import Iterable
+import itertools
+import multiprocessing
+import os
+import typing
+
+from . import policyrep
+
+__all__: typing.Final[tuple[str, ...]] = ("ParallelScan",)
+
+Shard = tuple[int, ...]
+Position = typing.Hashable
+
+# The query being run by a worker process.  This is inherited
+# from the parent process when the worker is forked.
+_worker_query: "ParallelScan | None" = None
+
+
+class ParallelScan:
+
+    """
+    Mixin for rule queries which can split the policy scan across
+    worker processes.
+
+    Subclasses must set _shard_rules to the name of the SELinuxPolicy rule
+    iterator that is scanned (terules, rbacrules, or constraints) and
+    implement _match_rules() as a generator which yields the rules of the
+    input that match the query criteria.
+    """
+
+    _shard_rules: typing.ClassVar[str]
+    policy: policyrep.SELinuxPolicy
+
+    def _match_rules(self, rules: Iterable) -> Iterable:
+        """Generator which yields the input rules matching the criteria."""
+        raise NotImplementedError
+
+    def parallel_results(self, workers: int | None = None) -> list:
+        """
+        Run the query with the policy scan split across worker processes.
+
+        The rules are split into shards and each worker process, forked from
+        this one, scans its shards of the already-loaded policy.  Forking is
+        required; if it is not available, or there is only one worker, the
+        shards are scanned in this process.  Since this process is forked,
+        this should not be used from a multi-threaded process.
+
+        Keyword Parameters:
+        workers     The number of worker processes.  The default is the
+                    number of CPUs.
+
+        Return:     A list of the matching rules, identical to
+                    list(self.results()).
+        """
+        global _worker_query
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers < 1:
+            raise ValueError(f"Invalid number of workers: {workers}")
+
+        shards = self._shards(workers)
+
+        if workers == 1 or "fork" not in multiprocessing.get_all_start_methods():
+            positions = list(itertools.chain.from_iterable(
+                self._scan_shard(shard) for shard in shards))
+        else:
+            _worker_query = self
+            try:
+                ctx = multiprocessing.get_context("fork")
+                with ctx.Pool(workers) as pool:
+                    positions = list(itertools.chain.from_iterable(
+                        pool.map(_scan_worker_shard, shards, chunksize=1)))
+            finally:
+                _worker_query = None
+
+        return self._resolve_positions(positions)
+
+    def _shards(self, count: int) -> list[Shard]:
+        """Split the rules into shards."""
+        if self._shard_rules == "terules":
+            return self.policy.terule_shards(count)
+
+        total = sum(1 for _ in getattr(self.policy, self._shard_rules)())
+        return [(total * i // count, total * (i + 1) // count) for i in range(count)]
+
+    def _rule_shard(self, shard: Shard) -> Iterable[tuple[Position, typing.Any]]:
+        """Iterator over the (position, rule) pairs of a shard."""
+        if self._shard_rules == "terules":
+            return self.policy.terules_shard(shard)
+
+        return enumerate(itertools.islice(getattr(self.policy, self._shard_rules)(),
+                                          shard[0], shard[1]),
+                         start=shard[0])
+
+    def _scan_shard(self, shard: Shard) -> list[Position]:
+        """Return the positions of the matching rules in the shard."""
+        current: Position = None
+
+        def _rules() -> Iterable:
+            nonlocal current
+            for current, rule in self._rule_shard(shard):
+                yield rule
+
+        # _match_rules() yields each matching rule before
+        # pulling the next one, so current is the position
+        # of the matching rule.
+        return [current for _ in self._match_rules(_rules())]
+
+    def _resolve_positions(self, positions: list[Position]) -> list:
+        """Resolve rule positions back to rule objects."""
+        if self._shard_rules == "terules":
+            return self.policy.terules_from_positions(
+                typing.cast(list[tuple[int, ...]], positions))
+
+        wanted = frozenset(positions)
+        return [r for i, r in enumerate(getattr(self.policy, self._shard_rules)())
+                if i in wanted]
+
+
+def _scan_worker_shard(shard: Shard) -> list[Position]:
+    """Scan a shard in a worker process."""
+    assert _worker_query is not None, "No query in worker process, this is an SETools bug."
+    return _worker_query._scan_shard(shard)
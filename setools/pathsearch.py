@@ -0,0 +1,318 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+"""
+Bounded path searches of analysis graphs.
+
+All paths enumeration is exponential in the worst case, so the search
+is pruned by the distance of each node to the target, and it can be
+limited by a PathBudget, which is checked during the search rather
+than after the results are collected.
+"""
+from collections.abc import Hashable, Iterator
+import heapq
+import itertools
+import logging
+import sys
+import time
+import typing
+
+try:
+    import networkx as nx
+
+except ImportError as iex:
+    logging.getLogger(__name__).debug(f"{iex.name} failed to import.")
+
+__all__: typing.Final[tuple[str, ...]] = ("PathBudget", "bounded_simple_paths", "paths_subgraph",
+                                          "max_bottleneck", "widest_paths")
+
+# number of search steps between checks of the time budget
+CHECK_INTERVAL: typing.Final[int] = 256
+
+
+class PathBudget:
+
+    """
+    Limits of a path search.  When a limit is reached, the search stops
+    and the paths found so far are the results.
+
+    Keyword Parameters:
+    max_paths       The maximum number of paths.
+    max_seconds     The maximum duration of the search, in seconds.
+    max_memory      The maximum approximate size of the paths found,
+                    in bytes.  This is the size of the path lists, not
+                    the policy objects referenced by the paths.
+
+    Each limit is unlimited if None.  After a search, exhausted is the
+    description of the limit which stopped the search, or None if the
+    search completed.
+    """
+
+    def __init__(self, *, max_paths: int | None = None, max_seconds: float | None = None,
+                 max_memory: int | None = None) -> None:
+
+        if any(v is not None and v <= 0 for v in (max_paths, max_seconds, max_memory)):
+            raise ValueError("Path search limits must be positive.")
+
+        self.max_paths = max_paths
+        self.max_seconds = max_seconds
+        self.max_memory = max_memory
+        self.exhausted: str | None = None
+        self._deadline: float | None = None
+        self._paths = 0
+        self._memory = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}(max_paths={self.max_paths!r}, " \
+               f"max_seconds={self.max_seconds!r}, max_memory={self.max_memory!r}, " \
+               f"exhausted={self.exhausted!r})>"
+
+    def start(self) -> None:
+        """Start a new search."""
+        self.exhausted = None
+        self._paths = 0
+        self._memory = 0
+        self._deadline = None if self.max_seconds is None \
+            else time.monotonic() + self.max_seconds
+
+    def admit(self, path: list) -> bool:
+        """Determine if a found path is within the limits, and count it if so."""
+        if self.expired():
+            return False
+
+        if self.max_paths is not None and self._paths >= self.max_paths:
+            return self._stop(f"{self.max_paths} path limit reached")
+
+        size = sys.getsizeof(path)
+        if self.max_memory is not None and self._memory + size > self.max_memory:
+            return self._stop(f"{self.max_memory} byte memory limit reached")
+
+        self._paths += 1
+        self._memory += size
+        return True
+
+    def expired(self) -> bool:
+        """Determine if the time limit is reached."""
+        if self.exhausted:
+            return True
+
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            self._stop(f"{self.max_seconds} second time limit reached")
+            return True
+
+        return False
+
+    def _stop(self, reason: str) -> bool:
+        self.exhausted = reason
+        logging.getLogger(__name__).warning(f"Path search stopped early: {reason}.")
+        return False
+
+
+def _distances(graph: "nx.DiGraph", start: Hashable, cutoff: int, reverse: bool,
+               stop: Hashable) -> dict[Hashable, int]:
+    """
+    Get the breadth-first distances from the start node, up to the cutoff.
+    If reverse, the distances are of the paths into the start node.  The
+    paths do not continue through the stop node.
+    """
+    neighbors = graph.predecessors if reverse else graph.successors
+    dist = {start: 0}
+    level = [start]
+    for depth in range(1, cutoff + 1):
+        next_level = []
+        for node in level:
+            if node == stop:
+                continue
+
+            for nbr in neighbors(node):
+                if nbr not in dist:
+                    dist[nbr] = depth
+                    next_level.append(nbr)
+
+        if not next_level:
+            break
+
+        level = next_level
+
+    return dist
+
+
+def _check_nodes(graph: "nx.DiGraph", source: Hashable, target: Hashable) -> None:
+    if source not in graph:
+        raise nx.NodeNotFound(f"source node {source} not in graph")
+
+    if target not in graph:
+        raise nx.NodeNotFound(f"target node {target} not in graph")
+
+
+def bounded_simple_paths(graph: "nx.DiGraph", source: Hashable, target: Hashable,
+                         cutoff: int | None = None,
+                         budget: PathBudget | None = None) -> Iterator[list]:
+    """
+    Generator which yields the simple paths from the source node to the
+    target node, like networkx.all_simple_paths().  Branches of the
+    search which cannot reach the target within the cutoff are pruned.
+
+    Parameters:
+    graph       The directed graph.
+    source      The source node.
+    target      The target node.
+    cutoff      The maximum number of edges in a path, or None
+                for no maximum.
+    budget      The limits of the search, if any.
+
+    Exceptions:
+    NodeNotFound    The source or target node is not in the graph.
+    """
+    _check_nodes(graph, source, target)
+    if budget is not None:
+        budget.start()
+
+    if source == target:
+        return
+
+    limit = len(graph) - 1 if cutoff is None else cutoff
+    dist = _distances(graph, target, limit, reverse=True, stop=source)
+    if source not in dist:
+        return
+
+    path = [source]
+    on_path = {source}
+    stack = [iter(graph.successors(source))]
+    steps = 0
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            on_path.discard(path.pop())
+            continue
+
+        # len(path) is the number of edges including this child.
+        if child in on_path or dist.get(child, limit) > limit - len(path):
+            continue
+
+        if child == target:
+            found = path + [target]
+            if budget is not None and not budget.admit(found):
+                return
+
+            yield found
+            continue
+
+        steps += 1
+        if budget is not None and steps % CHECK_INTERVAL == 0 and budget.expired():
+            return
+
+        path.append(child)
+        on_path.add(child)
+        stack.append(iter(graph.successors(child)))
+
+
+def paths_subgraph(graph: "nx.DiGraph", source: Hashable, target: Hashable,
+                   cutoff: int | None = None) -> "nx.DiGraph":
+    """
+    Get the union of the paths from the source node to the target node,
+    without enumerating the paths.  An edge is included if the sum of
+    the distance from the source to the edge and the distance from the
+    edge to the target is within the cutoff.  Since the distances are
+    not restricted to simple paths, an edge may be included which is
+    only on paths within the cutoff that revisit a node.
+
+    Parameters:
+    graph       The directed graph.
+    source      The source node.
+    target      The target node.
+    cutoff      The maximum number of edges in a path, or None
+                for no maximum.
+
+    Return:     A directed graph of the edges, without the edge
+                attributes.
+
+    Exceptions:
+    NodeNotFound    The source or target node is not in the graph.
+    """
+    _check_nodes(graph, source, target)
+    out = nx.DiGraph()
+    if source == target:
+        return out
+
+    limit = len(graph) - 1 if cutoff is None else cutoff
+    from_source = _distances(graph, source, limit, reverse=False, stop=target)
+    to_target = _distances(graph, target, limit, reverse=True, stop=source)
+    for node, depth in from_source.items():
+        if node == target:
+            continue
+
+        out.add_edges_from((node, nbr) for nbr in graph.successors(node)
+                           if nbr != source and depth + 1 + to_target.get(nbr, limit) <= limit)
+
+    return out
+
+
+def max_bottleneck(graph: "nx.DiGraph", source: Hashable, target: Hashable,
+                   capacity: str = "capacity") -> int | None:
+    """
+    Get the maximum bottleneck capacity of the paths from the source node
+    to the target node, i.e. the largest minimum edge capacity of a path.
+    This is a variant of Dijkstra's algorithm, which visits the nodes in
+    order of decreasing bottleneck capacity from the source.
+
+    Parameters:
+    graph       The directed graph.
+    source      The source node.
+    target      The target node.
+    capacity    The edge attribute of the capacity.  The capacities
+                must be positive.
+
+    Return:     The capacity, or None if the target is unreachable.
+
+    Exceptions:
+    NodeNotFound    The source or target node is not in the graph.
+    """
+    _check_nodes(graph, source, target)
+    if source == target:
+        return None
+
+    best: dict[Hashable, float] = {source: float("inf")}
+    # the counter breaks ties, so nodes are not compared
+    counter = itertools.count()
+    heap = [(-best[source], next(counter), source)]
+    while heap:
+        width, _, node = heapq.heappop(heap)
+        width = -width
+        if node == target:
+            return int(width)
+
+        if width < best[node]:
+            continue  # stale entry
+
+        for nbr, data in graph.succ[node].items():
+            nbr_width = min(width, data[capacity])
+            if nbr_width > best.get(nbr, 0):
+                best[nbr] = nbr_width
+                heapq.heappush(heap, (-nbr_width, next(counter), nbr))
+
+    return None
+
+
+def widest_paths(graph: "nx.DiGraph", source: Hashable, target: Hashable,
+                 capacity: str = "capacity") -> Iterator[list]:
+    """
+    Generator which yields the widest paths from the source node to the
+    target node.  These are the paths with the maximum bottleneck
+    capacity.  Of these, only the paths with the fewest edges are
+    yielded.
+
+    Parameters:
+    graph       The directed graph.
+    source      The source node.
+    target      The target node.
+    capacity    The edge attribute of the capacity.
+
+    Exceptions:
+    NodeNotFound    The source or target node is not in the graph.
+    """
+    width = max_bottleneck(graph, source, target, capacity)
+    if width is None:
+        return
+
+    wide = nx.subgraph_view(graph, filter_edge=lambda u, v: graph.succ[u][v][capacity] >= width)
+    yield from nx.all_shortest_paths(wide, source, target)
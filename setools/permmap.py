@@ -306,6 +306,25 @@ class PermissionMap:
         """Retrieve a specific permission's mapping."""
         return Mapping(self._permmap, class_, perm)
 
+    def differences(self, other: "PermissionMap") -> set[tuple[str, str]]:
+        """
+        Get the permissions which are mapped differently in another permission map.
+
+        Parameter:
+        other       The other permission map.
+
+        Return:     The set of (class, permission) of the mappings which
+                    differ, including mappings which are only in one map.
+        """
+        changed = set[tuple[str, str]]()
+        for class_ in self._permmap.keys() | other._permmap.keys():
+            perms = self._permmap.get(class_, {})
+            other_perms = other._permmap.get(class_, {})
+            changed.update((class_, p) for p in perms.keys() | other_perms.keys()
+                           if perms.get(p) != other_perms.get(p))
+
+        return changed
+
     def exclude_class(self, class_: str) -> None:
         """
         Exclude all permissions in an object class for calculating rule weights.
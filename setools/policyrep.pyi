@@ -7,6 +7,7 @@ from typing import Any, NoReturn, TypeAlias
 
 import enum
 import ipaddress
+import mmap
 
 AnyConstraint: TypeAlias = "Constraint" | "Validatetrans"
 AnyDefault: TypeAlias = "Default" | "DefaultRange"
@@ -14,6 +15,7 @@ AnyRBACRule: TypeAlias = "RoleAllow" | "RoleTransition"
 AnyTERule: TypeAlias = "AVRule" | "AVRuleXperm" | "TERule" | "FileNameTERule"
 TypeOrAttr: TypeAlias = "Type" | "TypeAttribute"
 
+def load_policies(policyfiles: Iterable[str], workers: int | None = None) -> list["SELinuxPolicy"]: ...
 def lookup_boolean_name_sub(name: str) -> str: ...
 
 #
@@ -86,6 +88,7 @@ class BaseType(PolicySymbol):
     def aliases(self) -> Iterable[str]: ...
     def attributes(self) -> Iterable["BaseType"]: ...
     def expand(self) -> Iterable["BaseType"]: ...
+    def rules(self, ruletype: Iterable["TERuletype" | str] | None = None) -> Iterable[AnyTERule]: ...
 
 class Ocontext(PolicyObject):
     context: "Context" = ...
@@ -416,7 +419,7 @@ class SELinuxPolicy:
     user_count: int = ...
     validatetrans_count: int = ...
     version: int = ...
-    def __init__(self, policyfile: str | None = None) -> None: ...
+    def __init__(self, policyfile: str | None = None, *, buffer: bytes | bytearray | memoryview | mmap.mmap | None = None, use_mmap: bool = False) -> None: ...
     def bools(self) -> Iterable["Boolean"]: ...
     def bounds(self) -> Iterable["Bounds"]: ...
     def categories(self) -> Iterable["Category"]: ...
@@ -457,7 +460,12 @@ class SELinuxPolicy:
     def rbacrules(self) -> Iterable[AnyRBACRule]: ...
     def roles(self) -> Iterable["Role"]: ...
     def sensitivities(self) -> Iterable["Sensitivity"]: ...
+    def terule_shards(self, count: int) -> list[tuple[int, ...]]: ...
     def terules(self) -> Iterable[AnyTERule]: ...
+    def terules_by_class(self, tclass: ObjClass | str, ruletypes: Iterable[TERuletype] | None = None,
+                         perms: Iterable[str] | None = None) -> Iterable[AnyTERule]: ...
+    def terules_from_positions(self, positions: Iterable[tuple[int, ...]]) -> list[AnyTERule]: ...
+    def terules_shard(self, shard: tuple[int, ...]) -> Iterable[tuple[tuple[int, ...], AnyTERule]]: ...
     def typeattributes(self) -> Iterable["TypeAttribute"]: ...
     def types(self) -> Iterable["Type"]: ...
     def users(self) -> Iterable["User"]: ...
@@ -496,12 +504,14 @@ class Type(BaseType):
     def aliases(self) -> Iterable[str]: ...
     def attributes(self) -> Iterable["TypeAttribute"]: ...
     def expand(self) -> Iterable["Type"]: ...
+    def rules(self, ruletype: Iterable["TERuletype" | str] | None = None) -> Iterable[AnyTERule]: ...
 
 class TypeAttribute(BaseType):
     ispermissive: bool = ...
     def aliases(self) -> Iterable[str]: ...
     def attributes(self) -> Iterable["TypeAttribute"]: ...
     def expand(self) -> Iterable["Type"]: ...
+    def rules(self, ruletype: Iterable["TERuletype" | str] | None = None) -> Iterable[AnyTERule]: ...
     def __iter__(self) -> Iterable["TypeAttribute"]: ...
     def __len__(self) -> int: ...
 
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: LGPL-2.1-only
 #
 
+from cpython.buffer cimport PyBUF_SIMPLE, PyObject_GetBuffer, PyBuffer_Release
 from cpython.exc cimport PyErr_SetFromErrnoWithFilename
 from cpython.mem cimport PyMem_Malloc, PyMem_Free
 from libc.errno cimport errno, EPERM, ENOENT, ENOMEM, EINVAL
@@ -14,10 +15,12 @@ from posix.stat cimport S_IFBLK, S_IFCHR, S_IFDIR, S_IFIFO, S_IFREG, S_IFLNK, S_
 
 import dataclasses
 import logging
+import mmap
 import warnings
 import itertools
 import ipaddress
 import collections
+import concurrent.futures
 import enum
 import weakref
 from typing import TypeVar, Union
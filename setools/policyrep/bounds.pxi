@@ -87,16 +87,17 @@ cdef class TypeboundsIterator(HashtabIterator):
             uint32_t bucket = 0
             size_t count = 0
 
-        while bucket < self.table[0].size:
-            node = self.table[0].htable[bucket]
-            while node != NULL:
-                datum = <sepol.type_datum_t *>node.datum if node else NULL
-                if datum != NULL and datum.flavor == sepol.TYPE_TYPE and datum.bounds != 0:
-                    count += 1
+        with nogil:
+            while bucket < self.table[0].size:
+                node = self.table[0].htable[bucket]
+                while node != NULL:
+                    datum = <sepol.type_datum_t *>node.datum if node else NULL
+                    if datum != NULL and datum.flavor == sepol.TYPE_TYPE and datum.bounds != 0:
+                        count += 1
 
-                node = node.next
+                    node = node.next
 
-            bucket += 1
+                bucket += 1
 
         return count
 
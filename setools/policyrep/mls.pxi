@@ -489,16 +489,17 @@ cdef class CategoryHashtabIterator(HashtabIterator):
         cdef uint32_t bucket = 0
         cdef size_t count = 0
 
-        while bucket < self.table[0].size:
-            node = self.table[0].htable[bucket]
-            while node != NULL:
-                datum = <sepol.cat_datum_t *>node.datum if node else NULL
-                if datum != NULL and not datum.isalias:
-                    count += 1
+        with nogil:
+            while bucket < self.table[0].size:
+                node = self.table[0].htable[bucket]
+                while node != NULL:
+                    datum = <sepol.cat_datum_t *>node.datum if node else NULL
+                    if datum != NULL and not datum.isalias:
+                        count += 1
 
-                node = node.next
+                    node = node.next
 
-            bucket += 1
+                bucket += 1
 
         return count
 
@@ -546,16 +547,17 @@ cdef class SensitivityHashtabIterator(HashtabIterator):
         cdef uint32_t bucket = 0
         cdef size_t count = 0
 
-        while bucket < self.table[0].size:
-            node = self.table[0].htable[bucket]
-            while node != NULL:
-                datum = <sepol.level_datum_t *>node.datum if node else NULL
-                if datum != NULL and not datum.isalias:
-                    count += 1
+        with nogil:
+            while bucket < self.table[0].size:
+                node = self.table[0].htable[bucket]
+                while node != NULL:
+                    datum = <sepol.level_datum_t *>node.datum if node else NULL
+                    if datum != NULL and not datum.isalias:
+                        count += 1
 
-                node = node.next
+                    node = node.next
 
-            bucket += 1
+                bucket += 1
 
         return count
 
@@ -603,16 +605,17 @@ cdef class LevelDeclHashtabIterator(HashtabIterator):
         cdef uint32_t bucket = 0
         cdef size_t count = 0
 
-        while bucket < self.table[0].size:
-            node = self.table[0].htable[bucket]
-            while node != NULL:
-                datum = <sepol.level_datum_t *>node.datum if node else NULL
-                if datum != NULL and not datum.isalias:
-                    count += 1
+        with nogil:
+            while bucket < self.table[0].size:
+                node = self.table[0].htable[bucket]
+                while node != NULL:
+                    datum = <sepol.level_datum_t *>node.datum if node else NULL
+                    if datum != NULL and not datum.isalias:
+                        count += 1
 
-                node = node.next
+                    node = node.next
 
-            bucket += 1
+                bucket += 1
 
         return count
 
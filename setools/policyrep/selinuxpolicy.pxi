@@ -23,6 +23,80 @@ class HandleUnknown(PolicyEnum):
     reject = sepol.SEPOL_REJECT_UNKNOWN
 
 
+cdef struct symbol_alias_t:
+    uint32_t value
+    const char *name
+    bint isalias
+
+
+cdef size_t symtab_collect_aliases(sepol.hashtab_t *table, int sym,
+                                   symbol_alias_t *entries) noexcept nogil:
+    """
+    Record the value, name, and alias state of each symbol in the
+    types, sensitivities, or categories symbol table.  The entries
+    array must have room for every node in the table.
+
+    Return: The number of entries recorded.
+    """
+    cdef:
+        sepol.hashtab_node_t *node
+        sepol.type_datum_t *type_datum
+        sepol.level_datum_t *level_datum
+        sepol.cat_datum_t *cat_datum
+        uint32_t bucket = 0
+        size_t count = 0
+
+    while bucket < table[0].size:
+        node = table[0].htable[bucket]
+        while node != NULL:
+            if node.datum != NULL:
+                if sym == sepol.SYM_TYPES:
+                    type_datum = <sepol.type_datum_t *>node.datum
+                    entries[count].value = type_datum.s.value
+                    entries[count].isalias = type_is_alias(type_datum)
+                elif sym == sepol.SYM_LEVELS:
+                    level_datum = <sepol.level_datum_t *>node.datum
+                    entries[count].value = level_datum.level.sens
+                    entries[count].isalias = level_datum.isalias
+                else:
+                    cat_datum = <sepol.cat_datum_t *>node.datum
+                    entries[count].value = cat_datum.s.value
+                    entries[count].isalias = cat_datum.isalias
+
+                entries[count].name = node.key
+                count += 1
+
+            node = node.next
+
+        bucket += 1
+
+    return count
+
+
+def load_policies(policyfiles, workers=None):
+    """
+    Load several policies concurrently.
+
+    The policies are loaded by a pool of threads.  Since libsepol
+    reads the policy without holding the GIL, the loads run in
+    parallel.  Each policy is independent, so the loaded policies
+    may also be used from different threads.
+
+    Parameters:
+    policyfiles The paths of the policies to load.
+    workers     The maximum number of threads.  The default is
+                one thread per policy.
+
+    Return:     A list of SELinuxPolicy, in the order of policyfiles.
+    """
+    policyfiles = list(policyfiles)
+    if not policyfiles:
+        return []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers or len(policyfiles)) as pool:
+        return list(pool.map(SELinuxPolicy, policyfiles))
+
+
 cdef class SELinuxPolicy:
     cdef:
         sepol.sepol_policydb *handle
@@ -33,6 +107,7 @@ cdef class SELinuxPolicy:
         object constraint_counts
         object terule_counts
         dict type_alias_map
+        dict type_rule_index
         dict category_alias_map
         dict sensitivity_alias_map
         object __weakref__
@@ -44,10 +119,18 @@ cdef class SELinuxPolicy:
         readonly unsigned int version
         readonly bint mls
 
-    def __cinit__(self, policyfile=None):
+    def __cinit__(self, policyfile=None, *, buffer=None, use_mmap=False):
         """
         Parameter:
-        policyfile  Path to a policy to open.
+        policyfile  Path to a policy to open.  If buffer is specified,
+                    this is only used as the name of the policy.
+
+        Keyword Parameters:
+        buffer      A bytes-like object, such as bytes, memoryview, or
+                    mmap, containing a binary policy to load instead
+                    of opening a file.  The buffer is not copied.
+        use_mmap    If true, the policy file is memory-mapped read-only
+                    rather than read with stdio.
         """
         self.sh = NULL
         self.handle = NULL
@@ -55,8 +138,10 @@ cdef class SELinuxPolicy:
         self.level_val_to_struct = NULL
         self.log = logging.getLogger(__name__)
 
-        if policyfile:
-            self._load_policy(policyfile)
+        if buffer is not None:
+            self._load_policy_buffer(buffer, policyfile or "<buffer>")
+        elif policyfile:
+            self._load_policy(policyfile, use_mmap)
         else:
             self._load_running_policy()
 
@@ -508,6 +593,210 @@ cdef class SELinuxPolicy:
             yield from c.true_rules()
             yield from c.false_rules()
 
+    def terules_by_class(self, tclass, ruletypes=None, perms=None):
+        """
+        Iterator over the type enforcement rules of an object class.
+
+        The rules are selected from the policy's rule tables by class
+        value, rule type, and permission bits, so rule objects are only
+        created for the matching rules.  The rules are in the same order
+        as terules().
+
+        Parameters:
+        tclass      The object class.
+        ruletypes   An iterable of TERuletypes to include.  The default
+                    is all rule types.
+        perms       An iterable of permission names.  If set, only AV
+                    rules with at least one of the permissions are
+                    included.  Permissions which are not in the class
+                    are ignored.
+
+        Exceptions:
+        InvalidClass    The object class is not in the policy.
+        """
+        cdef:
+            ObjClass cls = self.lookup_class(tclass)
+            AVTabFilter rule_filter
+            Common com
+            sepol.cond_node_t *cond_node
+            Conditional cond
+            dict perm_table
+
+        rule_filter.tclass = (<sepol.class_datum_t *>cls.key).s.value
+        rule_filter.specified = 0
+        rule_filter.perms = 0
+
+        if ruletypes is not None:
+            for ruletype in ruletypes:
+                rule_filter.specified |= TERuletype.lookup(ruletype).value
+
+            if not rule_filter.specified:
+                return
+
+        if perms is not None:
+            perm_table = cls._perm_table.copy()
+            try:
+                com = cls.common
+                perm_table.update(com._perm_table)
+            except NoCommon:
+                pass
+
+            perms = frozenset(perms)
+            for value, name in perm_table.items():
+                if name in perms:
+                    rule_filter.perms |= 1 << (value - 1)
+
+            if not rule_filter.perms:
+                return
+
+        yield from TERuleIterator.factory_filtered(self, &self.handle.p.te_avtab, rule_filter)
+
+        if perms is None and (ruletypes is None or
+                              rule_filter.specified & TERuletype.type_transition.value):
+            yield from FileNameTERuleIterator.factory_class(self, &self.handle.p.filename_trans,
+                                                            rule_filter.tclass)
+
+        for cond in self.conditionals():
+            cond_node = <sepol.cond_node_t *>cond.key
+            yield from ConditionalTERuleIterator.factory_filtered(self, cond_node.true_list, cond,
+                                                                  True, rule_filter)
+            yield from ConditionalTERuleIterator.factory_filtered(self, cond_node.false_list, cond,
+                                                                  False, rule_filter)
+
+    #
+    # Sharded TE rule scanning
+    #
+    def terule_shards(self, count):
+        """
+        Split the TE rules into shards for parallel scanning.
+
+        Parameter:
+        count       The number of shards to split the access vector
+                    table and the conditional list into.
+
+        Return:     A list of shard descriptors (tuples of ints) for
+                    terules_shard().  Concatenating the rules of each
+                    shard in list order yields the same rules in the
+                    same order as terules().
+        """
+        cdef:
+            uint32_t nslot = self.handle.p.te_avtab.nslot
+            size_t nconds = len(self.conditionals())
+            size_t i
+
+        if count < 1:
+            raise ValueError(f"Invalid shard count: {count}")
+
+        shards = [(0, nslot * i // count, nslot * (i + 1) // count) for i in range(count)]
+        shards.append((1,))
+        shards.extend((2, nconds * i // count, nconds * (i + 1) // count) for i in range(count))
+        return shards
+
+    def terules_shard(self, shard):
+        """
+        Iterator over the TE rules in a shard.
+
+        Parameter:
+        shard       A shard descriptor from terule_shards().
+
+        Yield:      tuple(position, rule)
+
+        position    A compact tuple of ints locating the rule in the
+                    policy.  See terules_from_positions().
+        rule        The TE rule.
+        """
+        if shard[0] == 0:
+            rules = TERuleIterator.factory_slots(self, &self.handle.p.te_avtab, shard[1], shard[2])
+            for rule in rules:
+                yield (0,) + rules.position, rule
+
+        elif shard[0] == 1:
+            for i, rule in enumerate(
+                    FileNameTERuleIterator.factory(self, &self.handle.p.filename_trans)):
+                yield (1, i), rule
+
+        elif shard[0] == 2:
+            for i, cond in enumerate(itertools.islice(self.conditionals(), shard[1], shard[2]),
+                                     start=shard[1]):
+                for depth, rule in enumerate(cond.true_rules()):
+                    yield (2, i, 1, depth), rule
+
+                for depth, rule in enumerate(cond.false_rules()):
+                    yield (2, i, 0, depth), rule
+
+        else:
+            raise ValueError(f"Invalid TE rule shard: {shard}")
+
+    def terules_from_positions(self, positions):
+        """
+        Resolve TE rule positions from terules_shard() back to the rules.
+
+        Positions are only meaningful for the policy they were generated
+        from, or another load of the same policy file.
+
+        Parameter:
+        positions   An iterable of rule positions.
+
+        Return:     A list of the TE rules, in the order of the positions.
+        """
+        cdef:
+            sepol.avtab_ptr_t node
+            sepol.cond_av_list_t *curr
+            sepol.cond_node_t *cond_node
+            Conditional cond
+            size_t i
+            list conds = None
+            list filename_rules = None
+            list rules = []
+
+        for pos in positions:
+            if pos[0] == 0:
+                if pos[1] >= self.handle.p.te_avtab.nslot:
+                    raise ValueError(f"Invalid TE rule position: {pos}")
+
+                node = self.handle.p.te_avtab.htable[pos[1]]
+                for i in range(pos[2]):
+                    if node == NULL:
+                        break
+
+                    node = node.next
+
+                if node == NULL:
+                    raise ValueError(f"Invalid TE rule position: {pos}")
+
+                rules.append(avtab_rule_factory(self, &node.key, &node.datum, None, None))
+
+            elif pos[0] == 1:
+                if filename_rules is None:
+                    filename_rules = list(
+                        FileNameTERuleIterator.factory(self, &self.handle.p.filename_trans))
+
+                rules.append(filename_rules[pos[1]])
+
+            elif pos[0] == 2:
+                if conds is None:
+                    conds = list(self.conditionals())
+
+                cond = conds[pos[1]]
+                cond_node = <sepol.cond_node_t *>cond.key
+                curr = cond_node.true_list if pos[2] else cond_node.false_list
+                for i in range(pos[3]):
+                    if curr == NULL:
+                        break
+
+                    curr = curr.next
+
+                if curr == NULL:
+                    raise ValueError(f"Invalid TE rule position: {pos}")
+
+                rules.append(avtab_rule_factory(self, &curr.node.key, &curr.node.datum, cond,
+                                                <bint>pos[2]))
+
+            else:
+                raise ValueError(f"Invalid TE rule position: {pos}")
+
+        return rules
+
     #
     # Constraints iterators
     #
@@ -645,10 +934,17 @@ cdef class SELinuxPolicy:
         """Return the name of the user by its value."""
         return intern(self.handle.p.sym_val_to_name[sepol.SYM_USERS][value])
 
+    cdef list type_rules(self, uintptr_t key):
+        """Return the TE rules that reference the type/attribute datum directly."""
+        if self.type_rule_index is None:
+            self._build_type_rule_index()
+
+        return self.type_rule_index.get(key, [])
+
     #
     # Internal methods
     #
-    cdef _load_policy(self, str filename):
+    cdef _load_policy(self, str filename, bint use_mmap=False):
         """Load the specified policy."""
         cdef:
             sepol.sepol_policy_file_t *pfile = NULL
@@ -656,6 +952,47 @@ cdef class SELinuxPolicy:
 
         self.log.info(f"Opening SELinux policy \"{filename}\"")
 
+        if use_mmap:
+            with open(filename, "rb") as policy_fd, \
+                    mmap.mmap(policy_fd.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                self._read_policy_buffer(buffer, filename)
+
+            return
+
+        infile = fopen(filename, "rb")
+        if infile == NULL:
+            PyErr_SetFromErrnoWithFilename(OSError, filename)
+
+        try:
+            pfile = self._create_policy_file()
+            sepol.sepol_policy_file_set_fp(pfile, infile)
+            self._read_policy(pfile, filename)
+        finally:
+            fclose(infile)
+
+    cdef _load_policy_buffer(self, buffer, str name):
+        """Load a policy from a buffer."""
+        self.log.info(f"Loading SELinux policy \"{name}\" from a buffer")
+        self._read_policy_buffer(buffer, name)
+
+    cdef _read_policy_buffer(self, buffer, str name):
+        """Read the policy from a buffer, without copying it."""
+        cdef:
+            sepol.sepol_policy_file_t *pfile = NULL
+            Py_buffer view
+
+        PyObject_GetBuffer(buffer, &view, PyBUF_SIMPLE)
+        try:
+            pfile = self._create_policy_file()
+            sepol.sepol_policy_file_set_mem(pfile, <char *>view.buf, <size_t>view.len)
+            self._read_policy(pfile, name)
+        finally:
+            PyBuffer_Release(&view)
+
+    cdef sepol.sepol_policy_file_t *_create_policy_file(self) except NULL:
+        """Create the libsepol handle, policydb, and a policy file to read into it."""
+        cdef sepol.sepol_policy_file_t *pfile = NULL
+
         self.sh = sepol.sepol_handle_create()
         if self.sh == NULL:
             raise MemoryError
@@ -668,21 +1005,29 @@ cdef class SELinuxPolicy:
         if sepol.sepol_policy_file_create(&pfile) < 0:
             raise MemoryError
 
-        infile = fopen(filename, "rb")
-        if infile == NULL:
-            PyErr_SetFromErrnoWithFilename(OSError, filename)
-
         sepol.sepol_policy_file_set_handle(pfile, self.sh)
-        sepol.sepol_policy_file_set_fp(pfile, infile)
+        return pfile
 
-        if sepol.sepol_policydb_read(self.handle, pfile) < 0:
-            raise InvalidPolicy(f"Invalid policy: {filename}. A binary policy must be specified. "
-                                f"(use e.g. policy.{sepol.sepol_policy_kern_vers_max()} or "
-                                "sepolicy) Source policies are not supported.")
+    cdef _read_policy(self, sepol.sepol_policy_file_t *pfile, str name):
+        """
+        Read the policy from the policy file and set up the policy.
+
+        This frees the policy file.
+        """
+        cdef int ret
+
+        # Reading the policy is the bulk of the load time and
+        # is entirely in libsepol, so let other threads run.
+        with nogil:
+            ret = sepol.sepol_policydb_read(self.handle, pfile)
 
-        fclose(infile)
         sepol.sepol_policy_file_free(pfile)
 
+        if ret < 0:
+            raise InvalidPolicy(f"Invalid policy: {name}. A binary policy must be specified. "
+                                f"(use e.g. policy.{sepol.sepol_policy_kern_vers_max()} or "
+                                "sepolicy) Source policies are not supported.")
+
         #
         # Load policy properties
         #
@@ -709,14 +1054,17 @@ cdef class SELinuxPolicy:
         #
         # Create value to alias mappings
         #
-        self._load_type_aliases()
+        self.log.debug("Loading type aliases.")
+        self.type_alias_map = self._load_aliases(sepol.SYM_TYPES)
 
         if self.mls:
-            self._load_sensitivity_aliases()
-            self._load_category_aliases()
+            self.log.debug("Loading sensitivity aliases.")
+            self.sensitivity_alias_map = self._load_aliases(sepol.SYM_LEVELS)
+            self.log.debug("Loading category aliases.")
+            self.category_alias_map = self._load_aliases(sepol.SYM_CATS)
 
-        self.log.info(f"Successfully opened SELinux policy \"{filename}\"")
-        self.path = filename
+        self.log.info(f"Successfully opened SELinux policy \"{name}\"")
+        self.path = name
 
     cdef _load_running_policy(self):
         """Try to load the current running policy."""
@@ -834,83 +1182,34 @@ cdef class SELinuxPolicy:
 
             bucket += 1
 
-    cdef _load_category_aliases(self):
-        """Build map of aliases to categories"""
-        cdef:
-            sepol.hashtab_t *table = &self.handle.p.symtab[sepol.SYM_CATS].table
-            sepol.cat_datum_t *datum
-            sepol.hashtab_node_t *node
-            uint32_t bucket = 0
-            list entry
-
-        self.category_alias_map = dict()
-
-        while bucket < table[0].size:
-            node = table[0].htable[bucket]
-            while node != NULL:
-                datum = <sepol.cat_datum_t *>node.datum if node else NULL
-                if datum == NULL:
-                    continue
-
-                entry = self.category_alias_map.setdefault(datum.s.value, list())
-                if datum.isalias:
-                    entry.append(intern(node.key))
-
-                node = node.next
-
-            bucket += 1
-
-    cdef _load_sensitivity_aliases(self):
-        """Build map of aliases to sensitivities"""
-        cdef:
-            sepol.hashtab_t *table = &self.handle.p.symtab[sepol.SYM_LEVELS].table
-            sepol.level_datum_t *datum
-            sepol.hashtab_node_t *node
-            uint32_t bucket = 0
-            list entry
-
-        self.sensitivity_alias_map = dict()
-
-        while bucket < table[0].size:
-            node = table[0].htable[bucket]
-            while node != NULL:
-                datum = <sepol.level_datum_t *>node.datum if node else NULL
-                if datum == NULL:
-                    continue
-
-                entry = self.sensitivity_alias_map.setdefault(datum.level.sens, list())
-                if datum.isalias:
-                    entry.append(intern(node.key))
-
-                node = node.next
-
-            bucket += 1
-
-    cdef _load_type_aliases(self):
-        """Build map of aliases to types"""
+    cdef dict _load_aliases(self, int sym):
+        """
+        Build map of symbol values to aliases for the types,
+        sensitivities, or categories symbol table.
+        """
         cdef:
-            sepol.hashtab_t *table = &self.handle.p.symtab[sepol.SYM_TYPES].table
-            sepol.type_datum_t *datum
-            sepol.hashtab_node_t *node
-            uint32_t bucket = 0
+            sepol.hashtab_t *table = &self.handle.p.symtab[sym].table
+            symbol_alias_t *entries
+            size_t count, i
+            dict alias_map = dict()
             list entry
 
-        self.type_alias_map = dict()
-
-        while bucket < table[0].size:
-            node = table[0].htable[bucket]
-            while node != NULL:
-                datum = <sepol.type_datum_t *>node.datum if node else NULL
-                if datum == NULL:
-                    continue
+        entries = <symbol_alias_t *>calloc(table[0].nel + 1, sizeof(symbol_alias_t))
+        if entries == NULL:
+            raise MemoryError
 
-                entry = self.type_alias_map.setdefault(datum.s.value, list())
-                if type_is_alias(datum):
-                    entry.append(intern(node.key))
+        with nogil:
+            count = symtab_collect_aliases(table, sym, entries)
 
-                node = node.next
+        try:
+            for i in range(count):
+                entry = alias_map.setdefault(entries[i].value, list())
+                if entries[i].isalias:
+                    entry.append(intern(entries[i].name))
+        finally:
+            free(entries)
 
-            bucket += 1
+        return alias_map
 
     cdef _rebuild_attrs_from_map(self):
         """
@@ -927,65 +1226,68 @@ cdef class SELinuxPolicy:
             size_t bit, i, count
             sepol.ebitmap_node_t *node = NULL
             sepol.type_datum_t *tmp_type
+            sepol.type_datum_t *orig_type
             char *tmp_name
 
         self.log.debug("Rebuilding attributes.")
 
-        for i in range(self.handle.p.symtab[sepol.SYM_TYPES].nprim):
-            tmp_type = self.handle.p.type_val_to_struct[i]
+        with nogil:
+            for i in range(self.handle.p.symtab[sepol.SYM_TYPES].nprim):
+                tmp_type = self.handle.p.type_val_to_struct[i]
 
-            # skip gaps
-            if tmp_type == NULL:
-                continue
+                # skip gaps
+                if tmp_type == NULL:
+                    continue
 
-            # skip types
-            if tmp_type.flavor != sepol.TYPE_ATTRIB:
-                continue
+                # skip types
+                if tmp_type.flavor != sepol.TYPE_ATTRIB:
+                    continue
 
-            # Synthesize a name if it is missing
-            if self.handle.p.sym_val_to_name[sepol.SYM_TYPES][i] == NULL:
-                # synthesize name
-                tmp_name = <char*>calloc(15, sizeof(char))
-                if tmp_name == NULL:
-                    raise MemoryError
+                # Synthesize a name if it is missing
+                if self.handle.p.sym_val_to_name[sepol.SYM_TYPES][i] == NULL:
+                    # synthesize name
+                    tmp_name = <char*>calloc(15, sizeof(char))
+                    if tmp_name == NULL:
+                        with gil:
+                            raise MemoryError
 
-                snprintf(tmp_name, 15, "@ttr%010zd", i + 1)
+                    snprintf(tmp_name, 15, "@ttr%010zd", i + 1)
 
-                self.handle.p.sym_val_to_name[sepol.SYM_TYPES][i] = tmp_name
+                    self.handle.p.sym_val_to_name[sepol.SYM_TYPES][i] = tmp_name
 
-                # do not free, memory is owned by policydb now.
-                tmp_name = NULL
+                    # do not free, memory is owned by policydb now.
+                    tmp_name = NULL
 
-            # determine if attribute is empty
-            bit = sepol.ebitmap_start(&self.handle.p.attr_type_map[i], &node)
-            while bit < sepol.ebitmap_length(&self.handle.p.attr_type_map[i]):
-                if sepol.ebitmap_node_get_bit(node, bit):
-                    break
+                # determine if attribute is empty
+                bit = sepol.ebitmap_start(&self.handle.p.attr_type_map[i], &node)
+                while bit < sepol.ebitmap_length(&self.handle.p.attr_type_map[i]):
+                    if sepol.ebitmap_node_get_bit(node, bit):
+                        break
 
-                bit = sepol.ebitmap_next(&node, bit)
+                    bit = sepol.ebitmap_next(&node, bit)
 
-            else:
-                # skip empty attributes
-                continue
+                else:
+                    # skip empty attributes
+                    continue
 
-            # relink the attr_type_map ebitmap to the type datum
-            tmp_type.types.node = self.handle.p.attr_type_map[i].node
-            tmp_type.types.highbit = self.handle.p.attr_type_map[i].highbit
+                # relink the attr_type_map ebitmap to the type datum
+                tmp_type.types.node = self.handle.p.attr_type_map[i].node
+                tmp_type.types.highbit = self.handle.p.attr_type_map[i].highbit
 
-            # disconnect ebitmap from attr_type_map to avoid
-            # double free on policy destroy
-            self.handle.p.attr_type_map[i].node = NULL
-            self.handle.p.attr_type_map[i].highbit = 0
+                # disconnect ebitmap from attr_type_map to avoid
+                # double free on policy destroy
+                self.handle.p.attr_type_map[i].node = NULL
+                self.handle.p.attr_type_map[i].highbit = 0
 
-            # now go through each of the member types, and set
-            # the reverse mapping
-            bit = sepol.ebitmap_start(&tmp_type.types, &node)
-            while bit < sepol.ebitmap_length(&tmp_type.types):
-                if sepol.ebitmap_node_get_bit(node, bit):
-                    orig_type = self.handle.p.type_val_to_struct[bit]
-                    ebitmap_set_bit(&orig_type.types, tmp_type.s.value - 1, 1)
+                # now go through each of the member types, and set
+                # the reverse mapping
+                bit = sepol.ebitmap_start(&tmp_type.types, &node)
+                while bit < sepol.ebitmap_length(&tmp_type.types):
+                    if sepol.ebitmap_node_get_bit(node, bit):
+                        orig_type = self.handle.p.type_val_to_struct[bit]
+                        ebitmap_set_bit(&orig_type.types, tmp_type.s.value - 1, 1)
 
-                bit = sepol.ebitmap_next(&node, bit)
+                    bit = sepol.ebitmap_next(&node, bit)
 
     cdef _synthesize_attrs(self):
         """
@@ -1047,6 +1349,32 @@ cdef class SELinuxPolicy:
             tmp_name = NULL
             tmp_type = NULL
 
+    cdef _build_type_rule_index(self):
+        """
+        Build the map of type/attribute datums to the TE rules that
+        reference them in the source, target, or default position.
+        """
+        cdef:
+            dict index = dict()
+            uintptr_t source, target, default
+
+        self.log.debug("Building type/attribute TE rule index.")
+
+        for rule in self.terules():
+            source = (<BaseType>rule.source).key
+            target = (<BaseType>rule.target).key
+            index.setdefault(source, []).append(rule)
+
+            if target != source:
+                index.setdefault(target, []).append(rule)
+
+            if isinstance(rule, (TERule, FileNameTERule)):
+                default = (<BaseType>rule.default).key
+                if default != source and default != target:
+                    index.setdefault(default, []).append(rule)
+
+        self.type_rule_index = index
+
     cdef _cache_constraint_counts(self):
         """Count all constraints in one iteration."""
         if not self.constraint_counts:
@@ -40,7 +40,7 @@ cdef extern from "<sepol/policydb/flask_types.h>":
     ctypedef uint32_t sepol_security_id_t
 
 
-cdef extern from "<sepol/policydb/ebitmap.h>":
+cdef extern from "<sepol/policydb/ebitmap.h>" nogil:
     #
     # ebitmap_node_t
     #
@@ -836,7 +836,7 @@ cdef extern from "<sepol/policydb/policydb.h>":
     ctypedef policydb policydb_t
 
 
-cdef extern from "<sepol/policydb.h>":
+cdef extern from "<sepol/policydb.h>" nogil:
     cdef struct sepol_policy_file:
         pass
     ctypedef sepol_policy_file sepol_policy_file_t
@@ -858,6 +858,7 @@ cdef extern from "<sepol/policydb.h>":
     int sepol_policy_file_create(sepol_policy_file_t ** pf)
     void sepol_policy_file_set_handle(sepol_policy_file_t * pf, sepol_handle_t * handle)
     void sepol_policy_file_set_fp(sepol_policy_file_t * pf, FILE * fp)
+    void sepol_policy_file_set_mem(sepol_policy_file_t * pf, char *data, size_t len)
     int sepol_policydb_read(sepol_policydb_t * p, sepol_policy_file_t * pf)
     void sepol_policydb_free(sepol_policydb_t * p)
     void sepol_policy_file_free(sepol_policy_file_t * pf)
@@ -556,6 +556,74 @@ cdef class FileNameTERule(BaseTERule):
         return f"{self.ruletype} {self.source} {self.target}:{self.tclass} {self.default} {self.filename};"
 
 
+#
+# Factory functions
+#
+cdef BaseTERule avtab_rule_factory(SELinuxPolicy policy, sepol.avtab_key_t *key,
+                                   sepol.avtab_datum_t *datum, conditional, conditional_block):
+    """Factory function for creating TE rule objects from an access vector table node."""
+    if key.specified & sepol.AVRULE_AV:
+        return AVRule.factory(policy, key, datum, conditional, conditional_block)
+    elif key.specified & sepol.AVRULE_TYPE:
+        return TERule.factory(policy, key, datum, conditional, conditional_block)
+    elif key.specified & sepol.AVRULE_XPERMS:
+        return AVRuleXperm.factory(policy, key, datum, conditional, conditional_block)
+    else:
+        raise LowLevelPolicyError(f"Unknown AV rule type 0x{key.specified:04x}")
+
+
+# avtab key specified values are single bits
+cdef enum:
+    RULETYPE_COUNT_BITS = 16
+
+
+cdef inline void count_ruletype(uint16_t specified, size_t *counts) noexcept nogil:
+    """Count a rule in the per-bit rule type counts."""
+    cdef size_t bit
+
+    specified &= ~sepol.AVTAB_ENABLED
+    for bit in range(RULETYPE_COUNT_BITS):
+        if specified & (1 << bit):
+            counts[bit] += 1
+
+
+cdef struct AVTabFilter:
+    # Access vector table node filter.  Zero fields match any node.
+    uint16_t specified  # rule type bits
+    uint16_t tclass     # object class value
+    uint32_t perms      # permission bits, at least one must be set
+
+
+cdef inline bint avtab_filter_match(const AVTabFilter *f, const sepol.avtab_key_t *key,
+                                    const sepol.avtab_datum_t *datum) noexcept nogil:
+    """Determine if an access vector table node matches the filter."""
+    cdef uint32_t perms
+
+    if f.tclass and key.target_class != f.tclass:
+        return False
+
+    if f.specified and not key.specified & f.specified:
+        return False
+
+    if f.perms:
+        if not key.specified & sepol.AVTAB_AV:
+            return False
+
+        perms = ~datum.data if key.specified & sepol.AVTAB_AUDITDENY else datum.data
+        if not perms & f.perms:
+            return False
+
+    return True
+
+
+cdef ruletype_counter(size_t *counts):
+    """Convert per-bit rule type counts to a Counter keyed by TERuletype.value."""
+    cdef size_t bit
+
+    return collections.Counter({1 << bit: counts[bit] for bit in range(RULETYPE_COUNT_BITS)
+                                if counts[bit]})
+
+
 #
 # Iterators
 #
@@ -567,22 +635,53 @@ cdef class TERuleIterator(PolicyIterator):
         sepol.avtab_t *table
         sepol.avtab_ptr_t node
         unsigned int bucket
+        unsigned int depth
+        unsigned int start_bucket
+        unsigned int end_bucket
+        readonly object position
         object conditional
         object cond_block
+        AVTabFilter filter
 
     @staticmethod
     cdef factory(SELinuxPolicy policy, sepol.avtab *table):
         """Factory function for creating TERule iterators."""
+        return TERuleIterator.factory_slots(policy, table, 0, table.nslot)
+
+    @staticmethod
+    cdef factory_filtered(SELinuxPolicy policy, sepol.avtab *table, AVTabFilter filter):
+        """
+        Factory function for creating TERule iterators which only
+        yield the rules of the table nodes matching the filter.
+        """
+        i = TERuleIterator()
+        i.policy = policy
+        i.table = table
+        i.start_bucket = 0
+        i.end_bucket = table.nslot
+        i.filter = filter
+        i.reset()
+        return i
+
+    @staticmethod
+    cdef factory_slots(SELinuxPolicy policy, sepol.avtab *table, uint32_t start, uint32_t end):
+        """
+        Factory function for creating TERule iterators over the
+        [start, end) range of hash slots of the table.
+        """
         i = TERuleIterator()
         i.policy = policy
         i.table = table
+        i.start_bucket = min(start, table.nslot)
+        i.end_bucket = min(end, table.nslot)
         i.reset()
         return i
 
     cdef void _next_bucket(self):
         """Internal method for advancing to the next bucket."""
         self.bucket += 1
-        if self.bucket < self.table.nslot:
+        self.depth = 0
+        if self.bucket < self.end_bucket:
             self.node = self.table.htable[self.bucket]
         else:
             self.node = NULL
@@ -591,35 +690,59 @@ cdef class TERuleIterator(PolicyIterator):
         """Internal method for advancing to the next node."""
         if self.node != NULL and self.node.next != NULL:
             self.node = self.node.next
+            self.depth += 1
         else:
             self._next_bucket()
-            while self.bucket < self.table.nslot and self.node == NULL:
+            while self.bucket < self.end_bucket and self.node == NULL:
                 self._next_bucket()
 
+    cdef void _next_match(self):
+        """Internal method for advancing past the nodes not matching the filter."""
+        while self.node != NULL and self.bucket < self.end_bucket and \
+                not avtab_filter_match(&self.filter, &self.node.key, &self.node.datum):
+            self._next_node()
+
     def __next__(self):
         cdef:
             sepol.avtab_key_t *key
             sepol.avtab_datum_t *datum
 
-        if self.table == NULL or self.table.nel == 0 or self.bucket >= self.table.nslot:
+        if self.table == NULL or self.table.nel == 0 or self.bucket >= self.end_bucket:
             raise StopIteration
 
         key = &self.node.key
         datum = &self.node.datum
 
+        # (hash slot, chain depth) of the rule; see
+        # SELinuxPolicy.terules_from_positions()
+        self.position = (self.bucket, self.depth)
+
         self._next_node()
+        self._next_match()
 
-        if key.specified & sepol.AVRULE_AV:
-            return AVRule.factory(self.policy, key, datum, None, None)
-        elif key.specified & sepol.AVRULE_TYPE:
-            return TERule.factory(self.policy, key, datum, None, None)
-        elif key.specified & sepol.AVRULE_XPERMS:
-            return AVRuleXperm.factory(self.policy, key, datum, None, None)
-        else:
-            raise LowLevelPolicyError(f"Unknown AV rule type 0x{key.specified:04x}")
+        return avtab_rule_factory(self.policy, key, datum, None, None)
 
     def __len__(self):
-        return self.table.nel
+        cdef:
+            sepol.avtab_ptr_t node
+            uint32_t bucket = self.start_bucket
+            size_t count = 0
+
+        if self.start_bucket == 0 and self.end_bucket == self.table.nslot and \
+                not (self.filter.specified or self.filter.tclass or self.filter.perms):
+            return self.table.nel
+
+        while bucket < self.end_bucket:
+            node = self.table.htable[bucket]
+            while node != NULL:
+                if avtab_filter_match(&self.filter, &node.key, &node.datum):
+                    count += 1
+
+                node = node.next
+
+            bucket += 1
+
+        return count
 
     def ruletype_count(self):
         """
@@ -631,30 +754,40 @@ cdef class TERuleIterator(PolicyIterator):
             sepol.avtab_key_t *key
             sepol.avtab_ptr_t node
             uint32_t bucket = 0
+            size_t counts[RULETYPE_COUNT_BITS]
 
-        count = collections.Counter()
+        memset(counts, 0, sizeof(counts))
 
-        while bucket < self.table[0].nslot:
-            node = self.table[0].htable[bucket]
-            while node != NULL:
-                key = &node.key if node else NULL
-                if key != NULL:
-                    count[key.specified & ~sepol.AVTAB_ENABLED] += 1
+        with nogil:
+            while bucket < self.table[0].nslot:
+                node = self.table[0].htable[bucket]
+                while node != NULL:
+                    key = &node.key if node else NULL
+                    if key != NULL and avtab_filter_match(&self.filter, key, &node.datum):
+                        count_ruletype(key.specified, counts)
 
-                node = node.next
+                    node = node.next
 
-            bucket += 1
+                bucket += 1
 
-        return count
+        return ruletype_counter(counts)
 
     def reset(self):
         """Reset the iterator to the start."""
-        self.node = self.table.htable[0]
+        self.bucket = self.start_bucket
+        self.depth = 0
+        self.position = None
+        if self.bucket < self.end_bucket:
+            self.node = self.table.htable[self.bucket]
+        else:
+            self.node = NULL
 
         # advance to first item
         if self.node == NULL:
             self._next_node()
 
+        self._next_match()
+
 
 cdef class ConditionalTERuleIterator(PolicyIterator):
 
@@ -665,6 +798,7 @@ cdef class ConditionalTERuleIterator(PolicyIterator):
         sepol.cond_av_list_t *curr
         object conditional
         object conditional_block
+        AVTabFilter filter
 
     @staticmethod
     cdef factory(SELinuxPolicy policy, sepol.cond_av_list_t *head, conditional, cond_block):
@@ -677,6 +811,28 @@ cdef class ConditionalTERuleIterator(PolicyIterator):
         c.reset()
         return c
 
+    @staticmethod
+    cdef factory_filtered(SELinuxPolicy policy, sepol.cond_av_list_t *head, conditional,
+                          cond_block, AVTabFilter filter):
+        """
+        ConditionalTERuleIterator iterator factory, which only yields
+        the rules of the nodes matching the filter.
+        """
+        c = ConditionalTERuleIterator()
+        c.policy = policy
+        c.head = head
+        c.conditional = conditional
+        c.conditional_block = cond_block
+        c.filter = filter
+        c.reset()
+        return c
+
+    cdef void _next_match(self):
+        """Internal method for advancing past the nodes not matching the filter."""
+        while self.curr != NULL and \
+                not avtab_filter_match(&self.filter, &self.curr.node.key, &self.curr.node.datum):
+            self.curr = self.curr.next
+
     def __next__(self):
         if self.curr == NULL:
             raise StopIteration
@@ -685,15 +841,10 @@ cdef class ConditionalTERuleIterator(PolicyIterator):
         datum = &self.curr.node.datum
 
         self.curr = self.curr.next
+        self._next_match()
 
-        if key.specified & sepol.AVRULE_AV:
-            return AVRule.factory(self.policy, key, datum, self.conditional, self.conditional_block)
-        elif key.specified & sepol.AVRULE_TYPE:
-            return TERule.factory(self.policy, key, datum, self.conditional, self.conditional_block)
-        elif key.specified & sepol.AVRULE_XPERMS:
-            return AVRuleXperm.factory(self.policy, key, datum, self.conditional, self.conditional_block)
-        else:
-            raise LowLevelPolicyError(f"Unknown AV rule type 0x{key.specified:04x}")
+        return avtab_rule_factory(self.policy, key, datum, self.conditional,
+                                  self.conditional_block)
 
     def __len__(self):
         cdef:
@@ -702,7 +853,9 @@ cdef class ConditionalTERuleIterator(PolicyIterator):
 
         curr = self.head
         while curr != NULL:
-            count += 1
+            if avtab_filter_match(&self.filter, &curr.node.key, &curr.node.datum):
+                count += 1
+
             curr = curr.next
 
         return count
@@ -713,20 +866,26 @@ cdef class ConditionalTERuleIterator(PolicyIterator):
 
         Return: collections.Counter object keyed by TERuletype.value
         """
-        cdef sepol.cond_av_list_t *curr
+        cdef:
+            sepol.cond_av_list_t *curr
+            size_t counts[RULETYPE_COUNT_BITS]
 
-        count = collections.Counter()
+        memset(counts, 0, sizeof(counts))
 
-        curr = self.head
-        while curr != NULL:
-            count[curr.node.key.specified & ~sepol.AVTAB_ENABLED] += 1
-            curr = curr.next
+        with nogil:
+            curr = self.head
+            while curr != NULL:
+                if avtab_filter_match(&self.filter, &curr.node.key, &curr.node.datum):
+                    count_ruletype(curr.node.key.specified, counts)
 
-        return count
+                curr = curr.next
+
+        return ruletype_counter(counts)
 
     def reset(self):
         """Reset the iterator back to the start."""
         self.curr = self.head
+        self._next_match()
 
 
 cdef class FileNameTERuleIterator(HashtabIterator):
@@ -736,6 +895,7 @@ cdef class FileNameTERuleIterator(HashtabIterator):
     cdef:
         sepol.filename_trans_datum_t *datum
         TypeEbitmapIterator stypei
+        uint16_t tclass
 
     @staticmethod
     cdef factory(SELinuxPolicy policy, sepol.hashtab_t *table):
@@ -746,10 +906,27 @@ cdef class FileNameTERuleIterator(HashtabIterator):
         i.reset()
         return i
 
+    @staticmethod
+    cdef factory_class(SELinuxPolicy policy, sepol.hashtab_t *table, uint16_t tclass):
+        """
+        Factory function for creating FileNameTERule iterators
+        over the rules of one object class, by class value.
+        """
+        i = FileNameTERuleIterator()
+        i.policy = policy
+        i.table = table
+        i.tclass = tclass
+        i.reset()
+        return i
+
     def _next_stype(self):
         while True:
             if self.datum == NULL:
                 super().__next__()
+                while self.tclass and \
+                        (<sepol.filename_trans_key_t *>self.curr.key).tclass != self.tclass:
+                    super().__next__()
+
                 self.datum = <sepol.filename_trans_datum_t *>self.curr.datum
                 self.stypei = TypeEbitmapIterator.factory(self.policy, &self.datum.stypes)
             try:
@@ -767,7 +944,8 @@ cdef class FileNameTERuleIterator(HashtabIterator):
                                       stype, self.datum.otype)
 
     def __len__(self):
-        return sum(1 for r in FileNameTERuleIterator.factory(self.policy, self.table))
+        return sum(1 for r in FileNameTERuleIterator.factory_class(self.policy, self.table,
+                                                                  self.tclass))
 
     def reset(self):
         super().reset()
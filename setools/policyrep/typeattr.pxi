@@ -26,6 +26,35 @@ cdef inline BaseType type_or_attr_factory(SELinuxPolicy policy, sepol.type_datum
         return Type.factory(policy, symbol)
 
 
+#
+# TE rule lookup function
+#
+cdef list typeattr_rules_lookup(SELinuxPolicy policy, symbols, ruletype):
+    """
+    Look up the TE rules that reference any of the types/attributes,
+    without duplicates, optionally limited to the specified rule types.
+    """
+    cdef:
+        BaseType sym
+        list rules = []
+        set seen = set()
+        frozenset ruletypes = None
+
+    if ruletype:
+        ruletypes = frozenset(TERuletype.lookup(r) for r in ruletype)
+
+    for sym in symbols:
+        for rule in policy.type_rules(sym.key):
+            if id(rule) in seen:
+                continue
+
+            seen.add(id(rule))
+            if ruletypes is None or rule.ruletype in ruletypes:
+                rules.append(rule)
+
+    return rules
+
+
 #
 # Classes
 #
@@ -45,6 +74,10 @@ cdef class BaseType(PolicySymbol):
         """Generator that yields all aliases for this type."""
         raise NotImplementedError
 
+    def rules(self, ruletype=None):
+        """Generator that yields all TE rules that reference this type."""
+        raise NotImplementedError
+
 
 cdef class Type(BaseType):
 
@@ -97,6 +130,20 @@ cdef class Type(BaseType):
         """Generator that yields all aliases for this type."""
         return iter(self._aliases)
 
+    def rules(self, ruletype=None):
+        """
+        Generator that yields all TE rules that reference this type,
+        directly or through one of its attributes, in the source,
+        target, or default position.
+
+        Keyword Parameters:
+        ruletype    An iterable of TE rule types.  If set, only rules of
+                    these rule types are yielded.
+        """
+        self._load_attributes()
+        return iter(typeattr_rules_lookup(self.policy, itertools.chain((self,), self._attrs),
+                                          ruletype))
+
     def statement(self):
         cdef:
             size_t count
@@ -175,6 +222,20 @@ cdef class TypeAttribute(BaseType):
         """(T/F) the type is permissive."""
         raise SymbolUseError(f"{self.name} is an attribute, thus cannot be permissive.")
 
+    def rules(self, ruletype=None):
+        """
+        Generator that yields all TE rules that reference this attribute
+        or any of its member types in the source, target, or default
+        position.
+
+        Keyword Parameters:
+        ruletype    An iterable of TE rule types.  If set, only rules of
+                    these rule types are yielded.
+        """
+        self.load_types()
+        return iter(typeattr_rules_lookup(self.policy, itertools.chain((self,), self._types),
+                                          ruletype))
+
     def statement(self):
         return f"attribute {self.name};"
 
@@ -182,7 +243,7 @@ cdef class TypeAttribute(BaseType):
 #
 # Hash Table Iterator Classes
 #
-cdef inline bint type_is_alias(sepol.type_datum_t *datum):
+cdef inline bint type_is_alias(sepol.type_datum_t *datum) noexcept nogil:
     """Determine if the type datum is an alias."""
     return (datum.primary == 0 and datum.flavor == sepol.TYPE_TYPE) \
             or datum.flavor == sepol.TYPE_ALIAS
@@ -218,16 +279,17 @@ cdef class TypeHashtabIterator(HashtabIterator):
         cdef uint32_t bucket = 0
         cdef size_t count = 0
 
-        while bucket < self.table[0].size:
-            node = self.table[0].htable[bucket]
-            while node != NULL:
-                datum = <sepol.type_datum_t *>node.datum if node else NULL
-                if datum != NULL and datum.flavor == sepol.TYPE_TYPE and not type_is_alias(datum):
-                    count += 1
+        with nogil:
+            while bucket < self.table[0].size:
+                node = self.table[0].htable[bucket]
+                while node != NULL:
+                    datum = <sepol.type_datum_t *>node.datum if node else NULL
+                    if datum != NULL and datum.flavor == sepol.TYPE_TYPE and not type_is_alias(datum):
+                        count += 1
 
-                node = node.next
+                    node = node.next
 
-            bucket += 1
+                bucket += 1
 
         return count
 
@@ -265,16 +327,17 @@ cdef class TypeAttributeHashtabIterator(HashtabIterator):
         cdef uint32_t bucket = 0
         cdef size_t count = 0
 
-        while bucket < self.table[0].size:
-            node = self.table[0].htable[bucket]
-            while node != NULL:
-                datum = <sepol.type_datum_t *>node.datum if node else NULL
-                if datum != NULL and datum.flavor == sepol.TYPE_ATTRIB:
-                    count += 1
+        with nogil:
+            while bucket < self.table[0].size:
+                node = self.table[0].htable[bucket]
+                while node != NULL:
+                    datum = <sepol.type_datum_t *>node.datum if node else NULL
+                    if datum != NULL and datum.flavor == sepol.TYPE_ATTRIB:
+                        count += 1
 
-                node = node.next
+                    node = node.next
 
-            bucket += 1
+                bucket += 1
 
         return count
 
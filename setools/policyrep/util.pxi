@@ -74,8 +74,14 @@ class WeakKeyDefaultDict(weakref.WeakKeyDictionary):
 #
 # Functions
 #
-cdef void sepol_logging_callback(void *varg, sepol.sepol_handle_t * sh, const char *fmt, ...) noexcept:
-    """Python logging for sepol log callback."""
+cdef void sepol_logging_callback(void *varg, sepol.sepol_handle_t * sh, const char *fmt,
+                                 ...) noexcept with gil:
+    """
+    Python logging for sepol log callback.
+
+    libsepol calls this while the policy is read without the GIL,
+    so the GIL is acquired here.
+    """
     cdef:
         va_list args
         char *msg
@@ -89,7 +95,7 @@ cdef void sepol_logging_callback(void *varg, sepol.sepol_handle_t * sh, const ch
     free(msg)
 
 
-cdef void ebitmap_set_bit(sepol.ebitmap_t * e, unsigned int bit, int value):
+cdef int ebitmap_set_bit(sepol.ebitmap_t * e, unsigned int bit, int value) except -1 nogil:
     """
     Set a specific bit value in an ebitmap.
 
@@ -104,7 +110,8 @@ cdef void ebitmap_set_bit(sepol.ebitmap_t * e, unsigned int bit, int value):
         uint32_t highbit = startbit + sepol.MAPSIZE
 
     if highbit == 0:
-        raise LowLevelPolicyError(f"Bitmap overflow, bit {bit:#06x}")
+        with gil:
+            raise LowLevelPolicyError(f"Bitmap overflow, bit {bit:#06x}")
 
     prev = NULL
     n = e.node;
@@ -132,17 +139,18 @@ cdef void ebitmap_set_bit(sepol.ebitmap_t * e, unsigned int bit, int value):
 
                     free(n)
 
-            return
+            return 0
 
         prev = n
         n = n.next
 
     if not value:
-        return
+        return 0
 
     new = <sepol.ebitmap_node_t*>calloc(1, sizeof(sepol.ebitmap_node_t))
     if new == NULL:
-        raise MemoryError
+        with gil:
+            raise MemoryError
 
     new.startbit = startbit;
     new.map = sepol.MAPBIT << (bit - new.startbit)
@@ -158,6 +166,8 @@ cdef void ebitmap_set_bit(sepol.ebitmap_t * e, unsigned int bit, int value):
         new.next = e.node
         e.node = new
 
+    return 0
+
 
 cdef int hashtab_insert(sepol.hashtab_t h, sepol.hashtab_key_t key, sepol.hashtab_datum_t datum):
     """
@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+#
+from collections.abc import Callable, Iterable, Iterator
+import typing
+
+from .exception import AnalysisCanceled
+
+__all__: typing.Final[tuple[str, ...]] = ("Progress", "ProgressCallback", "track")
+
+T = typing.TypeVar("T")
+
+# Parameters are the phase name, the count of items processed in the
+# phase, and the total items in the phase, or None if it is unknown.
+ProgressCallback = Callable[[str, int, int | None], None]
+
+
+class Progress:
+
+    """
+    Progress reporting and cooperative cancellation of long analyses.
+
+    Set an instance as the progress attribute of a query, analysis,
+    policy difference, or policy checker.  As it runs, the phases of
+    its work are reported to the callback.  If cancel() is called, e.g.
+    by another thread or the callback, AnalysisCanceled is raised in
+    the analysis at its next progress update, which is at most one
+    item of work later.
+
+    Keyword Parameters:
+    callback    A callable called at the start of each phase and every
+                interval items of the phase, with the phase name, the
+                count of items processed, and the total items in the
+                phase, or None if the total is unknown.
+    interval    The number of items between callbacks.
+    """
+
+    def __init__(self, callback: ProgressCallback | None = None, /, *,
+                 interval: int = 1000) -> None:
+
+        if interval < 1:
+            raise ValueError("Progress interval must be positive.")
+
+        self.callback = callback
+        self.interval = interval
+        self.canceled = False
+        self.phase: str | None = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}(phase={self.phase!r}, canceled={self.canceled})>"
+
+    def cancel(self) -> None:
+        """Request cancellation of the analysis.  This is thread safe."""
+        self.canceled = True
+
+    def check(self) -> None:
+        """
+        Check for cancellation.
+
+        Exceptions:
+        AnalysisCanceled    Cancellation was requested.
+        """
+        if self.canceled:
+            raise AnalysisCanceled(f"Analysis canceled: {self.phase or 'not started'}.")
+
+    def start(self, phase: str, total: int | None = None) -> None:
+        """Start a new phase of work."""
+        self.check()
+        self.phase = phase
+        if self.callback:
+            self.callback(phase, 0, total)
+
+    def iterate(self, phase: str, items: Iterable[T], total: int | None = None) -> Iterator[T]:
+        """
+        Generator which yields the items of a phase of work, reporting
+        the progress and checking for cancellation.
+        """
+        self.start(phase, total)
+        count = 0
+        for count, item in enumerate(items, start=1):
+            if self.canceled:
+                self.check()
+
+            if self.callback and count % self.interval == 0:
+                self.callback(phase, count, total)
+
+            yield item
+
+        if self.callback and count % self.interval:
+            self.callback(phase, count, total)
+
+
+def track(progress: Progress | None, phase: str, items: Iterable[T],
+          total: int | None = None) -> Iterable[T]:
+    """
+    Track the progress of a phase of work over the items, if progress
+    tracking is enabled.
+
+    Parameters:
+    progress    The Progress, or None if progress is not tracked.
+    phase       The description of the phase, e.g. "Building graph".
+    items       The items of work.
+    total       The total number of items, if known.
+
+    Return:     The items, which are wrapped by Progress.iterate()
+                if progress is tracked.
+    """
+    return items if progress is None else progress.iterate(phase, items, total)
@@ -13,6 +13,8 @@ if typing.TYPE_CHECKING:
     from collections.abc import Iterable
     from networkx import DiGraph
     from .policyrep import PolicyTarget, SELinuxPolicy
+    from .pathsearch import PathBudget
+    from .progress import Progress
 
 
 class PolicyQuery(ABC):
@@ -24,6 +26,9 @@ class PolicyQuery(ABC):
 
     _policy: "SELinuxPolicy"
 
+    # Progress reporting and cancellation of the query, if set.
+    progress: "Progress | None" = None
+
     def __init__(self, policy: "SELinuxPolicy", **kwargs) -> None:
         self.policy: "SELinuxPolicy" = policy
         self.log: typing.Final = logging.getLogger(self.__module__)
@@ -75,6 +80,9 @@ class DirectedGraphAnalysis(PolicyQuery):
 
     G: "DiGraph"
 
+    # Limits of path enumeration by the analysis, if set.
+    path_budget: "PathBudget | None" = None
+
     @abstractmethod
     def graphical_results(self) -> "DiGraph":
         """Return the results of the analysis as a NetworkX directed graph."""
@@ -6,13 +6,14 @@ from collections.abc import Iterable
 import re
 import typing
 
-from . import exception, mixins, policyrep, query, util
+from . import exception, mixins, parallel, policyrep, query, util
 from .descriptors import CriteriaDescriptor, CriteriaSetDescriptor
+from .progress import track
 
 __all__: typing.Final[tuple[str, ...]] = ("RBACRuleQuery",)
 
 
-class RBACRuleQuery(mixins.MatchObjClass, query.PolicyQuery):
+class RBACRuleQuery(mixins.MatchObjClass, parallel.ParallelScan, query.PolicyQuery):
 
     """
     Query the RBAC rules.
@@ -43,14 +44,19 @@ class RBACRuleQuery(mixins.MatchObjClass, query.PolicyQuery):
     """
 
     ruletype = CriteriaSetDescriptor[policyrep.RBACRuletype](enum_class=policyrep.RBACRuletype)
-    source = CriteriaDescriptor[policyrep.Role]("source_regex", "lookup_role")
+    source = CriteriaDescriptor[policyrep.Role]("source_regex", "lookup_role",
+                                                regex_symbols=("roles",))
     source_regex: bool = False
     source_indirect: bool = True
+    _source_regex_matches: frozenset[str] | None = None
     _target: re.Pattern[str] | policyrep.Role | policyrep.TypeOrAttr | None = None
     target_regex: bool = False
     target_indirect: bool = True
-    default = CriteriaDescriptor[policyrep.Role]("default_regex", "lookup_role")
+    default = CriteriaDescriptor[policyrep.Role]("default_regex", "lookup_role",
+                                                 regex_symbols=("roles",))
     default_regex: bool = False
+    _default_regex_matches: frozenset[str] | None = None
+    _shard_rules = "rbacrules"
 
     @property
     def target(self) -> re.Pattern[str] | policyrep.Role | policyrep.TypeOrAttr | None:
@@ -87,59 +93,72 @@ class RBACRuleQuery(mixins.MatchObjClass, query.PolicyQuery):
         self._match_object_class_debug(self.log)
         self.log.debug(f"{self.default=}, {self.default_regex=}")
 
-        for rule in self.policy.rbacrules():
-            #
-            # Matching on rule type
-            #
-            if self.ruletype:
-                if rule.ruletype not in self.ruletype:
-                    continue
-
-            #
-            # Matching on source role
-            #
-            if self.source and not util.match_indirect_regex(
-                    rule.source,
-                    self.source,
-                    self.source_indirect,
-                    self.source_regex):
-                continue
-
-            #
-            # Matching on target type (role_transition)/role(allow)
-            #
-            if self.target and not util.match_indirect_regex(
-                    rule.target,
-                    self.target,
-                    self.target_indirect,
-                    self.target_regex):
-                continue
-
-            #
-            # Matching on object class
-            #
+        yield from self._match_rules(track(self.progress, "Matching RBAC rules",
+                                           self.policy.rbacrules()))
+
+    def _match_rules(self, rules: Iterable[policyrep.AnyRBACRule]) -> \
+            Iterable[policyrep.AnyRBACRule]:
+        """Generator which yields the RBAC rules matching the criteria."""
+        for rule in rules:
+            if self._match_rule(rule):
+                yield rule
+
+    def _match_rule(self, rule: policyrep.AnyRBACRule) -> bool:
+        """Return true if the RBAC rule matches the criteria."""
+        #
+        # Matching on rule type
+        #
+        if self.ruletype:
+            if rule.ruletype not in self.ruletype:
+                return False
+
+        #
+        # Matching on source role
+        #
+        if self.source and not util.match_indirect_regex(
+                rule.source,
+                self.source,
+                self.source_indirect,
+                self.source_regex,
+                self._source_regex_matches):
+            return False
+
+        #
+        # Matching on target type (role_transition)/role(allow)
+        #
+        if self.target and not util.match_indirect_regex(
+                rule.target,
+                self.target,
+                self.target_indirect,
+                self.target_regex):
+            return False
+
+        #
+        # Matching on object class
+        #
+        try:
+            if not self._match_object_class(rule):
+                return False
+        except exception.RuleUseError:
+            return False
+
+        #
+        # Matching on default role
+        #
+        if self.default:
             try:
-                if not self._match_object_class(rule):
-                    continue
+                # because default role is always a single
+                # role, hard-code indirect to True
+                # so the criteria can be an attribute
+                if not util.match_indirect_regex(
+                        rule.default,
+                        self.default,
+                        True,
+                        self.default_regex,
+                        self._default_regex_matches):
+                    return False
             except exception.RuleUseError:
-                continue
-
-            #
-            # Matching on default role
-            #
-            if self.default:
-                try:
-                    # because default role is always a single
-                    # role, hard-code indirect to True
-                    # so the criteria can be an attribute
-                    if not util.match_indirect_regex(
-                            rule.default,
-                            self.default,
-                            True,
-                            self.default_regex):
-                        continue
-                except exception.RuleUseError:
-                    continue
-
-            # if we get here, we have matched all available criteria
-            yield rule
+                return False
+
+        # if we get here, we have matched all available criteria
+        return True
@@ -0,0 +1,289 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+"""
+Precomputed reachability of analysis graphs.
+
+The strongly connected components of the graph are condensed to a
+directed acyclic graph, and the reachability of each component is
+stored as a bitset of the components, so repeated reachability
+questions of the same graph do not require new graph searches.
+
+The bounded reach of all of the nodes of a graph, i.e. the nodes
+reachable within a maximum number of edges, is also computed at once,
+rather than by a search from each node.
+"""
+from collections.abc import Hashable, Iterable, Iterator
+import json
+import logging
+import multiprocessing
+import os
+import typing
+
+try:
+    import networkx as nx
+
+except ImportError as iex:
+    logging.getLogger(__name__).debug(f"{iex.name} failed to import.")
+
+from .progress import Progress, track
+
+if typing.TYPE_CHECKING:
+    from .policyrep import SELinuxPolicy
+
+__all__: typing.Final[tuple[str, ...]] = ("ReachabilityIndex", "ReachJob", "bounded_reach_counts")
+
+# version of the saved index format
+FORMAT_VERSION: typing.Final[int] = 1
+
+# A bounded reach computation: the direction (True for the nodes which
+# reach each node), and the minimum edge capacity, or None for all edges.
+ReachJob = tuple[bool, int | None]
+
+# The graph, depth, targets, and capacity attribute of the bounded reach
+# computations of a worker process.  These are inherited from the parent
+# process when the worker is forked.
+_worker_args: tuple["nx.DiGraph", int | None, set | None, str] | None = None
+
+
+class ReachabilityIndex:
+
+    """
+    Transitive closure of a directed graph, such as the subgraph of an
+    information flow or domain transition analysis.
+
+    A node reaches another node if there is a path of one or more edges
+    between them.  A node reaches itself only if it is on a cycle.
+    Nodes which are not in the graph do not reach any node.  Checking
+    the reachability of two nodes is constant time, and listing the
+    nodes reachable from or to a node is linear in the number of nodes
+    listed.
+
+    Parameters:
+    graph       The directed graph.
+
+    Keyword Parameters:
+    progress    The progress reporting and cancellation of the
+                build, if set.
+    """
+
+    def __init__(self, graph: "nx.DiGraph", /, *, progress: Progress | None = None) -> None:
+        log = logging.getLogger(__name__)
+        log.info("Building reachability index...")
+        condensed = nx.condensation(graph)
+        # components are indexed in topological order
+        order = list(nx.topological_sort(condensed))
+        position = {c: i for i, c in enumerate(order)}
+        members = condensed.graph["mapping"]
+
+        self._components: list[tuple] = [tuple(condensed.nodes[c]["members"]) for c in order]
+        self._component: dict[Hashable, int] = {n: position[c] for n, c in members.items()}
+        self._cyclic: list[bool] = [len(m) > 1 or graph.has_edge(m[0], m[0])
+                                    for m in self._components]
+
+        # descendants of the components, from the last in topological order
+        descendants = [0] * len(order)
+        for c in track(progress, "Building reachability index", reversed(order), len(order)):
+            i = position[c]
+            bits = 1 << i if self._cyclic[i] else 0
+            for succ in condensed.successors(c):
+                j = position[succ]
+                bits |= descendants[j] | 1 << j
+
+            descendants[i] = bits
+
+        ancestors = [0] * len(order)
+        for c in order:
+            i = position[c]
+            bits = 1 << i if self._cyclic[i] else 0
+            for pred in condensed.predecessors(c):
+                j = position[pred]
+                bits |= ancestors[j] | 1 << j
+
+            ancestors[i] = bits
+
+        self._descendants = descendants
+        self._ancestors = ancestors
+        log.info("Completed building reachability index.")
+        log.debug(f"Reachability index stats: nodes: {len(self._component)}, "
+                  f"components: {len(self._components)}.")
+
+    def __len__(self) -> int:
+        return len(self._component)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} of {len(self._component)} nodes in " \
+               f"{len(self._components)} components>"
+
+    def reachable(self, source: Hashable, target: Hashable) -> bool:
+        """Determine if the source node reaches the target node."""
+        try:
+            return bool(self._descendants[self._component[source]] >> self._component[target] & 1)
+        except KeyError:
+            return False
+
+    def descendants(self, source: Hashable) -> Iterator:
+        """Generator which yields the nodes reachable from the source node."""
+        if (i := self._component.get(source)) is not None:
+            yield from self._nodes(self._descendants[i])
+
+    def ancestors(self, target: Hashable) -> Iterator:
+        """Generator which yields the nodes which reach the target node."""
+        if (i := self._component.get(target)) is not None:
+            yield from self._nodes(self._ancestors[i])
+
+    def save(self, path: str) -> None:
+        """
+        Save the index to a file.  The nodes are saved by name, so the
+        nodes of the graph should be named policy objects, such as types.
+
+        Parameters:
+        path        The path of the file.
+        """
+        with open(path, "w", encoding="utf-8") as fd:
+            json.dump({"version": FORMAT_VERSION,
+                       "components": [[str(n) for n in c] for c in self._components],
+                       "cyclic": self._cyclic,
+                       "descendants": [format(b, "x") for b in self._descendants],
+                       "ancestors": [format(b, "x") for b in self._ancestors]}, fd)
+
+    @classmethod
+    def load(cls, path: str, policy: "SELinuxPolicy") -> "ReachabilityIndex":
+        """
+        Load an index saved by save().  The index must be from an
+        analysis of the same policy.
+
+        Parameters:
+        path        The path of the file.
+        policy      The policy of the index.
+
+        Return:     The index.
+
+        Exceptions:
+        ValueError      The file is not a valid index.
+        InvalidType     A type of the index is not in the policy.
+        """
+        with open(path, "r", encoding="utf-8") as fd:
+            data = json.load(fd)
+
+        try:
+            if data["version"] != FORMAT_VERSION:
+                raise ValueError(f"Unsupported reachability index version {data['version']}.")
+
+            index = cls.__new__(cls)
+            index._components = [tuple(policy.lookup_type(n) for n in c)
+                                 for c in data["components"]]
+            index._component = {n: i for i, c in enumerate(index._components) for n in c}
+            index._cyclic = [bool(c) for c in data["cyclic"]]
+            index._descendants = [int(b, 16) for b in data["descendants"]]
+            index._ancestors = [int(b, 16) for b in data["ancestors"]]
+        except (KeyError, TypeError, AttributeError) as ex:
+            raise ValueError(f"{path} is not a valid reachability index: {ex}") from ex
+
+        if not len(index._components) == len(index._cyclic) == len(index._descendants) == \
+                len(index._ancestors):
+            raise ValueError(f"{path} is not a valid reachability index.")
+
+        return index
+
+    def _nodes(self, bits: int) -> Iterator:
+        """Generator which yields the nodes of the components in the bitset."""
+        while bits:
+            low = bits & -bits
+            yield from self._components[low.bit_length() - 1]
+            bits ^= low
+
+
+def bounded_reach_counts(graph: "nx.DiGraph", jobs: Iterable[ReachJob], /, *,
+                         depth: int | None = None,
+                         targets: Iterable[Hashable] | None = None,
+                         capacity: str = "capacity",
+                         workers: int = 1,
+                         progress: Progress | None = None) -> list[list[int]]:
+    """
+    Count the nodes reachable from each node, or which reach each node,
+    within a maximum number of edges, for all of the nodes at once.
+
+    The reach of all nodes is computed together, one edge at a time:
+    the reach of a node within n edges is the union of its neighbors
+    and their reach within n - 1 edges.  Each reach is a bitset of the
+    nodes, and a node is only updated if the reach of a neighbor
+    changed in the previous step.
+
+    Parameters:
+    graph       The directed graph.
+    jobs        The reach computations, each a tuple of the direction,
+                True for the nodes which reach each node, and the
+                minimum edge capacity, or None for all edges.
+
+    Keyword Parameters:
+    depth       The maximum number of edges, or None for no maximum.
+    targets     The nodes which are counted.  The default is all nodes.
+    capacity    The edge attribute of the capacity.
+    workers     The number of worker processes.  The jobs are split
+                across the workers, which are forked from this process.
+                If forking is not available, the jobs are run in this
+                process.  Since this process is forked, this should not
+                be used from a multi-threaded process.
+    progress    The progress reporting and cancellation, if set.
+
+    Return:     For each job, a list of the count for each node, in the
+                order of the nodes of the graph.  A node is not counted
+                in its own reach.
+    """
+    global _worker_args
+
+    if workers < 1:
+        raise ValueError(f"Invalid number of workers: {workers}")
+
+    jobs = list(jobs)
+    args = (graph, depth, None if targets is None else set(targets), capacity)
+    if workers == 1 or len(jobs) <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        return [_reach_counts(*args, *job)
+                for job in track(progress, "Computing reach", jobs, len(jobs))]
+
+    _worker_args = args
+    try:
+        ctx = multiprocessing.get_context("fork")
+        with ctx.Pool(min(workers, len(jobs), os.cpu_count() or 1)) as pool:
+            return list(track(progress, "Computing reach",
+                              pool.imap(_reach_worker, jobs, chunksize=1), len(jobs)))
+    finally:
+        _worker_args = None
+
+
+def _reach_worker(job: ReachJob) -> list[int]:
+    """Run a bounded reach computation in a worker process."""
+    assert _worker_args is not None, "No graph in worker process, this is an SETools bug."
+    return _reach_counts(*_worker_args, *job)
+
+
+def _reach_counts(graph: "nx.DiGraph", depth: int | None, targets: set | None, capacity: str,
+                  reverse: bool, min_capacity: int | None) -> list[int]:
+    """Run a bounded reach computation."""
+    nodes = list(graph)
+    index = {n: i for i, n in enumerate(nodes)}
+    adjacency = graph.pred if reverse else graph.succ
+    neighbors = [[index[m] for m, data in adjacency[n].items()
+                  if min_capacity is None or data[capacity] >= min_capacity] for n in nodes]
+    bits = [1 << i for i in range(len(nodes))]
+
+    reach = [0] * len(nodes)
+    changed = [True] * len(nodes)
+    for _ in range(len(nodes) if depth is None else depth):
+        next_reach = reach.copy()
+        next_changed = [False] * len(nodes)
+        for i, nbrs in enumerate(neighbors):
+            if any(changed[j] for j in nbrs):
+                value = 0
+                for j in nbrs:
+                    value |= bits[j] | reach[j]
+
+                if value != reach[i]:
+                    next_reach[i] = value
+                    next_changed[i] = True
+
+        reach, changed = next_reach, next_changed
+        if not any(changed):
+            break
+
+    mask = -1 if targets is None else sum(bits[index[n]] for n in targets if n in index)
+    return [(r & mask & ~bits[i]).bit_count() for i, r in enumerate(reach)]
@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+"""
+Compact rule provenance of analysis graph edges.
+
+The rules of the edges of an analysis graph are stored as integer rule
+ids packed into a bytes object, rather than lists of rule objects, and
+the rule objects are only looked up when an edge's rules are accessed.
+While a graph is built, the packed ids are interned, so the edges
+expanded from the same attribute-based rules share one object.  The
+interning index is released after the build, so it does not add to the
+memory of the graph.  Since the packed ids are immutable and the table
+only grows, a table can be shared by copies of a graph.
+"""
+from array import array
+from collections.abc import Hashable, Iterable, Sequence
+import typing
+
+__all__: typing.Final[tuple[str, ...]] = ("RuleIds", "RuleTable")
+
+R = typing.TypeVar("R", bound=Hashable)
+
+# The ids of the rules of an edge, packed as unsigned 32-bit integers
+RuleIds = bytes
+
+# array typecode of the packed rule ids
+TYPECODE: typing.Final = "I"
+
+
+class RuleTable(typing.Generic[R]):
+
+    """Table of the rules of an analysis graph, by integer id."""
+
+    def __init__(self) -> None:
+        self._rules: list[R] = []
+        self._ids: dict[R, int] = {}
+        self._interned: dict[RuleIds, RuleIds] = {}
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} of {len(self._rules)} rules>"
+
+    def id(self, rule: R) -> int:
+        """Get the id of a rule, adding the rule to the table if needed."""
+        try:
+            return self._ids[rule]
+        except KeyError:
+            rule_id = self._ids[rule] = len(self._rules)
+            self._rules.append(rule)
+            return rule_id
+
+    def ids(self, ids: Iterable[int]) -> RuleIds:
+        """
+        Get the packed rule ids.  Equal packed rule ids are the same
+        object until the interning index is released.
+        """
+        key = array(TYPECODE, ids).tobytes()
+        return self._interned.setdefault(key, key)
+
+    def release(self) -> None:
+        """Release the interning index of the packed rule ids."""
+        self._interned = {}
+
+    def unpack(self, ids: RuleIds) -> Sequence[int]:
+        """Get the rule ids of packed rule ids."""
+        return memoryview(ids).cast(TYPECODE)
+
+    def rule(self, rule_id: int) -> R:
+        """Get the rule of an id."""
+        return self._rules[rule_id]
+
+    def rules(self, ids: RuleIds) -> list[R]:
+        """Get the rules of the packed rule ids."""
+        return [self._rules[i] for i in self.unpack(ids)]
@@ -6,13 +6,15 @@
 from collections.abc import Iterable
 import typing
 
-from . import exception, mixins, policyrep, query, util
+from . import exception, mixins, parallel, policyrep, query, util
 from .descriptors import CriteriaDescriptor, CriteriaSetDescriptor
+from .progress import track
 
 __all__: typing.Final[tuple[str, ...]] = ("TERuleQuery",)
 
 
-class TERuleQuery(mixins.MatchObjClass, mixins.MatchPermission, query.PolicyQuery):
+class TERuleQuery(mixins.MatchObjClass, mixins.MatchPermission, parallel.ParallelScan,
+                  query.PolicyQuery):
 
     """
     Query the Type Enforcement rules.
@@ -69,19 +71,28 @@ class TERuleQuery(mixins.MatchObjClass, mixins.MatchPermission, query.PolicyQuer
     """
 
     ruletype = CriteriaSetDescriptor[policyrep.TERuletype](enum_class=policyrep.TERuletype)
-    source = CriteriaDescriptor[policyrep.TypeOrAttr]("source_regex", "lookup_type_or_attr")
+    source = CriteriaDescriptor[policyrep.TypeOrAttr]("source_regex", "lookup_type_or_attr",
+                                                      regex_symbols=("types", "typeattributes"))
     source_regex: bool = False
     source_indirect: bool = True
-    target = CriteriaDescriptor[policyrep.TypeOrAttr]("target_regex", "lookup_type_or_attr")
+    _source_regex_matches: frozenset[str] | None = None
+    target = CriteriaDescriptor[policyrep.TypeOrAttr]("target_regex", "lookup_type_or_attr",
+                                                      regex_symbols=("types", "typeattributes"))
     target_regex: bool = False
     target_indirect: bool = True
-    default = CriteriaDescriptor[policyrep.Type]("default_regex", "lookup_type_or_attr")
+    _target_regex_matches: frozenset[str] | None = None
+    default = CriteriaDescriptor[policyrep.Type]("default_regex", "lookup_type_or_attr",
+                                                 regex_symbols=("types",))
     default_regex: bool = False
-    boolean = CriteriaSetDescriptor[policyrep.Boolean]("boolean_regex", "lookup_boolean")
+    _default_regex_matches: frozenset[str] | None = None
+    boolean = CriteriaSetDescriptor[policyrep.Boolean]("boolean_regex", "lookup_boolean",
+                                                       regex_symbols=("bools",))
     boolean_regex: bool = False
     boolean_equal: bool = False
+    _boolean_regex_matches: frozenset[str] | None = None
     _xperms: policyrep.XpermSet | None = None
     xperms_equal: bool = False
+    _shard_rules = "terules"
 
     @property
     def xperms(self) -> policyrep.XpermSet | None:
@@ -119,8 +130,16 @@ class TERuleQuery(mixins.MatchObjClass, mixins.MatchPermission, query.PolicyQuer
                 + self._build_object_class_repr_args() \
                 + self._build_perms_repr_args()
 
-    def results(self) -> Iterable[policyrep.AnyTERule]:
-        """Generator which yields all matching TE rules."""
+    def results(self, rules: Iterable[policyrep.AnyTERule] | None = None) -> \
+            Iterable[policyrep.AnyTERule]:
+        """
+        Generator which yields all matching TE rules.
+
+        Keyword Parameters:
+        rules       The TE rules to search, such as a prebuilt index of
+                    the policy's rules.  The default is all of the TE
+                    rules of the policy.
+        """
         self.log.info(f"Generating TE rule results from {self.policy}")
         self.log.debug(f"{self.ruletype=}")
         self.log.debug(f"{self.source=}, {self.source_indirect=}, {self.source_regex=}")
@@ -131,104 +150,119 @@ class TERuleQuery(mixins.MatchObjClass, mixins.MatchPermission, query.PolicyQuer
         self.log.debug(f"{self.default=}, {self.default_regex=}")
         self.log.debug(f"{self.boolean=}, {self.boolean_equal=}, {self.boolean_regex=}")
 
-        for rule in self.policy.terules():
-            #
-            # Matching on rule type
-            #
-            if self.ruletype:
-                if rule.ruletype not in self.ruletype:
-                    continue
-
-            #
-            # Matching on source type
-            #
-            if self.source and not util.match_indirect_regex(
-                    rule.source,
-                    self.source,
-                    self.source_indirect,
-                    self.source_regex):
-                continue
-
-            #
-            # Matching on target type
-            #
-            if self.target and not util.match_indirect_regex(
-                    rule.target,
-                    self.target,
-                    self.target_indirect,
-                    self.target_regex):
-                continue
-
-            #
-            # Matching on object class
-            #
-            if not self._match_object_class(rule):
-                continue
-
-            #
-            # Matching on permission set
-            #
+        yield from self._match_rules(track(self.progress, "Matching TE rules",
+                                           self.policy.terules() if rules is None else rules))
+
+    def _match_rules(self, rules: Iterable[policyrep.AnyTERule]) -> \
+            Iterable[policyrep.AnyTERule]:
+        """Generator which yields the TE rules matching the criteria."""
+        for rule in rules:
+            if self._match_rule(rule):
+                yield rule
+
+    def _match_rule(self, rule: policyrep.AnyTERule) -> bool:
+        """Return true if the TE rule matches the criteria."""
+        #
+        # Matching on rule type
+        #
+        if self.ruletype:
+            if rule.ruletype not in self.ruletype:
+                return False
+
+        #
+        # Matching on source type
+        #
+        if self.source and not util.match_indirect_regex(
+                rule.source,
+                self.source,
+                self.source_indirect,
+                self.source_regex,
+                self._source_regex_matches):
+            return False
+
+        #
+        # Matching on target type
+        #
+        if self.target and not util.match_indirect_regex(
+                rule.target,
+                self.target,
+                self.target_indirect,
+                self.target_regex,
+                self._target_regex_matches):
+            return False
+
+        #
+        # Matching on object class
+        #
+        if not self._match_object_class(rule):
+            return False
+
+        #
+        # Matching on permission set
+        #
+        try:
+            if self.perms and rule.extended:
+                if self.perms_equal and len(self.perms) > 1:
+                    # if criteria is more than one standard permission,
+                    # extended perm rules can never match if the
+                    # permission set equality option is on.
+                    return False
+
+                assert isinstance(rule, policyrep.AVRuleXperm), \
+                    "Rule is not an extended permission rule, this is an SETools bug."
+                if rule.xperm_type not in self.perms:
+                    return False
+            elif not self._match_perms(rule):
+                return False
+        except exception.RuleUseError:
+            return False
+
+        #
+        # Matching on extended permissions
+        #
+        try:
+            if self.xperms and not util.match_regex_or_set(
+                    rule.perms,
+                    self.xperms,
+                    self.xperms_equal,
+                    False):
+                return False
+
+        except exception.RuleUseError:
+            return False
+
+        #
+        # Matching on default type
+        #
+        if self.default:
             try:
-                if self.perms and rule.extended:
-                    if self.perms_equal and len(self.perms) > 1:
-                        # if criteria is more than one standard permission,
-                        # extended perm rules can never match if the
-                        # permission set equality option is on.
-                        continue
-
-                    assert isinstance(rule, policyrep.AVRuleXperm), \
-                        "Rule is not an extended permission rule, this is an SETools bug."
-                    if rule.xperm_type not in self.perms:
-                        continue
-                elif not self._match_perms(rule):
-                    continue
+                # because default type is always a single
+                # type, hard-code indirect to True
+                # so the criteria can be an attribute
+                if not util.match_indirect_regex(
+                        rule.default,
+                        self.default,
+                        True,
+                        self.default_regex,
+                        self._default_regex_matches):
+                    return False
             except exception.RuleUseError:
-                continue
+                return False
 
-            #
-            # Matching on extended permissions
-            #
+        #
+        # Match on Boolean in conditional expression
+        #
+        if self.boolean:
             try:
-                if self.xperms and not util.match_regex_or_set(
-                        rule.perms,
-                        self.xperms,
-                        self.xperms_equal,
-                        False):
-                    continue
+                if not util.match_regex_or_set(
+                        rule.conditional.booleans,
+                        self.boolean,
+                        self.boolean_equal,
+                        self.boolean_regex,
+                        self._boolean_regex_matches):
+                    return False
+            except exception.RuleNotConditional:
+                return False
 
-            except exception.RuleUseError:
-                continue
-
-            #
-            # Matching on default type
-            #
-            if self.default:
-                try:
-                    # because default type is always a single
-                    # type, hard-code indirect to True
-                    # so the criteria can be an attribute
-                    if not util.match_indirect_regex(
-                            rule.default,
-                            self.default,
-                            True,
-                            self.default_regex):
-                        continue
-                except exception.RuleUseError:
-                    continue
-
-            #
-            # Match on Boolean in conditional expression
-            #
-            if self.boolean:
-                try:
-                    if not util.match_regex_or_set(
-                            rule.conditional.booleans,
-                            self.boolean,
-                            self.boolean_equal,
-                            self.boolean_regex):
-                        continue
-                except exception.RuleNotConditional:
-                    continue
-
-            # if we get here, we have matched all available criteria
-            yield rule
+        # if we get here, we have matched all available criteria
+        return True
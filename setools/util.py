@@ -2,13 +2,14 @@
 #
 # SPDX-License-Identifier: LGPL-2.1-only
 #
-from collections.abc import Iterable
+from collections.abc import Container, Iterable
 from contextlib import suppress
 
 from . import exception, policyrep
 
 
-def match_regex(obj, criteria, regex: bool) -> bool:
+def match_regex(obj, criteria, regex: bool,
+                matches: Container[str] | None = None) -> bool:
     """
     Match the object with optional regular expression.
 
@@ -16,9 +17,15 @@ def match_regex(obj, criteria, regex: bool) -> bool:
     obj         The object to match.
     criteria    The criteria to match.
     regex       If regular expression matching should be used.
+    matches     Optional precomputed names of the symbols matching
+                the regular expression.  If set, this is used
+                instead of searching with the regular expression.
     """
 
     if regex:
+        if matches is not None:
+            return str(obj) in matches
+
         return bool(criteria.search(str(obj)))
     else:
         return obj == criteria
@@ -58,7 +65,8 @@ def match_in_set(obj, criteria, regex: bool) -> bool:
         return criteria in obj
 
 
-def match_indirect_regex(obj, criteria, indirect: bool, regex: bool) -> bool:
+def match_indirect_regex(obj, criteria, indirect: bool, regex: bool,
+                         matches: Container[str] | None = None) -> bool:
     """
     Match the object with optional regular expression and indirection.
 
@@ -68,18 +76,25 @@ def match_indirect_regex(obj, criteria, indirect: bool, regex: bool) -> bool:
     regex       If regular expression matching should be used.
     indirect    If object indirection should be used, e.g.
                 expanding an attribute.
+    matches     Optional precomputed names of the symbols matching
+                the regular expression.  If set, this is used
+                instead of searching with the regular expression.
     """
 
     if indirect:
         if regex:
+            if matches is not None:
+                return any(str(o) in matches for o in obj.expand())
+
             return bool([o for o in obj.expand() if criteria.search(str(o))])
         else:
             return bool(set(criteria.expand()).intersection(obj.expand()))
     else:
-        return match_regex(obj, criteria, regex)
+        return match_regex(obj, criteria, regex, matches)
 
 
-def match_regex_or_set(obj, criteria, equal: bool, regex: bool) -> bool:
+def match_regex_or_set(obj, criteria, equal: bool, regex: bool,
+                       matches: Container[str] | None = None) -> bool:
     """
     Match the object (a set) with either set comparisons
     (equality or intersection) or by regex matching of the
@@ -93,9 +108,15 @@ def match_regex_or_set(obj, criteria, equal: bool, regex: bool) -> bool:
                 any set intersection will match. Ignored
                 if regular expression matching is used.
     regex       If regular expression matching should be used.
+    matches     Optional precomputed names of the symbols matching
+                the regular expression.  If set, this is used
+                instead of searching with the regular expression.
     """
 
     if regex:
+        if matches is not None:
+            return any(str(m) in matches for m in obj)
+
         return bool([m for m in obj if criteria.search(str(m))])
     else:
         return match_set(obj, set(criteria), equal)
@@ -235,3 +256,40 @@ def xperm_str_to_tuple_ranges(perms: str, separator: str = ",") -> list[tuple[in
             raise ValueError(f"Unable to parse \"{item}\" for xperms.")
 
     return xperms
+
+
+def boolean_str_to_dict(booleans: str, separator: str = ",") -> dict[str, bool]:
+    """
+    Create a dictionary of boolean values from a string representation.
+
+    Parameters:
+    booleans    A string representation of boolean values, such as
+                "foo:true,bar:false", or "default" for the default values
+                of all booleans.
+
+    Keyword Parameters:
+    separator   The separator between boolean values.
+                Default is ","
+
+    Return:     Dict[str, bool] of the boolean names to their values.  It is
+                empty for the default values.
+    """
+
+    values: dict[str, bool] = {}
+    if booleans == "default":
+        return values
+
+    for item in booleans.split(separator):
+        try:
+            name, value = item.split(":")
+        except ValueError as ex:
+            raise ValueError("Expected boolean format foo:true,bar:false") from ex
+
+        if value.lower() == "true":
+            values[name] = True
+        elif value.lower() == "false":
+            values[name] = False
+        else:
+            raise ValueError("Conditional value must be true or false.")
+
+    return values
@@ -348,7 +348,11 @@ class ApolWorkspace(QtWidgets.QTabWidget):
                                               log=self.log,
                                               parent=self):
 
-            self.policy = setools.SELinuxPolicy(filename)
+            policy = setools.SELinuxPolicy(filename)
+            if self.policy:
+                widgets.context.release_policy_context(self.policy)
+
+            self.policy = policy
             self.policy_changed.emit(self.policy)
 
             if self.permmap:
@@ -368,6 +372,9 @@ class ApolWorkspace(QtWidgets.QTabWidget):
             if reply == QtWidgets.QMessageBox.StandardButton.No:
                 return
 
+        if self.policy:
+            widgets.context.release_policy_context(self.policy)
+
         self.policy = None
         self.clear()
 
@@ -0,0 +1,232 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+
+from collections.abc import Iterable
+import logging
+import sys
+import threading
+import typing
+import weakref
+
+import networkx as nx
+from PyQt6 import QtCore
+import setools
+
+from .nameindex import NameIndex
+
+__all__ = ("PolicyContext", "policy_context", "release_policy_context")
+
+# contexts of the open policies
+_contexts: dict[setools.SELinuxPolicy, "PolicyContext"] = {}
+
+
+def policy_context(policy: setools.SELinuxPolicy) -> "PolicyContext":
+    """Get the shared analysis context of a policy, creating it if needed."""
+    try:
+        return _contexts[policy]
+    except KeyError:
+        context = _contexts[policy] = PolicyContext(policy)
+        return context
+
+
+def release_policy_context(policy: setools.SELinuxPolicy) -> None:
+    """Release the shared analysis context of a policy, e.g. when it is closed."""
+    context = _contexts.pop(policy, None)
+    if context is not None:
+        context.clear()
+
+
+def _graph_size(graph: nx.DiGraph) -> int:
+    """Approximate memory use of a graph, excluding the policy objects."""
+    size = sys.getsizeof(graph)
+    for _, neighbors in graph.adjacency():
+        # successors and predecessors
+        size += 2 * sys.getsizeof(neighbors)
+
+    # edge attribute values, such as the rule ids, may be shared by
+    # edges, so each value is only counted once.
+    values = dict[int, typing.Any]()
+    for _, _, data in graph.edges(data=True):
+        size += sys.getsizeof(data)
+        values.update((id(v), v) for v in data.values())
+
+    return size + sum(sys.getsizeof(v) for v in values.values())
+
+
+class PolicyContext(QtCore.QObject):
+
+    """
+    Analysis data of a policy which is shared by all of the analysis tabs.
+
+    The data is built lazily, on the first query which uses it, and
+    then reused by all later queries of all tabs.  The methods are
+    thread safe, since they are called by the query workers.
+
+    Parameters:
+    policy      The policy.
+
+    Qt signals:
+    changed     Shared data was built or released.
+    """
+
+    changed = QtCore.pyqtSignal()
+
+    # descriptions of the shared data, in the order of memory_usage()
+    memory_usage_descriptions: typing.Final[tuple[str, ...]] = (
+        "Sorted components", "Name indexes", "TE rule index", "Information flow graphs",
+        "Domain transition graph")
+
+    def __init__(self, policy: setools.SELinuxPolicy) -> None:
+        super().__init__()
+        self.log: typing.Final = logging.getLogger(__name__)
+        self.policy: typing.Final = policy
+        self._lock = threading.RLock()
+        self._terules: dict[setools.TERuletype, tuple[setools.AnyTERule, ...]] | None = None
+        self._dta_graph: nx.DiGraph | None = None
+        # Graphs are dropped when their permission map is no longer used.
+        self._infoflow_graphs = weakref.WeakKeyDictionary[setools.PermissionMap, nx.DiGraph]()
+        self._components: dict[str, tuple] = {}
+        self._name_indexes: dict[tuple[str, ...], NameIndex] = {}
+
+    def components(self, kind: str) -> tuple:
+        """
+        Get the sorted components of the policy, e.g. "types" for the
+        types, as returned by the policy method of the same name.
+        """
+        with self._lock:
+            try:
+                return self._components[kind]
+            except KeyError:
+                components = self._components[kind] = tuple(sorted(getattr(self.policy, kind)()))
+                self.changed.emit()
+                return components
+
+    def name_index(self, *kinds: str) -> NameIndex:
+        """
+        Get the name index of the components of the policy, e.g.
+        name_index("typeattributes", "types") for the type and
+        attribute names.
+        """
+        with self._lock:
+            try:
+                return self._name_indexes[kinds]
+            except KeyError:
+                index = self._name_indexes[kinds] = NameIndex(
+                    str(c) for kind in kinds for c in getattr(self.policy, kind)())
+                self.changed.emit()
+                return index
+
+    def terules(self, ruletypes: Iterable[setools.TERuletype] | None = None) -> \
+            Iterable[setools.AnyTERule]:
+        """Get the TE rules of the policy, from the index of rules by rule type."""
+        with self._lock:
+            if self._terules is None:
+                self.log.info(f"Building TE rule index of {self.policy}.")
+                index: dict[setools.TERuletype, list[setools.AnyTERule]] = \
+                    {rt: [] for rt in setools.TERuletype}
+                for rule in self.policy.terules():
+                    index[rule.ruletype].append(rule)
+
+                self._terules = {rt: tuple(rules) for rt, rules in index.items()}
+                self.changed.emit()
+
+            terules = self._terules
+
+        for ruletype in ruletypes or setools.TERuletype:
+            yield from terules[ruletype]
+
+    def infoflow_graph(self, perm_map: setools.PermissionMap,
+                       progress: setools.Progress | None = None) -> nx.DiGraph:
+        """
+        Get the information flow graph for the permission map.  If the
+        graph is built, its progress is reported to the Progress, if set.
+
+        If the permission map was changed, or there is only a graph of
+        another permission map, that graph is updated for the changed
+        permissions rather than building a new graph.
+        """
+        with self._lock:
+            base = self._infoflow_graphs.get(perm_map)
+            if base is None and self._infoflow_graphs:
+                base = list(self._infoflow_graphs.values())[-1]
+
+            analysis = setools.InfoFlowAnalysis(self.policy, perm_map)
+            analysis.progress = progress
+            if base is not None:
+                analysis.use_graph(base)
+
+            graph = analysis.build_graph()
+            if graph is not base or perm_map not in self._infoflow_graphs:
+                self._infoflow_graphs[perm_map] = graph
+                self.changed.emit()
+
+            return graph
+
+    def dta_graph(self, progress: setools.Progress | None = None) -> nx.DiGraph:
+        """
+        Get the domain transition graph.  If the graph is built, its
+        progress is reported to the Progress, if set.
+        """
+        with self._lock:
+            if self._dta_graph is None:
+                analysis = setools.DomainTransitionAnalysis(self.policy)
+                analysis.progress = progress
+                self._dta_graph = analysis.build_graph()
+                self.changed.emit()
+
+            return self._dta_graph
+
+    def results(self, query: setools.PolicyQuery) -> Iterable:
+        """Run the query using the shared data, if the query can use it."""
+        if isinstance(query, setools.TERuleQuery):
+            return query.results(rules=self.terules(query.ruletype))
+
+        if isinstance(query, setools.InfoFlowAnalysis):
+            query.use_graph(self.infoflow_graph(query.perm_map, query.progress))
+        elif isinstance(query, setools.DomainTransitionAnalysis):
+            query.use_graph(self.dta_graph(query.progress))
+
+        return query.results()
+
+    def clear(self) -> None:
+        """Release all of the shared data."""
+        with self._lock:
+            self._terules = None
+            self._dta_graph = None
+            self._infoflow_graphs.clear()
+            self._components.clear()
+            self._name_indexes.clear()
+
+        self.changed.emit()
+
+    def memory_usage(self) -> dict[str, int]:
+        """
+        Get the approximate memory use of the shared data.  The graphs are
+        traversed, so this is slow if they are large.
+
+        Return:     A dictionary of the data description to its
+                    size in bytes.  The size is zero if the data
+                    has not been built.
+        """
+        with self._lock:
+            components = list(self._components.values())
+            terules = self._terules
+            dta_graph = self._dta_graph
+            infoflow_graphs = list(self._infoflow_graphs.values())
+            name_indexes = list(self._name_indexes.values())
+
+        rules_size = 0
+        if terules is not None:
+            for rules in terules.values():
+                rules_size += sys.getsizeof(rules) + sum(sys.getsizeof(r) for r in rules)
+
+        names_size = sum(sys.getsizeof(i.names) + sum(sys.getsizeof(n) for n in i.names)
+                         for i in name_indexes)
+
+        # the components are policy objects, so only the tuples are counted
+        components_size = sum(sys.getsizeof(c) for c in components)
+
+        return {"Sorted components": components_size,
+                "Name indexes": names_size,
+                "TE rule index": rules_size,
+                "Information flow graphs": sum(_graph_size(g) for g in infoflow_graphs),
+                "Domain transition graph": _graph_size(dta_graph) if dta_graph is not None else 0}
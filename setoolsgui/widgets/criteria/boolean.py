@@ -4,6 +4,7 @@ from PyQt6 import QtWidgets
 import setools
 
 from .. import models
+from ..context import policy_context
 from .combobox import ComboBoxWidget
 from .list import ListWidget
 from .name import NameWidget
@@ -21,7 +22,7 @@ class BooleanList(ListWidget):
     def __init__(self, title: str, query, attrname: str, enable_equal: bool = True,
                  parent: QtWidgets.QWidget | None = None) -> None:
 
-        model = models.BooleanTable(data=sorted(query.policy.bools()))
+        model = models.BooleanTable(data=list(policy_context(query.policy).components("bools")))
 
         super().__init__(title, query, attrname, model, enable_equal=enable_equal, parent=parent)
 
@@ -44,7 +45,7 @@ class BooleanName(NameWidget):
                  parent: QtWidgets.QWidget | None = None,
                  enable_regex: bool = True, required: bool = False):
 
-        completion: list[str] = sorted(b.name for b in query.policy.bools())
+        completion = policy_context(query.policy).name_index("bools")
 
         super().__init__(title, query, attrname, completion, VALIDATE_EXACT,
                          enable_regex=enable_regex, required=required, parent=parent)
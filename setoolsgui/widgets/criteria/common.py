@@ -3,6 +3,7 @@
 from PyQt6 import QtWidgets
 import setools
 
+from ..context import policy_context
 from .criteria import OptionsPlacement
 from .name import NameWidget
 
@@ -25,7 +26,7 @@ class CommonName(NameWidget):
                  required: bool = False, enable_regex: bool = True):
 
         # Create completion list
-        completion = list[str](r.name for r in query.policy.commons())
+        completion = policy_context(query.policy).name_index("commons")
 
         super().__init__(title, query, attrname, completion, VALIDATE_EXACT,
                          enable_regex=enable_regex, required=required, parent=parent,
@@ -3,6 +3,7 @@ import typing
 
 from PyQt6 import QtWidgets
 
+from ..context import policy_context
 from .name import NameWidget
 
 # Regex for exact matches
@@ -23,7 +24,7 @@ class CategoryName(NameWidget):
                  parent: QtWidgets.QWidget | None = None,
                  enable_regex: bool = True, required: bool = False):
 
-        completion: list[str] = sorted(b.name for b in query.policy.categories())
+        completion = policy_context(query.policy).name_index("categories")
 
         super().__init__(title, query, attrname, completion, CAT_VALIDATE_EXACT,
                          enable_regex=enable_regex, required=required, parent=parent)
@@ -40,7 +41,7 @@ class SensitivityName(NameWidget):
                  parent: QtWidgets.QWidget | None = None,
                  enable_regex: bool = True, required: bool = False):
 
-        completion: list[str] = sorted(b.name for b in query.policy.sensitivities())
+        completion = policy_context(query.policy).name_index("sensitivities")
 
         super().__init__(title, query, attrname, completion, SEN_VALIDATE_EXACT,
                          enable_regex=enable_regex, required=required, parent=parent)
@@ -1,15 +1,61 @@
 # SPDX-License-Identifier: LGPL-2.1-only
 
+from collections.abc import Iterable
 from contextlib import suppress
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
+from ..nameindex import NameIndex
 from .criteria import CriteriaWidget, OptionsPlacement
 
 # regex default setting (unchecked)
 REGEX_DEFAULT_CHECKED = False
 
-__all__ = ('NameWidget',)
+# maximum number of completions shown
+COMPLETION_LIMIT = 1000
+
+__all__ = ('NameCompleter', 'NameWidget',)
+
+
+class NameCompleter(QtWidgets.QCompleter):
+
+    """
+    A completer which searches a NameIndex.  Names starting with the text
+    are listed first, followed by names containing the text.  In regex
+    mode, the names matching the regular expression are listed, as a
+    preview of the regular expression.
+    """
+
+    def __init__(self, index: NameIndex, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self.regex = False
+        self.completion_model = QtCore.QStringListModel(self)
+        self.setModel(self.completion_model)
+        self.index = index
+
+    @property
+    def index(self) -> NameIndex:
+        return self._index
+
+    @index.setter
+    def index(self, index: NameIndex) -> None:
+        self._index = index
+        self.completion_model.setStringList(index.names[:COMPLETION_LIMIT])
+
+    # @typing.override
+    def splitPath(self, path: str | None) -> list[str]:
+        """Update the completions for the text, instead of filtering the model."""
+        path = path or ""
+        if self.regex:
+            names = self.index.regex(path, COMPLETION_LIMIT)
+        else:
+            names = self.index.search(path, COMPLETION_LIMIT)
+
+        if names != self.completion_model.stringList():
+            self.completion_model.setStringList(names)
+
+        # all of the names in the model are completions
+        return [""]
 
 
 class NameWidget(CriteriaWidget):
@@ -32,7 +78,7 @@ class NameWidget(CriteriaWidget):
     # Overridden methods
     #
 
-    def __init__(self, title: str, query, attrname: str, completion: list[str],
+    def __init__(self, title: str, query, attrname: str, completion: Iterable[str] | NameIndex,
                  validation: str = "", enable_regex: bool = True,
                  required: bool = False,
                  options_placement: OptionsPlacement = OptionsPlacement.RIGHT,
@@ -66,12 +112,11 @@ class NameWidget(CriteriaWidget):
         self.top_layout.addWidget(self.criteria, 0, 0)
 
         # Create completer for LineEdit
+        if not isinstance(completion, NameIndex):
+            completion = NameIndex(completion)
+
         if completion:
-            completer_model = QtCore.QStringListModel(self)
-            completer_model.setStringList(sorted(completion))
-            completer = QtWidgets.QCompleter()
-            completer.setModel(completer_model)
-            self.criteria.setCompleter(completer)
+            self.criteria.setCompleter(NameCompleter(completion, self))
 
         # Create validators for LineEdit
         if validation:
@@ -196,6 +241,10 @@ class NameWidget(CriteriaWidget):
         self.log.debug(f"Setting {self.criteria_regex.objectName()} {state}")
         setattr(self.query, self.criteria_regex.objectName(), state)
 
+        completer = self.criteria.completer()
+        if isinstance(completer, NameCompleter):
+            completer.regex = state
+
         # reset criteria for the regex mode change
         self.clear_criteria_error()
         self.set_criteria()
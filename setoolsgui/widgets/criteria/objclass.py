@@ -5,6 +5,7 @@ from PyQt6 import QtWidgets
 import setools
 
 from .. import models
+from ..context import policy_context
 from .criteria import OptionsPlacement
 from .list import ListWidget
 from .name import NameWidget
@@ -23,7 +24,7 @@ class ObjClassList(ListWidget):
                  enable_equal: bool = False, enable_subset: bool = False,
                  parent: QtWidgets.QWidget | None = None) -> None:
 
-        model = models.ObjClassTable(data=sorted(query.policy.classes()))
+        model = models.ObjClassTable(data=list(policy_context(query.policy).components("classes")))
 
         super().__init__(title, query, attrname, model, enable_equal=enable_equal,
                          enable_subset=enable_subset, parent=parent)
@@ -45,7 +46,7 @@ class ObjClassName(NameWidget):
                  required: bool = False, enable_regex: bool = True):
 
         # Create completion list
-        completion = list[str](r.name for r in query.policy.classes())
+        completion = policy_context(query.policy).name_index("classes")
 
         super().__init__(title, query, attrname, completion, VALIDATE_EXACT,
                          enable_regex=enable_regex, required=required, parent=parent,
@@ -4,6 +4,7 @@ from PyQt6 import QtCore, QtWidgets
 import setools
 
 from .. import models
+from ..context import policy_context
 from .criteria import OptionsPlacement
 from .list import ListWidget
 from .name import NameWidget
@@ -22,7 +23,7 @@ class RoleList(ListWidget):
                  enable_equal: bool = False, enable_subset: bool = False,
                  parent: QtWidgets.QWidget | None = None) -> None:
 
-        model = models.RoleTable(data=sorted(query.policy.roles()))
+        model = models.RoleTable(data=list(policy_context(query.policy).components("roles")))
 
         super().__init__(title, query, attrname, model, enable_equal=enable_equal,
                          enable_subset=enable_subset, parent=parent)
@@ -46,7 +47,7 @@ class RoleName(NameWidget):
                  required: bool = False, enable_regex: bool = True):
 
         # Create completion list
-        completion = list[str](r.name for r in query.policy.roles())
+        completion = policy_context(query.policy).name_index("roles")
 
         super().__init__(title, query, attrname, completion, VALIDATE_EXACT,
                          enable_regex=enable_regex, required=required, parent=parent,
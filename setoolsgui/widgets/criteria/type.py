@@ -1,16 +1,16 @@
 # SPDX-License-Identifier: LGPL-2.1-only
 
 from contextlib import suppress
-import itertools
 import typing
 
 from PyQt6 import QtCore, QtWidgets
 import setools
 
 from .. import models
+from ..context import policy_context
 from .criteria import CriteriaWidget, OptionsPlacement
 from .list import ListWidget
-from .name import NameWidget
+from .name import NameCompleter, NameWidget
 
 # permissive default setting (not checked)
 PERMISSIVE_DEFAULT_CHECKED: typing.Final[bool] = False
@@ -77,7 +77,7 @@ class TypeList(ListWidget):
                  enable_equal: bool = False, enable_subset: bool = False,
                  parent: QtWidgets.QWidget | None = None) -> None:
 
-        model = models.TypeTable(data=sorted(query.policy.types()))
+        model = models.TypeTable(data=list(policy_context(query.policy).components("types")))
 
         super().__init__(title, query, attrname, model, enable_equal=enable_equal,
                          enable_subset=enable_subset, parent=parent)
@@ -102,7 +102,7 @@ class TypeName(NameWidget):
                  required: bool = False):
 
         # Create completion list
-        completion = list[str](t.name for t in query.policy.types())
+        completion = policy_context(query.policy).name_index("types")
 
         super().__init__(title, query, attrname, completion, VALIDATE_EXACT,
                          enable_regex=enable_regex, required=required,
@@ -176,13 +176,9 @@ class TypeOrAttrName(TypeName):
 
         # add attributes to completion list
         completer = self.criteria.completer()
-        assert completer, "Completer not set, this is an SETools bug."
-        model = typing.cast(QtCore.QStringListModel, completer.model())
-        assert model, "Model not set, this is an SETools bug."
-        model.setStringList(sorted(itertools.chain(
-            (a.name for a in query.policy.typeattributes()),
-            (t.name for t in query.policy.types())
-        )))
+        assert isinstance(completer, NameCompleter), \
+            "Completer not set, this is an SETools bug."
+        completer.index = policy_context(query.policy).name_index("typeattributes", "types")
 
 
 if __name__ == '__main__':
@@ -6,6 +6,7 @@ from PyQt6 import QtWidgets
 import setools
 
 from .. import models
+from ..context import policy_context
 from .criteria import OptionsPlacement
 from .list import ListWidget
 from .name import NameWidget
@@ -24,7 +25,8 @@ class TypeAttributeList(ListWidget):
                  enable_equal: bool = False, enable_subset: bool = False,
                  parent: QtWidgets.QWidget | None = None) -> None:
 
-        model = models.TypeAttributeTable(data=sorted(query.policy.typeattributes()))
+        model = models.TypeAttributeTable(
+            data=list(policy_context(query.policy).components("typeattributes")))
 
         super().__init__(title, query, attrname, model, enable_equal=enable_equal,
                          enable_subset=enable_subset, parent=parent)
@@ -46,7 +48,7 @@ class TypeAttributeName(NameWidget):
                  enable_regex: bool = False, required: bool = False):
 
         # Create completion list
-        completion = list[str](t.name for t in query.policy.typeattributes())
+        completion = policy_context(query.policy).name_index("typeattributes")
 
         super().__init__(title, query, attrname, completion, VALIDATE_EXACT,
                          enable_regex=enable_regex, required=required,
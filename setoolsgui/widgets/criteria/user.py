@@ -3,6 +3,7 @@
 from PyQt6 import QtCore, QtWidgets
 import setools
 
+from ..context import policy_context
 from .criteria import OptionsPlacement
 from .name import NameWidget
 
@@ -27,7 +28,7 @@ class UserName(NameWidget):
                  required: bool = False, enable_regex: bool = True):
 
         # Create completion list
-        completion = list[str](u.name for u in query.policy.users())
+        completion = policy_context(query.policy).name_index("users")
 
         super().__init__(title, query, attrname, completion, VALIDATE_EXACT,
                          enable_regex=enable_regex, required=required,
@@ -1,5 +1,7 @@
 # SPDX-License-Identifier: LGPL-2.1-only
 
+import collections
+
 from PyQt6 import QtGui, QtWidgets
 import setools
 
@@ -15,6 +17,7 @@ def type_detail(type_: setools.Type, parent: QtWidgets.QWidget | None = None) ->
 
     attrs = list[setools.TypeAttribute](sorted(type_.attributes()))
     aliases = list[str](sorted(type_.aliases()))
+    rule_counts = collections.Counter(str(r.ruletype) for r in type_.rules())
 
     util.display_object_details(
         f"{type_} Details",
@@ -34,6 +37,11 @@ def type_detail(type_: setools.Type, parent: QtWidgets.QWidget | None = None) ->
         <ul>
         {"".join(f"<li>{a}</li>" for a in aliases)}
         </ul>
+
+        <h2>TE Rules ({rule_counts.total()})</h2>
+        <ul>
+        {"".join(f"<li>{rt}: {n}</li>" for rt, n in sorted(rule_counts.items()))}
+        </ul>
         """,
         parent)
 
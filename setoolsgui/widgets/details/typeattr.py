@@ -1,5 +1,7 @@
 # SPDX-License-Identifier: LGPL-2.1-only
 
+import collections
+
 from PyQt6 import QtGui, QtWidgets
 import setools
 
@@ -13,6 +15,7 @@ def typeattr_detail(attr: setools.TypeAttribute, parent: QtWidgets.QWidget | Non
     """Display a dialog with type attribute details."""
 
     types = list[setools.Type](sorted(attr.expand()))
+    rule_counts = collections.Counter(str(r.ruletype) for r in attr.rules())
 
     util.display_object_details(
         f"{attr} Details",
@@ -24,6 +27,11 @@ def typeattr_detail(attr: setools.TypeAttribute, parent: QtWidgets.QWidget | Non
         <ul>
         {"".join(f"<li>{t}</li>" for t in types)}
         </ul>
+
+        <h2>TE Rules ({rule_counts.total()})</h2>
+        <ul>
+        {"".join(f"<li>{rt}: {n}</li>" for rt, n in sorted(rule_counts.items()))}
+        </ul>
         """,
         parent)
 
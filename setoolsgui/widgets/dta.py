@@ -174,9 +174,12 @@ class DomainTransitionAnalysisTab(tab.DirectedGraphResultTab[setools.DomainTrans
         if mode in self.query.DIRECT_MODES:
             results.setTabEnabled(tab.DirectedGraphResultTab.ResultTab.Tree, True)
             self.worker.render = DomainTransitionAnalysisTab.render_direct_path
-        else:
+        elif mode in self.query.TRANSITIVE_MODES:
             results.setTabEnabled(tab.DirectedGraphResultTab.ResultTab.Tree, False)
             self.worker.render = DomainTransitionAnalysisTab.render_transitive_path
+        else:  # union of all paths, which has individual steps
+            results.setTabEnabled(tab.DirectedGraphResultTab.ResultTab.Tree, False)
+            self.worker.render = DomainTransitionAnalysisTab.render_direct_path
 
     def _apply_result_limit(self, value: int = DEFAULT_RESULT_LIMIT) -> None:
         """Apply result limit change."""
@@ -240,6 +243,11 @@ class DTAMode(criteria.RadioEnumWidget[setools.DomainTransitionAnalysis.Mode]):
 
     """Domain transition analysis mode radio buttons."""
 
+    # modes which use the depth limit spinbox
+    PATH_MODES: typing.Final[tuple[setools.DomainTransitionAnalysis.Mode, ...]] = (
+        setools.DomainTransitionAnalysis.Mode.AllPaths,
+        setools.DomainTransitionAnalysis.Mode.AllPathsSubgraph)
+
     def __init__(self, query: setools.DomainTransitionAnalysis,
                  parent: QtWidgets.QWidget | None = None) -> None:
 
@@ -266,14 +274,15 @@ class DTAMode(criteria.RadioEnumWidget[setools.DomainTransitionAnalysis.Mode]):
             "Layout position is None, this is an SETools bug."  # type narrowing
         assert row >= 0 and col >= 0, \
             f"Invalid layout position, this is an SETools bug. ({row},{col})"
-        # add steps spin box in the next column of the radio button
-        self.top_layout.addWidget(self.depth_limit, row, col + 1, 1, 1)
+        # add steps spin box in the next column of the radio button, spanning
+        # the union of all paths radio button, which is on the next row.
+        self.top_layout.addWidget(self.depth_limit, row, col + 1, 2, 1)
 
         # set path steps to enable only if the corresponding mode is selected.
         # it starts disabled since shortest paths is the default option.
-        self._apply_depth_limit_from_mode_change(False)
-        self.criteria[setools.DomainTransitionAnalysis.Mode.AllPaths].toggled.connect(
-            self._apply_depth_limit_from_mode_change)
+        self._apply_depth_limit_from_mode_change()
+        for mode in self.PATH_MODES:
+            self.criteria[mode].toggled.connect(self._apply_depth_limit_from_mode_change)
 
     def _apply_depth_limit(self, value: int = DEFAULT_DEPTH_LIMIT) -> None:
         """Apply the value of the all paths spinbox to the query."""
@@ -281,9 +290,14 @@ class DTAMode(criteria.RadioEnumWidget[setools.DomainTransitionAnalysis.Mode]):
         self.log.debug(f"All paths max steps to {value} steps.")
         self.query.depth_limit = value
 
-    def _apply_depth_limit_from_mode_change(self, value: bool) -> None:
+    def _apply_depth_limit_from_mode_change(self, _: bool = False) -> None:
         """After a mode change, force the depth limit to 1 if not using all flows."""
-        if value:  # All paths mode is enabled
+        enabled = any(self.criteria[mode].isChecked() for mode in self.PATH_MODES)
+        if enabled == self.depth_limit.isEnabled():
+            # no change, e.g. switching between the all paths modes
+            return
+
+        if enabled:  # An all paths mode is selected
             self.depth_limit.setValue(self.last_depth_limit)
             self.depth_limit.setEnabled(True)
         else:  # Another mode is selected
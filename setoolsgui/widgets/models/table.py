@@ -19,10 +19,33 @@ __all__ = ("SEToolsTableModel", "StringList")
 # pylint: disable=invalid-metaclass
 class SEToolsTableModel(QtCore.QAbstractTableModel, typing.Generic[T], metaclass=MetaclassFix):
 
-    """Base class for SETools table models, modeling a list in a tabular form."""
+    """
+    Base class for SETools table models, modeling a list in a tabular form.
+
+    Items added by extend() are added to the view lazily, in batches
+    of fetch_batch_size rows, as the view scrolls to them.
+
+    While results_pending is set, the items are results of a query which
+    are still being generated, e.g. by a QueryResultsUpdater.  Once the
+    added items are exhausted, fetchMore() requests the next batch of
+    results by the fetch_requested signal.  end_results() marks the
+    results as complete.
+
+    Qt signals:
+    fetch_requested
+                (bool) More results are requested.  If true, all of the
+                remaining results are requested, otherwise the next batch.
+    completed   All of the results have been added.
+    """
+
+    fetch_requested = QtCore.pyqtSignal(bool)
+    completed = QtCore.pyqtSignal()
 
     headers: typing.List[str]
 
+    # The number of rows added to the view by each fetchMore().
+    fetch_batch_size: int = 1000
+
     def __init__(self, /, parent: QtCore.QObject | None = None, *,
                  data: typing.Iterable[T] | None = None):
 
@@ -33,6 +56,16 @@ class SEToolsTableModel(QtCore.QAbstractTableModel, typing.Generic[T], metaclass
         else:
             self._item_list = []
 
+        # the number of items which are rows of the model
+        self._fetched = len(self._item_list)
+
+        # more results are being generated
+        self.results_pending = False
+        # a batch of results has been requested but not added yet
+        self._requested = False
+        # all of the results have been requested
+        self._fetch_all = False
+
     #
     # Add/remove/set model data
     #
@@ -45,21 +78,68 @@ class SEToolsTableModel(QtCore.QAbstractTableModel, typing.Generic[T], metaclass
     def item_list(self, item_list: typing.List[T]) -> None:
         self.beginResetModel()
         self._item_list = item_list
+        self._fetched = len(item_list)
+        self._requested = False
+        self._fetch_all = False
         self.endResetModel()
 
     def append(self, item: T) -> None:
         """Append the item to the list."""
+        if self._fetched < len(self.item_list):
+            # rows are pending; this will be fetched with them.
+            self.item_list.append(item)
+            return
+
         index = self.rowCount()
         self.beginInsertRows(QtCore.QModelIndex(), index, index)
         self.item_list.append(item)
+        self._fetched += 1
         self.endInsertRows()
 
+    def extend(self, items: typing.Iterable[T]) -> None:
+        """
+        Append the items to the list.  The items are added as rows
+        by fetchMore(), except for the first batch and requested
+        results, which are added immediately.
+        """
+        requested = self._requested
+        self._requested = False
+        self.item_list.extend(items)
+        if self._fetch_all:
+            self.fetch_all()
+        elif requested or self._fetched < self.fetch_batch_size:
+            self._add_rows()
+
+    def end_results(self) -> None:
+        """Mark the pending results as complete."""
+        self.results_pending = False
+        self._requested = False
+        self._fetch_all = False
+        self.completed.emit()
+
+    def fetch_all(self) -> None:
+        """
+        Add all of the items as rows of the model, and request all of
+        the remaining pending results, which are added as rows immediately.
+        """
+        while self._fetched < len(self.item_list):
+            self._add_rows()
+
+        if self.results_pending and not self._fetch_all:
+            self._fetch_all = True
+            self.fetch_requested.emit(True)
+
     def remove(self, item: T) -> None:
         """Remove the first instance of the specified item from the list."""
         try:
             row = self.item_list.index(item)
+            if row >= self._fetched:
+                del self.item_list[row]
+                return
+
             self.beginRemoveRows(QtCore.QModelIndex(), row, row)
             del self.item_list[row]
+            self._fetched -= 1
             self.endRemoveRows()
         except ValueError:
             self.log.debug(f"Attempted to remove item {item!r} but it is not in the list")
@@ -77,7 +157,40 @@ class SEToolsTableModel(QtCore.QAbstractTableModel, typing.Generic[T], metaclass
 
     def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
         """The number of rows in the model."""
-        return len(self.item_list)
+        return self._fetched
+
+    def canFetchMore(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        """
+        Determine if there are items which are not yet rows of the model,
+        or results which can be requested.
+        """
+        return not parent.isValid() and (
+            self._fetched < len(self.item_list) or
+            (self.results_pending and not (self._requested or self._fetch_all)))
+
+    def fetchMore(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> None:
+        """
+        Add the next batch of items as rows of the model.  If there are
+        none, request the next batch of pending results.
+        """
+        if parent.isValid():
+            return
+
+        if self._fetched < len(self.item_list):
+            self._add_rows()
+        elif self.results_pending and not (self._requested or self._fetch_all):
+            self._requested = True
+            self.fetch_requested.emit(False)
+
+    def _add_rows(self) -> None:
+        """Add the next batch of items as rows of the model."""
+        count = min(self.fetch_batch_size, len(self.item_list) - self._fetched)
+        if count <= 0:
+            return
+
+        self.beginInsertRows(QtCore.QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
 
     def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
         """The number of columns in the model."""
@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+
+from array import array
+import bisect
+from collections.abc import Iterable, Iterator
+import itertools
+import re
+import typing
+
+__all__ = ("NameIndex",)
+
+
+class NameIndex:
+
+    """
+    Sorted index of names, such as the type names of a policy, for
+    prefix, substring, and regular expression searches.
+
+    Prefix searches are a binary search of the sorted names.  Substring
+    searches use an index of the n-grams of the names to find the
+    candidate names, which is built on the first substring search.
+
+    Parameters:
+    names       The names to index.
+    """
+
+    # length of the n-grams in the substring index
+    NGRAM: typing.Final[int] = 3
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self.names: typing.Final[tuple[str, ...]] = tuple(sorted(set(names)))
+        self._ngrams: dict[str, array] | None = None
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+
+        i = bisect.bisect_left(self.names, name)
+        return i < len(self.names) and self.names[i] == name
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} of {len(self.names)} names>"
+
+    def _ngram_index(self) -> dict[str, array]:
+        """Get the index of n-grams to the indexes of the names containing them."""
+        if self._ngrams is None:
+            ngrams: dict[str, array] = {}
+            for i, name in enumerate(self.names):
+                for ngram in {name[j:j + self.NGRAM] for j in range(len(name) - self.NGRAM + 1)}:
+                    ngrams.setdefault(ngram, array("l")).append(i)
+
+            self._ngrams = ngrams
+
+        return self._ngrams
+
+    def prefix(self, text: str, limit: int | None = None) -> list[str]:
+        """Get the names starting with the text, in sorted order."""
+        start = bisect.bisect_left(self.names, text)
+        matches = itertools.takewhile(lambda n: n.startswith(text),
+                                      itertools.islice(self.names, start, None))
+        return list(itertools.islice(matches, limit))
+
+    def substring(self, text: str, limit: int | None = None) -> list[str]:
+        """Get the names containing the text, in sorted order."""
+        if len(text) < self.NGRAM:
+            candidates: Iterable[str] = self.names
+        else:
+            ngrams = self._ngram_index()
+            postings = sorted((ngrams.get(text[j:j + self.NGRAM], array("l"))
+                               for j in range(len(text) - self.NGRAM + 1)), key=len)
+
+            # intersect, starting with the fewest names
+            indexes = set(postings[0])
+            for posting in postings[1:]:
+                if not indexes:
+                    break
+
+                indexes.intersection_update(posting)
+
+            candidates = (self.names[i] for i in sorted(indexes))
+
+        return list(itertools.islice((n for n in candidates if text in n), limit))
+
+    def search(self, text: str, limit: int | None = None) -> list[str]:
+        """
+        Get the names matching the text for completion.  The names starting
+        with the text are first, followed by the other names containing the
+        text, each in sorted order.
+        """
+        matches = self.prefix(text, limit)
+        if limit is None or len(matches) < limit:
+            remaining = None if limit is None else limit - len(matches)
+            matches.extend(itertools.islice(
+                (n for n in self.substring(text) if not n.startswith(text)), remaining))
+
+        return matches
+
+    def regex(self, pattern: str, limit: int | None = None) -> list[str]:
+        """
+        Get the names matching the regular expression, in sorted order.
+        An invalid regular expression matches no names.
+        """
+        try:
+            regex = re.compile(pattern)
+        except re.error:
+            return []
+
+        return list(itertools.islice((n for n in self.names if regex.search(n)), limit))
@@ -3,14 +3,19 @@
 # SPDX-License-Identifier: LGPL-2.1-only
 #
 #
+import io
 import logging
+import subprocess
+import threading
 import typing
 
 import networkx as nx
-from PyQt6 import QtCore, QtGui, QtWidgets
+from PyQt6 import QtCore
 import setools
+from setools.graphexport import write_dot
 
 from . import models
+from .context import PolicyContext
 
 Q = typing.TypeVar("Q", bound=setools.PolicyQuery)
 R = typing.TypeVar("R")  # type of result from query
@@ -27,28 +32,56 @@ class QueryResultsUpdater(QtCore.QObject, typing.Generic[Q, R]):
 
     Parameters:
     query       The query object
-    model       The model for the results
 
     Keyword Parameters:
+    table_model The table model to add the results to.
+    graphical_results
+                If true, the query is a DirectedGraphAnalysis and its
+                graphical results are sent by the graph signal.
+    context     The shared analysis context of the policy.  If set, the
+                query is run using the context's shared data.
     render      A two parameter function that renders each item returned
                 from the query to a string.  This is added to the raw output
                 widgets.  The default is equivalent to str().
+    result_limit
+                The maximum number of results.  The default is unlimited.
+    batch_size  The number of results sent to the result widgets at a time.
+
+    If there is a table model, the results are pulled from the query
+    lazily: after each batch, the update pauses until the model requests
+    more results by its fetch_requested signal.  The model's end_results()
+    is called when the update finishes or fails.
 
     Qt signals:
     failed      (str) The updated failed, with an error message.
     finished    (int) The update has completed, with the number of results.
-    raw_line    (str) A string to be appended to the raw results.
+    paused      (int) The update is waiting for more results to be
+                requested, with the number of results so far.
+    raw_lines   (str) Lines to be appended to the raw results.
+    result_batch
+                (list) A batch of results to be added to the table model.
+    graph       (nx.DiGraph) The graphical results, to be rendered by a
+                GraphRenderer.
+    progress    (str, int, int) The progress of the query, with the phase,
+                the count of items processed, and the total items, or -1
+                if the total is unknown.
     """
 
     failed = QtCore.pyqtSignal(str)
     finished = QtCore.pyqtSignal(int)
-    raw_line = QtCore.pyqtSignal(str)
+    paused = QtCore.pyqtSignal(int)
+    raw_lines = QtCore.pyqtSignal(str)
+    result_batch = QtCore.pyqtSignal(list)
+    graph = QtCore.pyqtSignal(object)
+    progress = QtCore.pyqtSignal(str, int, int)
 
     def __init__(self, query: Q, /, *,
                  table_model: models.SEToolsTableModel | None = None,
-                 graphics_buffer: QtWidgets.QLabel | None = None,
+                 graphical_results: bool = False,
+                 context: PolicyContext | None = None,
                  render: RenderFunction = lambda _, x: str(x),
-                 result_limit: int = 0) -> None:
+                 result_limit: int = 0,
+                 batch_size: int = 1000) -> None:
 
         super().__init__()
         self.log: typing.Final = logging.getLogger(query.__module__)
@@ -56,18 +89,88 @@ class QueryResultsUpdater(QtCore.QObject, typing.Generic[Q, R]):
         self.table_model = table_model
         self.render = render
         self.result_limit = result_limit
-        self.graphics_buffer = graphics_buffer
+        self.batch_size = batch_size
+        self.graphical_results = graphical_results
+        self.context = context
+
+        # requests for more results from the table model
+        self._requests = threading.Semaphore(0)
+        self._request_all = False
+        self._stopped = False
+
+        if table_model is not None:
+            # The model is updated in its own thread by these queued signals.
+            self.result_batch.connect(table_model.extend)
+            self.finished.connect(table_model.end_results)
+            self.failed.connect(table_model.end_results)
+            # The update is blocked waiting for the request, so this must
+            # be a direct connection.
+            table_model.fetch_requested.connect(  # type: ignore[call-arg]
+                self.request_results, QtCore.Qt.ConnectionType.DirectConnection)
+
+    def request_results(self, all_results: bool) -> None:
+        """
+        Request the next batch of results, or all of the remaining results.
+        This is thread-safe.
+        """
+        if all_results:
+            self._request_all = True
+
+        self._requests.release()
+
+    def stop(self) -> None:
+        """
+        Stop a paused update without sending any further signals.
+        This is thread-safe.
+        """
+        self._stopped = True
+        self._requests.release()
+
+    def _wait_for_request(self, this_thread: QtCore.QThread) -> None:
+        """Wait until more results are requested, or the thread is interrupted."""
+        while not self._request_all and not this_thread.isInterruptionRequested():
+            if self._requests.acquire(timeout=0.1):
+                break
+
+    def _send_batch(self, results: list, lines: list[str]) -> None:
+        """Send a batch of results to the result widgets."""
+        if self.table_model is not None and results:
+            self.result_batch.emit(results)
+
+        if lines:
+            self.raw_lines.emit("\n".join(lines))
+
+    def _report_progress(self, phase: str, count: int, total: int | None) -> None:
+        """Progress callback of the query."""
+        self.progress.emit(phase, count, -1 if total is None else total)
+
+        this_thread = QtCore.QThread.currentThread()
+        assert this_thread, "Unable to get current thread, this is an SETools bug"
+        if this_thread.isInterruptionRequested() and self.query.progress:
+            self.query.progress.cancel()
 
     def update(self) -> None:
         """Run the query and update results."""
         results: typing.List = []
+        lines: list[str] = []
         counter = 0
+        self._requests = threading.Semaphore(0)
+        self._request_all = False
+        self._stopped = False
+
+        # Report the progress of long phases, such as building graphs,
+        # and stop them if the thread is interrupted.
+        self.query.progress = setools.Progress(self._report_progress, interval=100)
 
         try:
-            for counter, item in enumerate(self.query.results(), start=1):
-                results.append(item)
+            query_results = self.context.results(self.query) if self.context else \
+                self.query.results()
+
+            for counter, item in enumerate(query_results, start=1):
+                if self.table_model is not None:
+                    results.append(item)
 
-                self.raw_line.emit(self.render(counter, item))
+                lines.append(self.render(counter, item))
 
                 this_thread = QtCore.QThread.currentThread()
                 # type narrowing:
@@ -79,27 +182,39 @@ class QueryResultsUpdater(QtCore.QObject, typing.Generic[Q, R]):
                     # yield execution every 10 rules
                     QtCore.QThread.yieldCurrentThread()
 
+                if counter % self.batch_size == 0:
+                    self._send_batch(results, lines)
+                    results = []
+                    lines = []
+
+                    if self.table_model is not None and not self._request_all:
+                        self.paused.emit(counter)
+                        self._wait_for_request(this_thread)
+                        if self._stopped:
+                            self.log.info(f"Stopped after {counter} results.")
+                            return
+
                 if counter % 1000 == 0:
                     self.log.info(f"Generated {counter} results so far.")
 
                 if self.result_limit and counter >= self.result_limit:
                     break
 
+            self._send_batch(results, lines)
             self.log.info(f"Generated {counter} total results.")
 
-            if self.table_model:
-                self.log.info("Updating results in table model.")
-                self.table_model.item_list = results
-
-            if self.graphics_buffer:
+            if self.graphical_results:
                 assert isinstance(self.query, setools.query.DirectedGraphAnalysis)
                 self.log.info("Generating graphical results.")
-                self.graphics_buffer.clear()
-                pgv = nx.nx_agraph.to_agraph(self.query.graphical_results())
-                pic = QtGui.QPixmap()
-                pic.loadFromData(pgv.draw(prog="dot", format="png"), "PNG")
-                self.graphics_buffer.setPixmap(pic)
+                # Layout and rendering are done separately by a GraphRenderer,
+                # so the text results are not delayed by it.
+                self.graph.emit(self.query.graphical_results())
+
+            self.finished.emit(counter)
 
+        except setools.exception.AnalysisCanceled as e:
+            self.log.info(str(e))
+            self._send_batch(results, lines)
             self.finished.emit(counter)
 
         except Exception as e:
@@ -108,6 +223,113 @@ class QueryResultsUpdater(QtCore.QObject, typing.Generic[Q, R]):
             self.failed.emit(msg)
 
 
+def summarize_graph(graph: nx.DiGraph) -> nx.DiGraph:
+    """
+    Summarize a graph by condensing each strongly connected component
+    to one node.  The node is named for the first member of the component,
+    with the count of the other members.
+    """
+    condensed = nx.condensation(graph)
+    names: dict[int, str] = {}
+    for node, members in condensed.nodes(data="members"):
+        ordered = sorted(str(m) for m in members)
+        names[node] = ordered[0] if len(ordered) == 1 else f"{ordered[0]} (+{len(ordered) - 1})"
+
+    return nx.relabel_nodes(condensed, names)
+
+
+class GraphRenderer(QtCore.QObject):
+
+    """
+    Thread for rendering a graph to a PNG image with Graphviz dot.
+
+    Graphs with more nodes or edges than the limits are summarized by
+    summarize_graph() first, unless full is set.  If the summary is still
+    too large, it is not rendered.  Rendering is canceled by requesting
+    interruption of the thread, which stops the dot process.
+
+    Qt signals:
+    failed      (str) The rendering failed, with an error message.
+    rendered    (bytes, str) The rendering is complete, with the PNG
+                image, and a description of the rendered graph.  The
+                image is empty if the graph was not rendered.
+    """
+
+    failed = QtCore.pyqtSignal(str)
+    rendered = QtCore.pyqtSignal(bytes, str)
+
+    graph: nx.DiGraph | None = None
+
+    # render the full graph regardless of the limits
+    full: bool = False
+    max_nodes: int = 250
+    max_edges: int = 1000
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.log: typing.Final = logging.getLogger(__name__)
+        # the last graph was summarized or not rendered
+        self.limited = False
+
+    def _over_limit(self, graph: nx.DiGraph) -> bool:
+        return graph.number_of_nodes() > self.max_nodes or \
+            graph.number_of_edges() > self.max_edges
+
+    def run(self) -> None:
+        try:
+            assert self.graph is not None, "graph attribute not set, this is an SETools bug"
+            this_thread = QtCore.QThread.currentThread()
+            # type narrowing:
+            assert this_thread, "Unable to get current thread, this is an SETools bug"
+
+            graph = self.graph
+            description = f"{graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges"
+            self.limited = False
+
+            if not self.full and self._over_limit(graph):
+                self.limited = True
+                self.log.info(f"Summarizing large graph ({description}).")
+                graph = summarize_graph(graph)
+                summary = f"{graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges"
+                if self._over_limit(graph):
+                    self.rendered.emit(
+                        b"", f"The graph ({description}) is too large to render, even when "
+                        f"summarized ({summary}).  Render the full graph from the context "
+                        "menu, or export it with the command line tool.")
+                    return
+
+                description = f"Summary of strongly connected components: {summary}, " \
+                    f"from {description}.  Render the full graph from the context menu."
+
+            dot = io.StringIO()
+            write_dot(graph, dot)
+
+            self.log.info(f"Rendering graph ({description}).")
+            with subprocess.Popen(["dot", "-Tpng"], stdin=subprocess.PIPE,
+                                  stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+                while True:
+                    try:
+                        png, err = proc.communicate(dot.getvalue().encode(), timeout=0.1)
+                        break
+                    except subprocess.TimeoutExpired:
+                        if this_thread.isInterruptionRequested():
+                            proc.kill()
+                            proc.communicate()
+                            self.log.info("Graph rendering canceled.")
+                            self.rendered.emit(b"", "Graph rendering canceled.")
+                            return
+
+            if proc.returncode:
+                raise RuntimeError(err.decode(errors="replace").strip())
+
+            self.rendered.emit(png, description)
+
+        except Exception as e:
+            msg = f"Unable to render graph: {e}"
+            self.log.exception(msg)
+            self.failed.emit(msg)
+
+
 A = typing.TypeVar("A", bound=setools.query.DirectedGraphAnalysis)
 N = typing.TypeVar("N")  # type of object for browser (graph node)
 ChildData = tuple[N, R]
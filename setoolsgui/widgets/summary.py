@@ -7,6 +7,7 @@ from PyQt6 import QtCore, QtGui, QtWidgets
 import setools
 
 from . import tab
+from .context import policy_context
 
 __all__ = ("SummaryTab",)
 
@@ -156,6 +157,45 @@ class SummaryTab(tab.BaseAnalysisTabWidget):
 
             self._add_row(labeling_layout, label_text, obj)
 
+        #
+        # Shared analysis data
+        #
+        self.context = policy_context(self.policy)
+        shared_groupbox = QtWidgets.QGroupBox(self.results)
+        shared_groupbox.setTitle("Shared Analysis Data")
+        shared_groupbox.setToolTip("Approximate memory use of the analysis data which is shared "
+                                   "by all analyses of this policy.")
+        shared_groupbox.setWhatsThis(
+            """
+            <p>Rule indexes and analysis graphs are built on the first analysis
+            which uses them, and are shared by all later analyses of this policy.
+            This is the approximate memory use of this data, excluding the
+            policy itself.</p>
+            """)
+        self.shared_layout = QtWidgets.QFormLayout(shared_groupbox)
+        self.top_layout.addWidget(shared_groupbox, 6, 0, 1, 2)
+
+        self.shared_values: dict[str, QtWidgets.QLabel] = {}
+        for description in (*self.context.memory_usage_descriptions, "Total"):
+            label = QtWidgets.QLabel(shared_groupbox)
+            label.setFont(font)
+            label.setText(f"{description}:")
+            value = QtWidgets.QLabel(shared_groupbox)
+            self.shared_layout.addRow(label, value)
+            self.shared_values[description] = value
+
+        self.release_button = QtWidgets.QPushButton(shared_groupbox)
+        self.release_button.setText("Release")
+        self.release_button.setToolTip("Release the shared analysis data.  It will be "
+                                       "rebuilt when it is next needed.")
+        self.release_button.clicked.connect(self.context.clear)
+        self.shared_layout.addRow(self.release_button)
+
+        # The memory use is computed by traversing the shared graphs, so it
+        # is only updated when this tab is shown, rather than on every change.
+        self.memory_usage_stale = True
+        self.context.changed.connect(self.shared_data_changed)
+
         QtCore.QMetaObject.connectSlotsByName(self)
 
     def _add_row(self, layout: QtWidgets.QFormLayout, label_text: str, obj: str,
@@ -180,6 +220,31 @@ class SummaryTab(tab.BaseAnalysisTabWidget):
         setattr(self, f"{obj}_label", label)
         setattr(self, f"{obj}_value", value)
 
+    def shared_data_changed(self) -> None:
+        """Update the memory use when the shared analysis data changes, if shown."""
+        self.memory_usage_stale = True
+        if self.isVisible():
+            self.update_memory_usage()
+
+    def update_memory_usage(self) -> None:
+        """Update the memory use of the shared analysis data."""
+        usage = self.context.memory_usage()
+        usage["Total"] = sum(usage.values())
+        for description, size in usage.items():
+            self.shared_values[description].setText(
+                f"{size / 1048576:.1f} MiB" if size else "Not built")
+
+        self.memory_usage_stale = False
+
+    #
+    # Overridden methods
+    #
+    def showEvent(self, event: QtGui.QShowEvent | None) -> None:
+        """Update the memory use, if it changed while this tab was hidden."""
+        super().showEvent(event)
+        if self.memory_usage_stale:
+            self.update_memory_usage()
+
     #
     # Unused abstract methods
     #
@@ -6,11 +6,13 @@ import enum
 import logging
 import typing
 
+import networkx as nx
 from PyQt6 import QtCore, QtGui, QtWidgets
 import setools
 
 from . import criteria, exception, models, util, views
-from .queryupdater import BrowserUpdater, ChildrenData, QueryResultsUpdater
+from .context import policy_context
+from .queryupdater import BrowserUpdater, ChildrenData, GraphRenderer, QueryResultsUpdater
 
 # workspace settings keys
 SETTINGS_NOTES: typing.Final[str] = "notes"
@@ -22,6 +24,10 @@ CRITERIA_DEFAULT_CHECKED: typing.Final[bool] = True
 # Show notes default setting (unchecked)
 NOTES_DEFAULT_CHECKED: typing.Final[bool] = False
 
+# Default limits of all paths searches of directed graph analyses
+DEFAULT_MAX_PATHS: typing.Final[int] = 100000
+DEFAULT_MAX_SECONDS: typing.Final[float] = 60
+
 TAB_REGISTRY: typing.Final[dict[str, type["BaseAnalysisTabWidget"]]] = {}
 
 Q = typing.TypeVar("Q", bound=setools.PolicyQuery)
@@ -109,6 +115,7 @@ class BaseAnalysisTabWidget(QtWidgets.QScrollArea, metaclass=TabRegistry):
 
     criteria: tuple[criteria.criteria.CriteriaWidget, ...]
     perm_map: setools.PermissionMap
+    busy: QtWidgets.QProgressDialog
 
     def __init__(self, _, /, *,
                  enable_criteria: bool = True, enable_browser: bool = False,
@@ -308,6 +315,16 @@ class BaseAnalysisTabWidget(QtWidgets.QScrollArea, metaclass=TabRegistry):
         """Handle query failure."""
         raise NotImplementedError
 
+    def query_progress(self, phase: str, count: int, total: int) -> None:
+        """Show the progress of the query in the busy dialog."""
+        if self.busy.wasCanceled():
+            return
+
+        if total < 0:
+            self.busy.setLabelText(f"{phase}: {count}")
+        else:
+            self.busy.setLabelText(f"{phase}: {count} of {total}")
+
     # @typing.override
     def style(self) -> QtWidgets.QStyle:
         """Type-narrowed style() method.  Always returns a QStyle."""
@@ -419,6 +436,9 @@ class TableResultTabWidget(BaseAnalysisTabWidget, typing.Generic[Q, R]):
         self.sort_proxy = QtCore.QSortFilterProxyModel(self.table_results)
         self.table_results.setModel(self.sort_proxy)
         self.table_results.sortByColumn(0, QtCore.Qt.SortOrder.AscendingOrder)
+        header = self.table_results.horizontalHeader()
+        assert header, "No header set, this is an SETools bug"  # type narrowing
+        header.sectionClicked.connect(self.sort_requested)
 
         # create result tab 2
         self.raw_results = QtWidgets.QPlainTextEdit(self.results)
@@ -438,6 +458,7 @@ class TableResultTabWidget(BaseAnalysisTabWidget, typing.Generic[Q, R]):
                                      "<b>This tab has plain text results of the query.</b>")
 
         self.results.setCurrentIndex(TableResultTabWidget.ResultTab.Table)
+        self.results.currentChanged.connect(self.result_tab_changed)
 
         # set up processing thread
         self.processing_thread = QtCore.QThread(self.analysis_widget)
@@ -451,6 +472,9 @@ class TableResultTabWidget(BaseAnalysisTabWidget, typing.Generic[Q, R]):
         self.busy.reset()
 
     def __del__(self):
+        with suppress(RuntimeError, AttributeError):
+            self.worker.stop()
+
         with suppress(RuntimeError):
             self.processing_thread.quit()
             self.processing_thread.wait(5000)
@@ -465,9 +489,12 @@ class TableResultTabWidget(BaseAnalysisTabWidget, typing.Generic[Q, R]):
         """Set the table results model for this tab and set up the processing thread for it."""
         self.sort_proxy.setSourceModel(model)
 
-        self.worker = QueryResultsUpdater[Q, R](self.query, table_model=model)
+        self.worker = QueryResultsUpdater[Q, R](self.query, table_model=model,
+                                                context=policy_context(self.query.policy))
         self.worker.moveToThread(self.processing_thread)
-        self.worker.raw_line.connect(self.raw_results.appendPlainText)
+        self.worker.raw_lines.connect(self.raw_results.appendPlainText)
+        self.worker.progress.connect(self.query_progress)
+        self.worker.paused.connect(self.query_paused)
         self.worker.finished.connect(self.query_completed)
         self.worker.finished.connect(self.processing_thread.quit)
         self.worker.failed.connect(self.query_failed)
@@ -488,16 +515,65 @@ class TableResultTabWidget(BaseAnalysisTabWidget, typing.Generic[Q, R]):
                 QtWidgets.QMessageBox.StandardButton.Ok)
             return
 
+        if self.processing_thread.isRunning():
+            # The previous query is paused, waiting for more results
+            # to be requested.  Discard its remaining results.
+            self.worker.stop()
+            self.processing_thread.quit()
+            self.processing_thread.wait(5000)
+
         self.busy.setLabelText("Processing query...")
         self.busy.show()
         self.raw_results.clear()
+        self.table_results_model.item_list = []
+        self.table_results_model.results_pending = True
+
+        # Sorting is disabled until the results are complete, since only
+        # the results pulled so far would be sorted.
+        self.table_results.setSortingEnabled(False)
+        self.sort_proxy.sort(-1)
         self.processing_thread.start()
 
+    def fetch_all_results(self) -> None:
+        """Pull all of the remaining results of the query."""
+        if self.table_results_model.results_pending:
+            self.busy.setLabelText("Processing query...")
+            self.busy.show()
+            self.table_results_model.fetch_all()
+
+    def sort_requested(self, column: int) -> None:
+        """Sort the results when they are complete."""
+        if self.table_results_model.results_pending:
+            header = self.table_results.horizontalHeader()
+            assert header, "No header set, this is an SETools bug"  # type narrowing
+            header.setSortIndicator(column, QtCore.Qt.SortOrder.AscendingOrder)
+            self.fetch_all_results()
+
+    def result_tab_changed(self, index: int) -> None:
+        """Pull all of the results when the raw results are shown."""
+        if index == TableResultTabWidget.ResultTab.Text:
+            self.fetch_all_results()
+
+    def query_paused(self, count: int) -> None:
+        """Query paused until more results are requested by scrolling the table."""
+        self.log.debug(f"{count} result(s) found so far.")
+        self.setStatusTip(f"{count} result(s) found so far.  More results are found as the "
+                          "table is scrolled.")
+
+        if count <= self.worker.batch_size:
+            self.table_results.resizeColumnsToContents()
+
+        self.busy.reset()
+
     def query_completed(self, count: int) -> None:
         """Query completed."""
         self.log.debug(f"{count} result(s) found.")
         self.setStatusTip(f"{count} result(s) found.")
 
+        # The results are complete, so all can be sorted.
+        self.table_results_model.fetch_all()
+        self.table_results.setSortingEnabled(True)
+
         # update sizes/location of result displays
         if not self.busy.wasCanceled():
             self.busy.setLabelText("Resizing the result table's columns; GUI may be unresponsive")
@@ -530,6 +606,7 @@ class TableResultTabWidget(BaseAnalysisTabWidget, typing.Generic[Q, R]):
     def query_failed(self, message: str) -> None:
         self.busy.reset()
         self.setStatusTip(f"Error: {message}.")
+        self.table_results.setSortingEnabled(True)
 
         QtWidgets.QMessageBox.critical(
             self, "Error", message, QtWidgets.QMessageBox.StandardButton.Ok)
@@ -567,6 +644,9 @@ class DirectedGraphResultTab(BaseAnalysisTabWidget, typing.Generic[DGA, R, N]):
         super().__init__(query, enable_criteria=enable_criteria, enable_browser=False,
                          parent=parent)
         self.query: typing.Final = query
+        if self.query.path_budget is None:
+            self.query.path_budget = setools.PathBudget(max_paths=DEFAULT_MAX_PATHS,
+                                                        max_seconds=DEFAULT_MAX_SECONDS)
 
         # Create tab widget
         self.results = QtWidgets.QTabWidget(self.analysis_widget)
@@ -678,6 +758,7 @@ class DirectedGraphResultTab(BaseAnalysisTabWidget, typing.Generic[DGA, R, N]):
         # set up processing threads
         self.processing_thread = QtCore.QThread(self.analysis_widget)
         self.browser_thread = QtCore.QThread(self.analysis_widget)
+        self.graph_thread = QtCore.QThread(self.analysis_widget)
 
         # create a "busy, please wait" dialog
         self.busy = QtWidgets.QProgressDialog(self.analysis_widget)
@@ -688,10 +769,12 @@ class DirectedGraphResultTab(BaseAnalysisTabWidget, typing.Generic[DGA, R, N]):
         self.busy.reset()
 
         # set up results worker
-        self.worker = QueryResultsUpdater[DGA, R](self.query,
-                                                  graphics_buffer=self.graphical_results)
+        self.worker = QueryResultsUpdater[DGA, R](self.query, graphical_results=True,
+                                                  context=policy_context(self.query.policy))
         self.worker.moveToThread(self.processing_thread)
-        self.worker.raw_line.connect(self.raw_results.appendPlainText)
+        self.worker.raw_lines.connect(self.raw_results.appendPlainText)
+        self.worker.graph.connect(self._render_graph)
+        self.worker.progress.connect(self.query_progress)
         self.worker.finished.connect(self.query_completed)
         self.worker.finished.connect(self.processing_thread.quit)
         self.worker.failed.connect(self.query_failed)
@@ -707,24 +790,108 @@ class DirectedGraphResultTab(BaseAnalysisTabWidget, typing.Generic[DGA, R, N]):
         self.browser_worker.failed.connect(self.browser_thread.quit)
         self.browser_thread.started.connect(self.browser_worker.run)
 
+        # set up graph renderer.  This is separate from the results worker
+        # so the text and browser results are available while the graph
+        # is laid out, and rendering can be canceled.
+        self.graph_renderer = GraphRenderer()
+        self.graph_renderer.moveToThread(self.graph_thread)
+        self.graph_renderer.rendered.connect(self._graph_rendered)
+        self.graph_renderer.rendered.connect(self.graph_thread.quit)
+        self.graph_renderer.failed.connect(self._graph_failed)
+        self.graph_renderer.failed.connect(self.graph_thread.quit)
+        self.graph_thread.started.connect(self.graph_renderer.run)
+        self.graph_thread.finished.connect(self._graph_thread_finished)
+        # graph to render once a canceled rendering stops, and if it is rendered fully
+        self._pending_graph: tuple[nx.DiGraph, bool] | None = None
+
     def __del__(self):
         with suppress(RuntimeError):
             self.processing_thread.quit()
             self.processing_thread.wait(5000)
 
+        with suppress(RuntimeError):
+            self.graph_thread.requestInterruption()
+            self.graph_thread.quit()
+            self.graph_thread.wait(5000)
+
     #
     # Graphical results methods
     #
     def _graphical_results_context_menu(self, pos: QtCore.QPoint) -> None:
         """Generate context menu for graphical results widget."""
+        actions: list[QtGui.QAction] = []
+
+        if self.graph_thread.isRunning():
+            cancel_action = QtGui.QAction("Cancel Rendering", self.graphical_results)
+            cancel_action.triggered.connect(self._cancel_graph_rendering)
+            actions.append(cancel_action)
+        elif self.graph_renderer.graph is not None and self.graph_renderer.limited:
+            full_action = QtGui.QAction("Render Full Graph", self.graphical_results)
+            full_action.triggered.connect(self._render_full_graph)
+            actions.append(full_action)
+
         save_action = QtGui.QAction("Save As...", self.graphical_results)
         save_action.triggered.connect(self._save_graphical_results)
+        save_action.setEnabled(not self.graphical_results.pixmap().isNull())
+        actions.append(save_action)
 
         menu = QtWidgets.QMenu(self.graphical_results)
         menu.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
-        menu.addActions((save_action,))
+        menu.addActions(actions)
         menu.exec(self.graphical_results.mapToGlobal(pos))
 
+    def _cancel_graph_rendering(self) -> None:
+        """Cancel the graph rendering.  It stops in the background."""
+        self._pending_graph = None
+        if self.graph_thread.isRunning():
+            self.log.debug("Canceling graph rendering.")
+            self.graph_thread.requestInterruption()
+            self.graph_thread.quit()
+
+    def _render_graph(self, graph: nx.DiGraph, /, *, full: bool = False) -> None:
+        """Start rendering the graph in the background."""
+        self._cancel_graph_rendering()
+        self.graphical_results.clear()
+        self.graphical_results.setText("Rendering graph...")
+        if self.graph_thread.isRunning():
+            # the renderer is still in use; start when the canceled rendering stops.
+            self._pending_graph = (graph, full)
+            return
+
+        self.graph_renderer.graph = graph
+        self.graph_renderer.full = full
+        self.graph_thread.start()
+
+    def _graph_thread_finished(self) -> None:
+        """Start the pending graph rendering, if any."""
+        if self._pending_graph is not None:
+            graph, full = self._pending_graph
+            self._render_graph(graph, full=full)
+
+    def _render_full_graph(self) -> None:
+        """Render the last graph without summarizing it."""
+        assert self.graph_renderer.graph is not None, "No graph to render, this is an SETools bug"
+        self._render_graph(self.graph_renderer.graph, full=True)
+
+    def _graph_rendered(self, image: bytes, description: str) -> None:
+        """Display the rendered graph."""
+        if not image:
+            self.graphical_results.setText(description)
+            return
+
+        pic = QtGui.QPixmap()
+        if not pic.loadFromData(image, "PNG"):
+            self._graph_failed("Unable to load the rendered graph.")
+            return
+
+        self.graphical_results.setPixmap(pic)
+        self.graphical_results.setToolTip(description)
+
+    def _graph_failed(self, message: str) -> None:
+        """Graph rendering failed."""
+        self.graphical_results.setText(message)
+        self.setStatusTip(f"Error: {message}.")
+
     def _save_graphical_results(self) -> None:
         """Save the graphical results to a file."""
         with util.QMessageOnException("Error",
@@ -855,6 +1022,9 @@ class DirectedGraphResultTab(BaseAnalysisTabWidget, typing.Generic[DGA, R, N]):
 
         self.busy.setLabelText("Processing query...")
         self.busy.show()
+        self._cancel_graph_rendering()
+        self.graphical_results.clear()
+        self.graphical_results.setToolTip("")
         self.tree_results.clear()
         self.tree_raw_results.clear()
         self.raw_results.clear()
@@ -863,7 +1033,12 @@ class DirectedGraphResultTab(BaseAnalysisTabWidget, typing.Generic[DGA, R, N]):
     def query_completed(self, count: int) -> None:
         """Query completed."""
         self.log.debug(f"{count} result(s) found.")
-        self.setStatusTip(f"{count} result(s) found.")
+        if self.query.path_budget and self.query.path_budget.exhausted:
+            self.setStatusTip(f"{count} result(s) found; search stopped early: "
+                              f"{self.query.path_budget.exhausted}.")
+        else:
+            self.setStatusTip(f"{count} result(s) found.")
+
         if not self.busy.wasCanceled():
             self.busy.setLabelText("Moving the raw result to top; GUI may be unresponsive")
             self.busy.repaint()
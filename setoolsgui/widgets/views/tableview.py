@@ -84,6 +84,23 @@ class SEToolsTableView(QtWidgets.QTableView):
         """Save the current table data to the specified CSV file."""
 
         datamodel = self.model()
+
+        source_model: QtCore.QAbstractItemModel | None = datamodel
+        while isinstance(source_model, QtCore.QAbstractProxyModel):
+            source_model = source_model.sourceModel()
+
+        if isinstance(source_model, models.SEToolsTableModel):
+            if source_model.results_pending:
+                # save once the rest of the query results are pulled
+                source_model.completed.connect(  # type: ignore[call-arg]
+                    lambda: self.save_csv(filename),
+                    QtCore.Qt.ConnectionType.SingleShotConnection)
+                source_model.fetch_all()
+                return
+
+            # include items which have not been added to the view yet
+            source_model.fetch_all()
+
         row_count = datamodel.rowCount()
         col_count = datamodel.columnCount()
 
@@ -44,6 +44,27 @@ def test_completer(widget: NameWidget) -> None:
     assert widget.criteria.completer().currentCompletion() == "bar"
 
 
+@pytest.mark.obj_args(completion=["foo", "bar", "afoo"])
+def test_completer_substring(widget: NameWidget) -> None:
+    """Test completer lists prefix matches, then substring matches."""
+    completer = widget.criteria.completer()
+    completer.setCompletionPrefix("fo")
+    assert completer.completionCount() == 2
+    assert completer.currentCompletion() == "foo"
+    completer.setCurrentRow(1)
+    assert completer.currentCompletion() == "afoo"
+
+
+@pytest.mark.obj_args(completion=["foo", "bar", "afoo"])
+def test_completer_regex(widget: NameWidget) -> None:
+    """Test completer previews regex matches."""
+    widget.criteria_regex.setChecked(True)
+    completer = widget.criteria.completer()
+    completer.setCompletionPrefix("^(a|b)")
+    assert completer.completionCount() == 2
+    assert completer.currentCompletion() == "afoo"
+
+
 def test_valid_text_entry(widget: NameWidget, mock_query) -> None:
     """Test successful text entry."""
     widget.criteria.clear()
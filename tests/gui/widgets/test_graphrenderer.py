@@ -0,0 +1,33 @@
+# SPDX-License-Identifier: GPL-2.0-only
+import networkx as nx
+
+from setoolsgui.widgets.queryupdater import GraphRenderer, summarize_graph
+
+
+def test_summarize_graph() -> None:
+    """Test summarizing a graph by strongly connected components."""
+    graph = nx.DiGraph()
+    graph.add_edges_from([("a", "b"), ("b", "c"), ("c", "a"), ("c", "d"), ("e", "d")])
+
+    summary = summarize_graph(graph)
+    assert sorted(summary.nodes()) == ["a (+2)", "d", "e"]
+    assert sorted(summary.edges()) == [("a (+2)", "d"), ("e", "d")]
+
+
+def test_render_too_large() -> None:
+    """Test a graph which is too large to render, even when summarized."""
+    graph = nx.DiGraph()
+    graph.add_edges_from([("a", "b"), ("c", "d")])
+
+    renderer = GraphRenderer()
+    renderer.graph = graph
+    renderer.max_nodes = 2
+    results: list[tuple[bytes, str]] = []
+    renderer.rendered.connect(lambda image, text: results.append((image, text)))
+    renderer.run()
+
+    assert renderer.limited
+    assert len(results) == 1
+    image, text = results[0]
+    assert not image
+    assert "too large" in text
@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: GPL-2.0-only
+from setoolsgui.widgets.nameindex import NameIndex
+
+NAMES = ["httpd_t", "httpd_sys_content_t", "sshd_t", "user_home_t", "init_t", "httpd_t"]
+
+
+def test_names() -> None:
+    """Test names are sorted and unique."""
+    index = NameIndex(NAMES)
+    assert index.names == ("httpd_sys_content_t", "httpd_t", "init_t", "sshd_t", "user_home_t")
+    assert "sshd_t" in index
+    assert "sshd" not in index
+    assert len(index) == 5
+
+
+def test_prefix() -> None:
+    """Test prefix search."""
+    index = NameIndex(NAMES)
+    assert index.prefix("httpd") == ["httpd_sys_content_t", "httpd_t"]
+    assert index.prefix("httpd", limit=1) == ["httpd_sys_content_t"]
+    assert index.prefix("zz") == []
+
+
+def test_substring() -> None:
+    """Test substring search, with and without the n-gram index."""
+    index = NameIndex(NAMES)
+    assert index.substring("_t") == ["httpd_sys_content_t", "httpd_t", "init_t",
+                                     "sshd_t", "user_home_t"]
+    assert index.substring("d_t") == ["httpd_t", "sshd_t"]
+    assert index.substring("sys_content") == ["httpd_sys_content_t"]
+    assert index.substring("home_x") == []
+
+
+def test_search() -> None:
+    """Test completion search lists prefix matches first."""
+    index = NameIndex(NAMES)
+    assert index.search("s") == ["sshd_t", "httpd_sys_content_t", "user_home_t"]
+    assert index.search("s", limit=2) == ["sshd_t", "httpd_sys_content_t"]
+    assert index.search("") == list(index.names)
+
+
+def test_regex() -> None:
+    """Test regular expression search."""
+    index = NameIndex(NAMES)
+    assert index.regex("^(init|sshd)_t$") == ["init_t", "sshd_t"]
+    assert index.regex("(") == []
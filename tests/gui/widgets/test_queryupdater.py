@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: GPL-2.0-only
+import typing
+
+from PyQt6 import QtCore
+from pytestqt.qtbot import QtBot
+
+from setoolsgui.widgets.models.table import StringList
+from setoolsgui.widgets.queryupdater import QueryResultsUpdater
+
+
+class CountingQuery:
+
+    """Mock query which counts the results pulled from it."""
+
+    progress = None
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.pulled = 0
+
+    def results(self) -> typing.Iterator[str]:
+        for i in range(self.count):
+            self.pulled += 1
+            yield str(i)
+
+
+def start_updater(query: CountingQuery, model: StringList, thread: QtCore.QThread,
+                  batch_size: int) -> QueryResultsUpdater:
+    model.fetch_batch_size = batch_size
+    model.results_pending = True
+    updater: QueryResultsUpdater = QueryResultsUpdater(
+        query, table_model=model, batch_size=batch_size)
+    updater.moveToThread(thread)
+    thread.started.connect(updater.update)
+    updater.finished.connect(thread.quit)
+    thread.start()
+    return updater
+
+
+def test_pull_batches(qtbot: QtBot) -> None:
+    """Test results are pulled from the query as the model fetches them."""
+    query = CountingQuery(25)
+    model = StringList()
+    thread = QtCore.QThread()
+    updater = start_updater(query, model, thread, 10)
+
+    # first batch is sent, then the update pauses
+    qtbot.waitUntil(lambda: model.rowCount() == 10)
+    assert query.pulled == 10
+    assert model.results_pending
+    assert model.canFetchMore(QtCore.QModelIndex())
+
+    model.fetchMore(QtCore.QModelIndex())
+    assert not model.canFetchMore(QtCore.QModelIndex())
+    qtbot.waitUntil(lambda: model.rowCount() == 20)
+    assert query.pulled == 20
+
+    with qtbot.waitSignal(updater.finished) as finished:
+        model.fetchMore(QtCore.QModelIndex())
+
+    assert finished.args == [25]
+    qtbot.waitUntil(lambda: not model.results_pending)
+    assert model.rowCount() == 25
+    assert not model.canFetchMore(QtCore.QModelIndex())
+    assert thread.wait(5000)
+
+
+def test_pull_all(qtbot: QtBot) -> None:
+    """Test pulling all of the remaining results."""
+    query = CountingQuery(35)
+    model = StringList()
+    thread = QtCore.QThread()
+    updater = start_updater(query, model, thread, 10)
+
+    qtbot.waitUntil(lambda: model.rowCount() == 10)
+    with qtbot.waitSignal(updater.finished), qtbot.waitSignal(model.completed):
+        model.fetch_all()
+
+    assert query.pulled == 35
+    assert model.rowCount() == 35
+    assert model.data(model.index(34, 0)) == "34"
+    assert thread.wait(5000)
+
+
+def test_stop(qtbot: QtBot) -> None:
+    """Test stopping a paused update."""
+    query = CountingQuery(25)
+    model = StringList()
+    thread = QtCore.QThread()
+    updater = start_updater(query, model, thread, 10)
+
+    qtbot.waitUntil(lambda: model.rowCount() == 10)
+    updater.stop()
+    thread.quit()
+    assert thread.wait(5000)
+    assert query.pulled == 10
+    assert model.results_pending
@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: GPL-2.0-only
+from PyQt6 import QtCore
+
+from setoolsgui.widgets.models.table import StringList
+
+
+def test_extend_lazy_fetch() -> None:
+    """Test extend() adds rows in batches by fetchMore()."""
+    model = StringList()
+    model.fetch_batch_size = 10
+    model.extend(str(i) for i in range(25))
+
+    # first batch is added immediately
+    assert model.rowCount() == 10
+    assert model.canFetchMore(QtCore.QModelIndex())
+
+    model.fetchMore(QtCore.QModelIndex())
+    assert model.rowCount() == 20
+
+    model.fetchMore(QtCore.QModelIndex())
+    assert model.rowCount() == 25
+    assert not model.canFetchMore(QtCore.QModelIndex())
+    assert model.data(model.index(24, 0)) == "24"
+
+
+def test_append_pending() -> None:
+    """Test append() while rows are pending a fetch."""
+    model = StringList()
+    model.fetch_batch_size = 10
+    model.extend(str(i) for i in range(15))
+    model.append("new")
+    assert model.rowCount() == 10
+    assert len(model.item_list) == 16
+
+    model.fetchMore(QtCore.QModelIndex())
+    assert model.rowCount() == 16
+    assert model.data(model.index(15, 0)) == "new"
+
+
+def test_item_list_reset() -> None:
+    """Test setting the item list makes all items rows."""
+    model = StringList()
+    model.fetch_batch_size = 10
+    model.extend(str(i) for i in range(15))
+    model.item_list = [str(i) for i in range(30)]
+    assert model.rowCount() == 30
+    assert not model.canFetchMore(QtCore.QModelIndex())
@@ -5,6 +5,7 @@
 
 import copy
 import dataclasses
+import mmap
 
 import pytest
 import setools
@@ -18,6 +19,61 @@ class TestSELinuxPolicy:
         with pytest.raises(OSError):
             setools.SELinuxPolicy("tests/policyrep/DOES_NOT_EXIST")
 
+    def test_open_policy_mmap(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """SELinuxPolicy: Open policy with mmap."""
+        p = setools.SELinuxPolicy(compiled_policy.path, use_mmap=True)
+        assert p.path == compiled_policy.path
+        assert p.type_count == compiled_policy.type_count
+        assert p.allow_count == compiled_policy.allow_count
+
+    def test_open_policy_buffer(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """SELinuxPolicy: Load policy from bytes and memoryview buffers."""
+        with open(compiled_policy.path, "rb") as fd:
+            data = fd.read()
+
+        for buffer in (data, memoryview(data)):
+            p = setools.SELinuxPolicy(buffer=buffer)
+            assert p.path == "<buffer>"
+            assert p.type_count == compiled_policy.type_count
+            assert p.allow_count == compiled_policy.allow_count
+
+        p = setools.SELinuxPolicy("name", buffer=data)
+        assert p.path == "name"
+
+    def test_open_policy_buffer_mmap(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """SELinuxPolicy: Load policy from an mmap buffer."""
+        with open(compiled_policy.path, "rb") as fd, \
+                mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            p = setools.SELinuxPolicy(buffer=buffer)
+
+        assert p.type_count == compiled_policy.type_count
+        assert sorted(str(t) for t in p.types()) == \
+            sorted(str(t) for t in compiled_policy.types())
+
+    def test_open_policy_buffer_invalid(self) -> None:
+        """SELinuxPolicy: Load invalid policy from a buffer."""
+        with pytest.raises(setools.exception.InvalidPolicy):
+            setools.SELinuxPolicy(buffer=b"\x00" * 64)
+
+        with pytest.raises(TypeError):
+            setools.SELinuxPolicy(buffer="not a buffer")  # type: ignore[arg-type]
+
+    def test_load_policies(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """SELinuxPolicy: Concurrent loading of policies"""
+        policies = setools.load_policies([compiled_policy.path] * 3, workers=3)
+        assert len(policies) == 3
+        for p in policies:
+            assert p is not compiled_policy
+            assert p.type_count == compiled_policy.type_count
+            assert p.allow_count == compiled_policy.allow_count
+            assert sorted(str(t) for t in p.types()) == \
+                sorted(str(t) for t in compiled_policy.types())
+
+    def test_load_policies_non_existent(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """SELinuxPolicy: Concurrent loading with a non existent policy."""
+        with pytest.raises(OSError):
+            setools.load_policies([compiled_policy.path, "tests/policyrep/DOES_NOT_EXIST"])
+
     def test_deepcopy(self, compiled_policy: setools.SELinuxPolicy) -> None:
         """SELinuxPolicy: Deep copy"""
         p = copy.deepcopy(compiled_policy)
@@ -193,6 +249,35 @@ class TestSELinuxPolicy:
         """SELinuxPolicy: dontauditxperm rount"""
         assert compiled_policy.dontauditxperm_count == 193
 
+    def test_terules_shard(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """SELinuxPolicy: TE rule shards cover all TE rules in order"""
+        rules = list(compiled_policy.terules())
+        shard_rules = [r for shard in compiled_policy.terule_shards(3)
+                       for _, r in compiled_policy.terules_shard(shard)]
+        assert rules == shard_rules
+
+    def test_terules_from_positions(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """SELinuxPolicy: TE rule lookup by shard position"""
+        pairs = [p for shard in compiled_policy.terule_shards(2)
+                 for p in compiled_policy.terules_shard(shard)]
+        positions = [pos for pos, _ in pairs[::3]]
+        assert [r for _, r in pairs[::3]] == compiled_policy.terules_from_positions(positions)
+
+    def test_terules_by_class(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """SELinuxPolicy: TE rules by class match filtering all TE rules"""
+        rules = list(compiled_policy.terules())
+        for tclass in compiled_policy.classes():
+            assert list(compiled_policy.terules_by_class(tclass)) == \
+                [r for r in rules if r.tclass == tclass], tclass
+
+            for perm in sorted(tclass.perms)[:1]:
+                for ruletype in (setools.TERuletype.allow, setools.TERuletype.dontaudit):
+                    expected = [r for r in rules if r.tclass == tclass and r.ruletype == ruletype
+                                and perm in r.perms]
+                    assert list(compiled_policy.terules_by_class(tclass, (ruletype,),
+                                                                 (perm, "invalid_perm"))) == \
+                        expected, (tclass, ruletype, perm)
+
 
 @dataclasses.dataclass
 class LookupTestCase:
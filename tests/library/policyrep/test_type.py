@@ -84,3 +84,17 @@ class TestType:
         type_ = compiled_policy.lookup_type("name68")
         assert "type name68 alias { alias12 alias13 }, attr1, attr3;" == type_.statement(), \
             type_.statement()
+
+    def test_rules(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """Type TE rules, directly and through attributes"""
+        type_ = compiled_policy.lookup_type("name70")
+        rules = sorted(str(r) for r in type_.rules())
+        assert ["allow attr70 attr70:infoflow low_r;",
+                "allow name70 name71:infoflow hi_w;",
+                "type_transition name71 name71:infoflow name70;"] == rules, rules
+
+    def test_rules_ruletype(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """Type TE rules, filtered by rule type"""
+        type_ = compiled_policy.lookup_type("name71")
+        rules = sorted(str(r) for r in type_.rules(ruletype=("type_transition",)))
+        assert ["type_transition name71 name71:infoflow name70;"] == rules, rules
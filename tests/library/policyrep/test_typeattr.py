@@ -46,3 +46,15 @@ class TestTypeAttribute:
         attr = compiled_policy.lookup_typeattr("name70")
         assert "type31b" in attr
         assert "type30" not in attr
+
+    def test_rules(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """TypeAttribute TE rules, directly and through member types"""
+        attr = compiled_policy.lookup_typeattr("name40")
+        rules = sorted(str(r) for r in attr.rules())
+        assert ["allow name40 type30:infoflow hi_w;",
+                "allow type31a type30:infoflow low_r;"] == rules, rules
+
+    def test_rules_ruletype(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """TypeAttribute TE rules, filtered by rule type"""
+        attr = compiled_policy.lookup_typeattr("name70")
+        assert [] == list(attr.rules(ruletype=(setools.TERuletype.dontaudit,)))
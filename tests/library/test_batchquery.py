@@ -0,0 +1,77 @@
+"""Batch rule query unit tests."""
+# SPDX-License-Identifier: GPL-2.0-only
+#
+import pytest
+import setools
+from setools import BatchRuleQuery, TERuleQuery, read_batch_specs
+from setools import TERuletype as TRT
+
+
+@pytest.mark.obj_args("tests/library/terulequery.conf")
+class TestBatchRuleQuery:
+
+    """Batch rule query unit tests."""
+
+    def test_results(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """Batch rule query results match the individual queries."""
+        queries = {
+            "source": TERuleQuery(compiled_policy, ruletype=[TRT.allow], source="test1a",
+                                  source_indirect=False),
+            "perms": TERuleQuery(compiled_policy, ruletype=[TRT.allow], perms=["super_w"]),
+            "tt": TERuleQuery(compiled_policy, ruletype=[TRT.type_transition],
+                              default="test100d"),
+            "all": TERuleQuery(compiled_policy)}
+
+        q = BatchRuleQuery(compiled_policy, queries=queries)
+        results: dict[str, list] = {query_id: [] for query_id in queries}
+        for query_id, rule in q.results():
+            results[query_id].append(rule)
+
+        for query_id, rule_query in queries.items():
+            assert sorted(results[query_id]) == sorted(rule_query.results()), query_id
+
+    def test_from_specs(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """Batch rule query from JSON and CSV specifications."""
+        jsonl = ['{"id": "q1", "ruletype": ["allow"], "source": "test1a", '
+                 '"source_indirect": false}\n',
+                 '\n',
+                 '{"id": "q2", "ruletype": "allow", "tclass": "infoflow7", '
+                 '"perms": ["super_w"], "perms_equal": true}\n']
+        csv = ['id,ruletype,source,source_indirect,tclass,perms,perms_equal\n',
+               '# comment\n',
+               'q1,allow,test1a,false,,,\n',
+               'q2,allow,,,infoflow7,super_w,true\n']
+
+        json_q = BatchRuleQuery.from_specs(compiled_policy, read_batch_specs(jsonl))
+        csv_q = BatchRuleQuery.from_specs(compiled_policy, read_batch_specs(csv))
+
+        assert list(json_q.queries) == ["q1", "q2"]
+        assert sorted(json_q.results()) == sorted(csv_q.results())
+
+        q2 = json_q.queries["q2"]
+        assert isinstance(q2, TERuleQuery)
+        assert q2.perms_equal
+        assert sorted(r for i, r in json_q.results() if i == "q2") == sorted(q2.results())
+
+    def test_invalid_ruletype(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """Batch rule query with an invalid rule type."""
+        with pytest.raises(ValueError):
+            BatchRuleQuery.from_specs(compiled_policy, [{"id": "q1", "ruletype": "bogus"}])
+
+    def test_mixed_ruletype(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """Batch rule query mixing TE and RBAC rule types."""
+        with pytest.raises(ValueError):
+            BatchRuleQuery.from_specs(compiled_policy,
+                                      [{"id": "q1", "ruletype": "allow,role_allow"}])
+
+    def test_invalid_criteria(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """Batch rule query with criteria not supported by the query."""
+        with pytest.raises(ValueError):
+            BatchRuleQuery.from_specs(compiled_policy,
+                                      [{"id": "q1", "ruletype": "role_allow", "perms": "read"}])
+
+    def test_duplicate_id(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """Batch rule query with a duplicate query id."""
+        with pytest.raises(ValueError):
+            BatchRuleQuery.from_specs(compiled_policy, [{"id": "q1", "ruletype": "allow"},
+                                                        {"id": "q1", "ruletype": "allow"}])
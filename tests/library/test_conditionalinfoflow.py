@@ -33,13 +33,13 @@ class TestConditionalInfoFlowAnalysis:
         flow_true = analysis.policy.lookup_type("flow_true")
         flow_false = analysis.policy.lookup_type("flow_false")
 
-        r = analysis.G.edges[source, flow_true]["rules"]
+        r = setools.InfoFlowStep(analysis.subG, source, flow_true).rules
         assert len(r) == 1
-        r = analysis.G.edges[flow_true, target]["rules"]
+        r = setools.InfoFlowStep(analysis.subG, flow_true, target).rules
         assert len(r) == 1
-        r = analysis.G.edges[source, flow_false]["rules"]
+        r = setools.InfoFlowStep(analysis.subG, source, flow_false).rules
         assert len(r) == 1
-        r = analysis.G.edges[flow_false, target]["rules"]
+        r = setools.InfoFlowStep(analysis.subG, flow_false, target).rules
         assert len(r) == 1
 
     def test_default_conditional_rules(self, analysis: setools.InfoFlowAnalysis) -> None:
@@ -53,13 +53,11 @@ class TestConditionalInfoFlowAnalysis:
         flow_true = analysis.policy.lookup_type("flow_true")
         flow_false = analysis.policy.lookup_type("flow_false")
 
-        r = analysis.G.edges[source, flow_true]["rules"]
-        assert len(r) == 0
-        r = analysis.G.edges[flow_true, target]["rules"]
-        assert len(r) == 0
-        r = analysis.G.edges[source, flow_false]["rules"]
+        assert not analysis.subG.has_edge(source, flow_true)
+        assert not analysis.subG.has_edge(flow_true, target)
+        r = setools.InfoFlowStep(analysis.subG, source, flow_false).rules
         assert len(r) == 1
-        r = analysis.G.edges[flow_false, target]["rules"]
+        r = setools.InfoFlowStep(analysis.subG, flow_false, target).rules
         assert len(r) == 1
 
     def test_user_conditional_true(self, analysis: setools.InfoFlowAnalysis) -> None:
@@ -73,14 +71,12 @@ class TestConditionalInfoFlowAnalysis:
         flow_true = analysis.policy.lookup_type("flow_true")
         flow_false = analysis.policy.lookup_type("flow_false")
 
-        r = analysis.G.edges[source, flow_true]["rules"]
+        r = setools.InfoFlowStep(analysis.subG, source, flow_true).rules
         assert len(r) == 1
-        r = analysis.G.edges[flow_true, target]["rules"]
+        r = setools.InfoFlowStep(analysis.subG, flow_true, target).rules
         assert len(r) == 1
-        r = analysis.G.edges[source, flow_false]["rules"]
-        assert len(r) == 0
-        r = analysis.G.edges[flow_false, target]["rules"]
-        assert len(r) == 0
+        assert not analysis.subG.has_edge(source, flow_false)
+        assert not analysis.subG.has_edge(flow_false, target)
 
     def test_user_conditional_false(self, analysis: setools.InfoFlowAnalysis) -> None:
         """Keep only conditional rules selected by user specified booleans (False Case.)"""
@@ -93,13 +89,11 @@ class TestConditionalInfoFlowAnalysis:
         flow_true = analysis.policy.lookup_type("flow_true")
         flow_false = analysis.policy.lookup_type("flow_false")
 
-        r = analysis.G.edges[source, flow_true]["rules"]
-        assert len(r) == 0
-        r = analysis.G.edges[flow_true, target]["rules"]
-        assert len(r) == 0
-        r = analysis.G.edges[source, flow_false]["rules"]
+        assert not analysis.subG.has_edge(source, flow_true)
+        assert not analysis.subG.has_edge(flow_true, target)
+        r = setools.InfoFlowStep(analysis.subG, source, flow_false).rules
         assert len(r) == 1
-        r = analysis.G.edges[flow_false, target]["rules"]
+        r = setools.InfoFlowStep(analysis.subG, flow_false, target).rules
         assert len(r) == 1
 
     def test_remaining_edges(self, analysis: setools.InfoFlowAnalysis) -> None:
@@ -112,9 +106,26 @@ class TestConditionalInfoFlowAnalysis:
         target = analysis.policy.lookup_type("tgt_remain")
         flow = analysis.policy.lookup_type("flow_remain")
 
-        r = analysis.G.edges[source, flow]["rules"]
+        r = setools.InfoFlowStep(analysis.subG, source, flow).rules
         assert len(r) == 1
         assert str(r[0]) == 'allow src_remain flow_remain:infoflow hi_w;'
-        r = analysis.G.edges[flow, target]["rules"]
+        r = setools.InfoFlowStep(analysis.subG, flow, target).rules
         assert len(r) == 1
         assert str(r[0]) == 'allow tgt_remain flow_remain:infoflow hi_r;'
+
+    def test_shared_graph_unchanged(self, analysis: setools.InfoFlowAnalysis) -> None:
+        """Booleans and exclusions of an analysis do not change its shared graph."""
+        graph = analysis.build_graph()
+        nodes = set(graph.nodes())
+        edges = {(s, t): dict(d) for s, t, d in graph.edges(data=True)}
+
+        other = setools.InfoFlowAnalysis(analysis.policy, analysis.perm_map)
+        other.use_graph(graph)
+        for booleans in ({}, {"condition": True}, {"condition": False}):
+            other.booleans = booleans
+            other.exclude = ["flow_remain"]
+            other._build_subgraph()
+
+        assert other.G is graph
+        assert set(graph.nodes()) == nodes
+        assert {(s, t): dict(d) for s, t, d in graph.edges(data=True)} == edges
@@ -109,3 +109,8 @@ class TestConstraintQuery:
 
         constraint = sorted(str(c.expression) for c in q.results())
         assert ["r1 == system or r2 == system and u1 == u2"] == constraint
+
+    def test_parallel(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """Constraint query with the scan split across worker processes."""
+        q = setools.ConstraintQuery(compiled_policy, tclass=["test52a", "test52b"])
+        assert list(q.results()) == q.parallel_results(workers=2)
@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: GPL-2.0-only
+#
+import os
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import setools
+from setools import daemon
+
+
+TOOL = """
+import sys
+print("out", *sys.argv[1:])
+print("err", file=sys.stderr)
+sys.exit(3)
+"""
+
+
+@pytest.fixture
+def server(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[daemon.SEToolsDaemon]:
+    """A daemon running a fake sesearch in a thread."""
+    (tmp_path / "sesearch").write_text(TOOL)
+    path = str(tmp_path / "daemon.sock")
+    monkeypatch.setenv(daemon.SOCKET_ENV, path)
+    srv = daemon.SEToolsDaemon(path, tooldir=str(tmp_path))
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+    thread.join()
+
+
+class TestDaemon:
+
+    def test_forward_no_daemon(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Daemon: forward without a running daemon."""
+        monkeypatch.setenv(daemon.SOCKET_ENV, str(tmp_path / "missing.sock"))
+        assert daemon.forward("sesearch", ["--allow"]) is None
+
+    def test_forward_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Daemon: forward disabled by empty socket path."""
+        monkeypatch.setenv(daemon.SOCKET_ENV, "")
+        assert daemon.forward("sesearch", ["--allow"]) is None
+
+    def test_forward(self, server: daemon.SEToolsDaemon,
+                     capfdbinary: pytest.CaptureFixture[bytes]) -> None:
+        """Daemon: forward to a running daemon."""
+        assert daemon.forward("sesearch", ["--allow", "-s", "foo"]) == 3
+        out, err = capfdbinary.readouterr()
+        assert out == b"out --allow -s foo\n"
+        assert err == b"err\n"
+
+    def test_forward_invalid_tool(self, server: daemon.SEToolsDaemon,
+                                  capfdbinary: pytest.CaptureFixture[bytes]) -> None:
+        """Daemon: forward a tool which the daemon does not run."""
+        assert daemon.forward("sediff", []) == 2
+        _, err = capfdbinary.readouterr()
+        assert b"cannot be run" in err
+
+    def test_socket_permissions(self, server: daemon.SEToolsDaemon) -> None:
+        """Daemon: socket is only accessible by the user."""
+        assert os.stat(server.path).st_mode & 0o077 == 0
+
+    @pytest.mark.obj_args("tests/library/dta.conf")
+    def test_cache(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """Daemon: cached policy and analyses."""
+        cache = daemon.AnalysisCache()
+        policy = cache.policy(compiled_policy.path)
+        assert policy is cache.policy(compiled_policy.path)
+
+        dta1 = cache.domain_transition_analysis(policy, None)
+        dta2 = cache.domain_transition_analysis(policy, None)
+        assert dta1 is not dta2
+        assert dta1.subG is dta2.subG
+
+        # settings of a copy do not change the cached analysis
+        dta1.reverse = True
+        assert not cache.domain_transition_analysis(policy, None).reverse
+
+        # boolean values share the cached graph
+        dta3 = cache.domain_transition_analysis(policy, None, {"trans5": True})
+        assert dta3.G is dta2.G
+        assert dta3.rebuildsubgraph
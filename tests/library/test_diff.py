@@ -1927,6 +1927,20 @@ class TestPolicyDifference:
         assert "modified_change_level:object_r:system:s2:c1" == added
         assert "modified_change_level:object_r:system:s2:c0.c1" == removed
 
+    #
+    # Rule difference counts
+    #
+    @pytest.mark.parametrize("ruletype", ["allow", "auditallow", "dontaudit", "neverallow",
+                                          "allowxperm", "auditallowxperm", "dontauditxperm",
+                                          "neverallowxperm", "type_transition", "type_change",
+                                          "type_member"])
+    def test_te_rule_counts(self, analysis: setools.PolicyDifference, ruletype: str) -> None:
+        """Diff: TE rule difference counts match the differences."""
+        counts = getattr(analysis, f"{ruletype}_counts")
+        assert len(getattr(analysis, f"added_{ruletype}s")) == counts.added
+        assert len(getattr(analysis, f"removed_{ruletype}s")) == counts.removed
+        assert len(getattr(analysis, f"modified_{ruletype}s")) == counts.modified
+
 
 @pytest.mark.obj_args("tests/library/diff_left.conf", "tests/library/diff_right_rmisid.conf")
 class TestPolicyDifferenceRmIsid:
@@ -2886,3 +2900,7 @@ class TestPolicyDifferenceTestRedundant:
     def test_modified_allows(self, analysis: setools.PolicyDifference) -> None:
         """Redundant: no modified allow rules."""
         assert not analysis.modified_allows
+
+    def test_allow_counts(self, analysis: setools.PolicyDifference) -> None:
+        """Redundant: no allow rule difference counts."""
+        assert setools.diff.DifferenceCounts(0, 0, 0) == analysis.allow_counts
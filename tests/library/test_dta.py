@@ -4,6 +4,7 @@
 #
 import typing
 
+import networkx as nx
 import pytest
 import setools
 from setools import TERuletype as TERT
@@ -339,6 +340,66 @@ class TestDomainTransitionAnalysis:
         r = analysis.G.edges[s, t]["setcurrent"]
         assert len(r) == 0
 
+    def test_booleans(self, analysis: setools.DomainTransitionAnalysis) -> None:
+        """DTA: transitions filtered by boolean values."""
+        s = analysis.policy.lookup_type("trans3")
+        t = analysis.policy.lookup_type("trans5")
+        e = analysis.policy.lookup_type("trans5_exec")
+
+        assert analysis.G.edges[s, t]["conditional"]
+        assert not analysis.G.edges[analysis.policy.lookup_type("start"),
+                                    analysis.policy.lookup_type("trans1")]["conditional"]
+
+        # default value of trans5 is false
+        analysis.booleans = {}
+        analysis._build_subgraph()
+        assert not analysis.subG.has_edge(s, t)
+
+        analysis.booleans = {"trans5": True}
+        assert analysis.rebuildsubgraph
+        assert not analysis.rebuildgraph
+        analysis._build_subgraph()
+        assert analysis.subG.has_edge(s, t)
+        assert sorted(analysis.subG.edges[s, t]["type_transition"].keys()) == [e]
+
+        # the graph is unchanged
+        assert analysis.G.has_edge(s, t)
+        assert len(analysis.G.edges[s, t]["type_transition"][e]) == 1
+
+    def test_booleans_all_enabled(self, analysis: setools.DomainTransitionAnalysis) -> None:
+        """DTA: booleans enabling all conditional rules of transitions give the same subgraph."""
+        analysis.booleans = None
+        analysis._build_subgraph()
+        expected = {(s, t): dict(d) for s, t, d in analysis.subG.edges(data=True)}
+
+        analysis.booleans = {"trans5": True}
+        analysis._build_subgraph()
+        assert {(s, t): dict(d) for s, t, d in analysis.subG.edges(data=True)} == expected
+
+    def test_shared_graph_unchanged(self, analysis: setools.DomainTransitionAnalysis) -> None:
+        """DTA: booleans and exclusions of an analysis do not change its shared graph."""
+
+        def snapshot(graph: nx.DiGraph) -> dict:
+            """Copy the edge data, including the rule lists and entrypoint dictionaries."""
+            return {(s, t): {k: {e: list(r) for e, r in v.items()} if isinstance(v, dict)
+                             else list(v) if isinstance(v, list) else v
+                             for k, v in d.items()}
+                    for s, t, d in graph.edges(data=True)}
+
+        graph = analysis.build_graph()
+        before = snapshot(graph)
+
+        other = setools.DomainTransitionAnalysis(analysis.policy)
+        other.use_graph(graph)
+        for reverse in (False, True):
+            other.reverse = reverse
+            other.booleans = {}
+            other.exclude = ["trans2_exec", "trans3_exec1", "bothtrans200_exec"]
+            other._build_subgraph()
+
+        assert other.G is graph
+        assert snapshot(graph) == before
+
     def test_forward_subgraph_structure(self, analysis: setools.DomainTransitionAnalysis) -> None:
         """DTA: verify forward subgraph structure."""
         # The purpose is to ensure the subgraph is reversed
@@ -443,6 +504,12 @@ class TestDomainTransitionAnalysis:
                     (trans2, trans3),
                     (trans3, trans5)]) == edges
 
+        # the entrypoint is only excluded from the subgraph
+        e = analysis.policy.lookup_type("trans3_exec1")
+        assert e not in analysis.subG.edges[trans2, trans3]["entrypoint"]
+        assert e in analysis.G.edges[trans2, trans3]["entrypoint"]
+        assert nx.is_frozen(analysis.subG)
+
     def test_exclude_entryoint_with_dyntrans(
             self, analysis: setools.DomainTransitionAnalysis) -> None:
         """DTA: exclude entrypoint type without transition deletion (dyntrans)."""
@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: GPL-2.0-only
+import networkx as nx
+import pytest
+
+from setools.flowcut import minimum_edge_cut, minimum_node_cut
+
+
+@pytest.fixture
+def graph() -> nx.DiGraph:
+    ret = nx.DiGraph()
+    ret.add_edge("a", "b", capacity=10)
+    ret.add_edge("a", "c", capacity=2)
+    ret.add_edge("b", "d", capacity=3)
+    ret.add_edge("c", "d", capacity=10)
+    ret.add_edge("d", "e", capacity=10)
+    ret.add_edge("x", "e", capacity=4)
+    return ret
+
+
+def test_edge_cut(graph: nx.DiGraph) -> None:
+    """Flow cut: minimum edge cut of one source and target."""
+    flow, cut = minimum_edge_cut(graph, ["a"], ["e"])
+    assert 5 == flow
+    assert [("a", "c"), ("b", "d")] == sorted(cut)
+
+
+def test_edge_cut_sets(graph: nx.DiGraph) -> None:
+    """Flow cut: minimum edge cut of source and target sets."""
+    flow, cut = minimum_edge_cut(graph, ["a", "x", "missing"], ["e"])
+    assert 9 == flow
+    assert [("a", "c"), ("b", "d"), ("x", "e")] == sorted(cut)
+
+    assert (0, []) == minimum_edge_cut(graph, ["missing"], ["e"])
+
+    with pytest.raises(ValueError):
+        minimum_edge_cut(graph, ["a", "e"], ["e"])
+
+
+def test_node_cut(graph: nx.DiGraph) -> None:
+    """Flow cut: minimum node cut."""
+    assert ["d"] == minimum_node_cut(graph, ["a"], ["e"])
+    assert ["d"] == minimum_node_cut(graph, ["a", "b"], ["e"])
+    assert minimum_node_cut(graph, ["a", "x"], ["e"]) is None
@@ -0,0 +1,79 @@
+"""Graph export unit tests."""
+# SPDX-License-Identifier: GPL-2.0-only
+#
+import io
+import xml.etree.ElementTree as ET
+
+import networkx as nx
+import pytest
+import setools
+from setools import graphexport
+
+
+@pytest.fixture
+def graph() -> nx.DiGraph:
+    g = nx.DiGraph()
+    g.add_edge("a_t", "b_t", weight=3)
+    g.add_edge("b_t", 'c"<t>', weight=10, rules=[object()])
+    g.add_node("lonely_t")
+    return g
+
+
+class TestGraphExport:
+
+    def test_graphml(self, graph: nx.DiGraph) -> None:
+        """Graph export: GraphML."""
+        fd = io.StringIO()
+        graphexport.write_graphml(graph, fd)
+        root = ET.fromstring(fd.getvalue())
+        ns = {"g": "http://graphml.graphdrawing.org/xmlns"}
+        nodes = [n.get("id") for n in root.iterfind("g:graph/g:node", ns)]
+        edges = [(e.get("source"), e.get("target"))
+                 for e in root.iterfind("g:graph/g:edge", ns)]
+        assert nodes == ["a_t", "b_t", 'c"<t>', "lonely_t"]
+        assert edges == [("a_t", "b_t"), ("b_t", 'c"<t>')]
+        keys = [k.get("attr.name") for k in root.iterfind("g:key[@for='edge']", ns)]
+        assert keys == ["weight"]
+
+    def test_gexf(self, graph: nx.DiGraph) -> None:
+        """Graph export: GEXF."""
+        fd = io.StringIO()
+        graphexport.write_gexf(graph, fd)
+        loaded = nx.read_gexf(io.BytesIO(fd.getvalue().encode("utf-8")))
+        assert loaded.is_directed()
+        assert list(loaded.nodes()) == ["a_t", "b_t", 'c"<t>', "lonely_t"]
+        assert list(loaded.edges(data="weight")) == [("a_t", "b_t", 3), ("b_t", 'c"<t>', 10)]
+
+    def test_dot(self, graph: nx.DiGraph) -> None:
+        """Graph export: DOT."""
+        fd = io.StringIO()
+        graphexport.write_dot(graph, fd)
+        lines = fd.getvalue().splitlines()
+        assert lines[0] == "digraph {"
+        assert '  "a_t" -> "b_t" [weight="3"];' in lines
+        assert '  "b_t" -> "c\\"<t>" [weight="10"];' in lines
+        assert lines[-1] == "}"
+
+    def test_edgelist(self, graph: nx.DiGraph) -> None:
+        """Graph export: edge list."""
+        fd = io.StringIO()
+        graphexport.write_edgelist(graph, fd)
+        assert fd.getvalue() == 'lonely_t\na_t\tb_t\tweight=3\nb_t\tc"<t>\tweight=10\n'
+
+    def test_format_from_filename(self) -> None:
+        """Graph export: format from file extension."""
+        assert setools.graph_format_from_filename("out.GraphML") == "graphml"
+        assert setools.graph_format_from_filename("out.gv") == "dot"
+        assert setools.graph_format_from_filename("out.png") is None
+
+    def test_invalid_format(self, graph: nx.DiGraph, tmp_path) -> None:
+        """Graph export: invalid format."""
+        with pytest.raises(ValueError):
+            setools.export_graph(graph, str(tmp_path / "out"), "bogus")
+
+    def test_save_graph(self, graph: nx.DiGraph, tmp_path) -> None:
+        """Graph export: save with the format from the file extension."""
+        filename = str(tmp_path / "out.edges")
+        setools.save_graph(graph, filename)
+        with open(filename, encoding="utf-8") as fd:
+            assert fd.read() == 'lonely_t\na_t\tb_t\tweight=3\nb_t\tc"<t>\tweight=10\n'
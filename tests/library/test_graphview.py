@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: GPL-2.0-only
+import networkx as nx
+
+from setools.graphview import GraphOverlay
+
+
+def test_overlay_view() -> None:
+    """Graph overlay: exclusions and replaced edge data do not change the graph."""
+    graph = nx.DiGraph()
+    graph.add_edge("a", "b", rules=[1])
+    graph.add_edge("b", "c", rules=[2])
+    graph.add_edge("c", "d", rules=[3])
+    graph.add_edge("a", "d", rules=[4])
+    graph.add_edge("x", "a", rules=[5])
+
+    overlay = GraphOverlay(graph, exclude=["x"])
+    view = overlay.view()
+    overlay.remove_edge("a", "d")
+    overlay.replace_data("b", "c", rules=[6])
+
+    assert nx.is_frozen(view)
+    assert sorted(view.nodes()) == ["a", "b", "c", "d"]
+    assert sorted(view.edges()) == [("a", "b"), ("b", "c"), ("c", "d")]
+    assert view.edges["b", "c"]["rules"] == [6]
+    assert list(view.predecessors("c")) == ["b"]
+    assert list(nx.all_shortest_paths(view, "a", "d")) == [["a", "b", "c", "d"]]
+
+    assert graph.number_of_edges() == 5
+    assert graph.edges["b", "c"]["rules"] == [2]
+
+
+def test_overlay_reverse_view() -> None:
+    """Graph overlay: overlay of a reverse view."""
+    graph = nx.DiGraph()
+    graph.add_edge("a", "b", rules=[1])
+    graph.add_edge("b", "c", rules=[2])
+
+    overlay = GraphOverlay(graph.reverse(copy=False))
+    view = overlay.view()
+    overlay.replace_data("c", "b", rules=[3])
+
+    assert sorted(view.edges()) == [("b", "a"), ("c", "b")]
+    assert view.edges["c", "b"]["rules"] == [3]
+    assert graph.edges["b", "c"]["rules"] == [2]
@@ -3,8 +3,12 @@
 # SPDX-License-Identifier: GPL-2.0-only
 #
 import collections
+import copy
+from pathlib import Path
+import sys
 import typing
 
+import networkx as nx
 import pytest
 import setools
 from setools import TERuletype as TERT
@@ -61,68 +65,71 @@ class TestInfoFlowAnalysis:
                     (node8, node9),
                     (node9, node8)]) == edges
 
-        r = analysis.G.edges[disconnected1, disconnected2]["rules"]
+        r = setools.InfoFlowStep(analysis.G, disconnected1, disconnected2).rules
         assert len(r) == 1
         util.validate_rule(r[0], TERT.allow, "disconnected1", "disconnected2", tclass="infoflow2",
                            perms=set(["super"]))
 
-        r = analysis.G.edges[disconnected2, disconnected1]["rules"]
+        r = setools.InfoFlowStep(analysis.G, disconnected2, disconnected1).rules
         assert len(r) == 1
         util.validate_rule(r[0], TERT.allow, "disconnected1", "disconnected2", tclass="infoflow2",
                            perms=set(["super"]))
 
-        r = sorted(analysis.G.edges[node1, node2]["rules"])
+        r = sorted(setools.InfoFlowStep(analysis.G, node1, node2).rules)
         assert len(r) == 2
         util.validate_rule(r[0], TERT.allow, "node1", "node2", tclass="infoflow",
                            perms=set(["med_w"]))
         util.validate_rule(r[1], TERT.allow, "node2", "node1", tclass="infoflow",
                            perms=set(["hi_r"]))
 
-        r = sorted(analysis.G.edges[node1, node3]["rules"])
+        r = sorted(setools.InfoFlowStep(analysis.G, node1, node3).rules)
         assert len(r) == 1
         util.validate_rule(r[0], TERT.allow, "node3", "node1", tclass="infoflow",
                            perms=set(["low_r", "med_r"]))
 
-        r = sorted(analysis.G.edges[node2, node4]["rules"])
+        r = sorted(setools.InfoFlowStep(analysis.G, node2, node4).rules)
         assert len(r) == 1
         util.validate_rule(r[0], TERT.allow, "node2", "node4", tclass="infoflow",
                            perms=set(["hi_w"]))
 
-        r = sorted(analysis.G.edges[node3, node5]["rules"])
+        r = sorted(setools.InfoFlowStep(analysis.G, node3, node5).rules)
         assert len(r) == 1
         util.validate_rule(r[0], TERT.allow, "node5", "node3", tclass="infoflow",
                            perms=set(["low_r"]))
 
-        r = sorted(analysis.G.edges[node4, node6]["rules"])
+        r = sorted(setools.InfoFlowStep(analysis.G, node4, node6).rules)
         assert len(r) == 1
         util.validate_rule(r[0], TERT.allow, "node4", "node6", tclass="infoflow2",
                            perms=set(["hi_w"]))
 
-        r = sorted(analysis.G.edges[node5, node8]["rules"])
+        r = sorted(setools.InfoFlowStep(analysis.G, node5, node8).rules)
         assert len(r) == 1
         util.validate_rule(r[0], TERT.allow, "node5", "node8", tclass="infoflow2",
                            perms=set(["hi_w"]))
 
-        r = sorted(analysis.G.edges[node6, node5]["rules"])
+        r = sorted(setools.InfoFlowStep(analysis.G, node6, node5).rules)
         assert len(r) == 1
         util.validate_rule(r[0], TERT.allow, "node5", "node6", tclass="infoflow",
                            perms=set(["med_r"]))
 
-        r = sorted(analysis.G.edges[node6, node7]["rules"])
+        r = sorted(setools.InfoFlowStep(analysis.G, node6, node7).rules)
         assert len(r) == 1
         util.validate_rule(r[0], TERT.allow, "node6", "node7", tclass="infoflow",
                            perms=set(["hi_w"]))
 
-        r = sorted(analysis.G.edges[node8, node9]["rules"])
+        r = sorted(setools.InfoFlowStep(analysis.G, node8, node9).rules)
         assert len(r) == 1
         util.validate_rule(r[0], TERT.allow, "node8", "node9", tclass="infoflow2",
                            perms=set(["super"]))
 
-        r = sorted(analysis.G.edges[node9, node8]["rules"])
+        r = sorted(setools.InfoFlowStep(analysis.G, node9, node8).rules)
         assert len(r) == 1
         util.validate_rule(r[0], TERT.allow, "node8", "node9", tclass="infoflow2",
                            perms=set(["super"]))
 
+        # steps with the same rules share the rule ids
+        assert analysis.G.edges[node8, node9]["rules"] is analysis.G.edges[node9, node8]["rules"]
+
     def test_minimum_3(self, analysis: setools.InfoFlowAnalysis) -> None:
         """Information flow analysis with minimum weight 3."""
 
@@ -226,6 +233,152 @@ class TestInfoFlowAnalysis:
         for r in step.rules:
             assert TERT.allow == r.ruletype
 
+    def test_widest_paths(self, analysis: setools.InfoFlowAnalysis) -> None:
+        """Information flow analysis: widest paths output"""
+        analysis.exclude = []
+        analysis.min_weight = 1
+        analysis.source = "node1"
+        analysis.target = "node8"
+        analysis.mode = setools.InfoFlowAnalysis.Mode.WidestPaths
+
+        paths = [[str(s.source) for s in p] for p in typing.cast(
+            collections.abc.Iterable[setools.InfoFlowPath], analysis.results())]
+        assert [["node1", "node2", "node4", "node6", "node5"]] == paths
+
+    def test_strongest_paths(self, analysis: setools.InfoFlowAnalysis) -> None:
+        """Information flow analysis: strongest paths output"""
+        analysis.exclude = []
+        analysis.min_weight = 1
+        analysis.source = "node1"
+        analysis.target = "node8"
+        analysis.mode = setools.InfoFlowAnalysis.Mode.StrongestPaths
+
+        paths = [[str(s.source) for s in p] for p in typing.cast(
+            collections.abc.Iterable[setools.InfoFlowPath], analysis.results())]
+        assert [["node1", "node2", "node4", "node6", "node5"],
+                ["node1", "node3", "node5"]] == paths
+
+        analysis.path_limit = 1
+        assert 1 == len(list(analysis.results()))
+
+    def test_strongest_paths_invalid_limit(self, analysis: setools.InfoFlowAnalysis) -> None:
+        """Information flow analysis: strongest paths with invalid path limit."""
+        with pytest.raises(ValueError):
+            analysis.path_limit = 0
+
+    def test_minimum_cut(self, analysis: setools.InfoFlowAnalysis) -> None:
+        """Information flow analysis: minimum cut output"""
+        analysis.exclude = []
+        analysis.min_weight = 1
+        analysis.source = "node1"
+        analysis.target = "node8"
+        analysis.mode = setools.InfoFlowAnalysis.Mode.MinimumCut
+
+        steps = list(typing.cast(collections.abc.Iterable[setools.InfoFlowStep],
+                                 analysis.results()))
+        assert [("node3", "node5"), ("node6", "node5")] == \
+            [(str(s.source), str(s.target)) for s in steps]
+        for step in steps:
+            assert step.rules
+
+        cut = analysis.minimum_cut()
+        assert 6 == cut.flow
+        assert ["node5"] == [str(t) for t in cut.types or []]
+
+    def test_minimum_cut_sets(self, analysis: setools.InfoFlowAnalysis) -> None:
+        """Information flow analysis: minimum cut of source and target sets"""
+        analysis.exclude = []
+        analysis.min_weight = 1
+
+        cut = analysis.minimum_cut(["node1", "node9"], ["node8"])
+        assert 16 == cut.flow
+        assert cut.types is None
+
+        with pytest.raises(ValueError):
+            analysis.minimum_cut(["node1"], ["node1"])
+
+    def test_exposure(self, analysis: setools.InfoFlowAnalysis) -> None:
+        """Information flow analysis: exposure of all types"""
+        analysis.exclude = []
+        analysis.min_weight = 1
+        analysis.depth_limit = 2
+
+        exposure = {str(e.type): e for e in analysis.exposure()}
+        assert (4, 0, 26, 0) == (exposure["node1"].flows_out, exposure["node1"].flows_in,
+                                 exposure["node1"].weight_out, exposure["node1"].weight_in)
+        assert (2, 4, 20, 12) == (exposure["node5"].flows_out, exposure["node5"].flows_in,
+                                  exposure["node5"].weight_out, exposure["node5"].weight_in)
+        assert (1, 4, 10, 26) == (exposure["node8"].flows_out, exposure["node8"].flows_in,
+                                  exposure["node8"].weight_out, exposure["node8"].weight_in)
+        assert list(exposure.values()) == analysis.exposure(workers=2)
+
+        exposure = {str(e.type): e for e in analysis.exposure(["node5"])}
+        assert (1, 0, 1, 0) == (exposure["node1"].flows_out, exposure["node1"].flows_in,
+                                exposure["node1"].weight_out, exposure["node1"].weight_in)
+
+    def test_reachability(self, analysis: setools.InfoFlowAnalysis, tmp_path: Path) -> None:
+        """Information flow analysis: reachability index"""
+        analysis.exclude = ["node6"]
+        analysis.min_weight = 1
+
+        index = analysis.reachability()
+        assert index is analysis.reachability()
+        assert set(["node2", "node3", "node4", "node5", "node8", "node9"]) == \
+            set(str(t) for t in index.descendants(analysis.policy.lookup_type("node1")))
+        assert set(["node1", "node3", "node5", "node8", "node9"]) == \
+            set(str(t) for t in index.ancestors(analysis.policy.lookup_type("node8")))
+        assert index.reachable(analysis.policy.lookup_type("node8"),
+                               analysis.policy.lookup_type("node8"))
+        assert not index.reachable(analysis.policy.lookup_type("node1"),
+                                   analysis.policy.lookup_type("node7"))
+
+        path = str(tmp_path / "reachability.json")
+        index.save(path)
+        loaded = setools.ReachabilityIndex.load(path, analysis.policy)
+        assert set(index.descendants(analysis.policy.lookup_type("node1"))) == \
+            set(loaded.descendants(analysis.policy.lookup_type("node1")))
+
+        analysis.exclude = []
+        index = analysis.reachability()
+        assert index.reachable(analysis.policy.lookup_type("node1"),
+                               analysis.policy.lookup_type("node7"))
+
+    def test_all_paths_budget(self, analysis: setools.InfoFlowAnalysis) -> None:
+        """Information flow analysis: all paths stopped by the path budget"""
+        analysis.exclude = []
+        analysis.min_weight = 1
+        analysis.source = "node1"
+        analysis.target = "node8"
+        analysis.mode = setools.InfoFlowAnalysis.Mode.AllPaths
+        analysis.depth_limit = 5
+        assert 2 == len(list(analysis.results()))
+
+        analysis.path_budget = setools.PathBudget(max_paths=1)
+        assert 1 == len(list(analysis.results()))
+        assert analysis.path_budget.exhausted
+
+    def test_all_paths_subgraph(self, analysis: setools.InfoFlowAnalysis) -> None:
+        """Information flow analysis: union of all paths output"""
+        analysis.exclude = []
+        analysis.min_weight = 1
+        analysis.source = "node1"
+        analysis.target = "node8"
+        analysis.mode = setools.InfoFlowAnalysis.Mode.AllPathsSubgraph
+        analysis.depth_limit = 4
+
+        steps = list(typing.cast(collections.abc.Iterable[setools.InfoFlowStep],
+                                 analysis.results()))
+        assert set([("node1", "node3"), ("node3", "node5"), ("node5", "node8")]) == \
+            set((str(s.source), str(s.target)) for s in steps)
+        for step in steps:
+            assert step.rules
+
+        analysis.depth_limit = 5
+        graph = analysis.graphical_results()
+        assert set([("node1", "node2"), ("node1", "node3"), ("node2", "node4"),
+                    ("node3", "node5"), ("node4", "node6"), ("node5", "node8"),
+                    ("node6", "node5")]) == set((str(s), str(t)) for s, t in graph.edges())
+
     def test_all_shortest_paths(self, analysis: setools.InfoFlowAnalysis) -> None:
         """Information flow analysis: all shortest paths output"""
         analysis.exclude = []
@@ -429,3 +582,80 @@ class TestInfoFlowAnalysis:
         analysis.source = "disconnected1"
         paths = list(analysis.results())
         assert 0 == len(paths)
+
+    def test_use_graph(self, analysis: setools.InfoFlowAnalysis) -> None:
+        """Information flow analysis: share the graph with another analysis."""
+        other = setools.InfoFlowAnalysis(analysis.policy, analysis.perm_map)
+        graph = analysis.build_graph()
+        other.use_graph(graph)
+        assert other.build_graph() is graph
+
+        for a in (analysis, other):
+            a.exclude = []
+            a.min_weight = 1
+            a.mode = setools.InfoFlowAnalysis.Mode.FlowsOut
+            a.source = "node6"
+
+        flows = typing.cast(collections.abc.Iterable[setools.InfoFlowStep], analysis.results())
+        other_flows = typing.cast(collections.abc.Iterable[setools.InfoFlowStep], other.results())
+        assert sorted((f.source, f.target) for f in flows) == \
+            sorted((f.source, f.target) for f in other_flows)
+
+        # an unchanged permission map does not change the graph
+        other.perm_map = analysis.perm_map
+        assert other.build_graph() is graph
+
+        # a changed permission map does not change the shared graph
+        perm_map = copy.deepcopy(analysis.perm_map)
+        perm_map.set_direction("infoflow", "med_r", "n")
+        other.perm_map = perm_map
+        assert other.build_graph() is not graph
+        assert analysis.build_graph() is graph
+        assert graph.number_of_edges() == other.build_graph().number_of_edges() + 1
+
+    def test_update_graph(self, analysis: setools.InfoFlowAnalysis) -> None:
+        """Information flow analysis: update the graph for permission map changes."""
+
+        def flows(graph: "nx.DiGraph") -> dict:
+            return {(s, t): (d["capacity"], sorted(setools.InfoFlowStep(graph, s, t).rules))
+                    for s, t, d in graph.edges(data=True)}
+
+        graph = analysis.build_graph()
+        perm_map = copy.deepcopy(analysis.perm_map)
+        perm_map.set_weight("infoflow", "hi_w", 3)
+        perm_map.set_direction("infoflow", "med_r", "n")
+        perm_map.set_direction("infoflow", "low_r", "w")
+        perm_map.exclude_permission("infoflow2", "super")
+        analysis.perm_map = perm_map
+        updated = analysis.build_graph()
+
+        rebuilt = setools.InfoFlowAnalysis(analysis.policy, copy.deepcopy(perm_map))
+        assert flows(rebuilt.build_graph()) == flows(updated)
+        assert sorted(rebuilt.build_graph().nodes()) == sorted(updated.nodes())
+
+        # the shared graph is unchanged
+        assert updated is not graph
+        assert flows(graph) != flows(updated)
+        assert analysis.perm_map.differences(graph.graph["perm_map"])
+
+        # reverting the changes restores the original flows
+        perm_map.set_weight("infoflow", "hi_w", 10)
+        perm_map.set_direction("infoflow", "med_r", "r")
+        perm_map.set_direction("infoflow", "low_r", "r")
+        perm_map.include_permission("infoflow2", "super")
+        analysis.perm_map = perm_map
+        assert flows(graph) == flows(analysis.build_graph())
+        assert sorted(graph.nodes()) == sorted(analysis.build_graph().nodes())
+
+    def test_rule_ids_memory(self, analysis: setools.InfoFlowAnalysis) -> None:
+        """Information flow analysis: edge rule ids use less memory than lists of the rules."""
+        rule_table = analysis.G.graph["rule_table"]
+        assert not rule_table._interned
+
+        # shared rule ids are counted once
+        packed = {id(rules): sys.getsizeof(rules)
+                  for _, _, rules in analysis.G.edges(data="rules")}
+        rule_lists = [sys.getsizeof(rule_table.rules(rules))
+                      for _, _, rules in analysis.G.edges(data="rules")]
+        assert sum(packed.values()) + sys.getsizeof(rule_table._rules) + \
+            sys.getsizeof(rule_table._ids) < sum(rule_lists)
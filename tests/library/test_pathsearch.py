@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: GPL-2.0-only
+import itertools
+
+import networkx as nx
+import pytest
+
+from setools.pathsearch import PathBudget, bounded_simple_paths, max_bottleneck, \
+    paths_subgraph, widest_paths
+
+
+@pytest.fixture
+def graph() -> nx.DiGraph:
+    ret = nx.gnp_random_graph(12, 0.3, seed=42, directed=True)
+    ret.add_edge(0, 11)
+    return ret
+
+
+def test_simple_paths(graph: nx.DiGraph) -> None:
+    """Path search: same paths as networkx, with and without a cutoff."""
+    for cutoff in (None, 1, 3, 5):
+        expected = sorted(nx.all_simple_paths(graph, 0, 11, cutoff=cutoff))
+        assert expected == sorted(bounded_simple_paths(graph, 0, 11, cutoff))
+
+
+def test_simple_paths_invalid_node(graph: nx.DiGraph) -> None:
+    """Path search: source or target not in the graph."""
+    with pytest.raises(nx.NodeNotFound):
+        list(bounded_simple_paths(graph, 0, "invalid"))
+
+    with pytest.raises(nx.NodeNotFound):
+        list(bounded_simple_paths(graph, "invalid", 0))
+
+
+def test_budget_paths(graph: nx.DiGraph) -> None:
+    """Path search: stopped by the path limit."""
+    budget = PathBudget(max_paths=5)
+    assert 5 == len(list(bounded_simple_paths(graph, 0, 11, budget=budget)))
+    assert budget.exhausted
+
+    budget = PathBudget(max_paths=5)
+    assert 1 == len(list(bounded_simple_paths(graph, 0, 11, 1, budget)))
+    assert budget.exhausted is None
+
+
+def test_budget_memory(graph: nx.DiGraph) -> None:
+    """Path search: stopped by the memory limit."""
+    budget = PathBudget(max_memory=1000)
+    paths = list(bounded_simple_paths(graph, 0, 11, budget=budget))
+    assert paths
+    assert budget.exhausted
+    assert sum(len(p) for p in paths) < 1000
+
+
+def test_budget_time() -> None:
+    """Path search: stopped by the time limit."""
+    graph = nx.complete_graph(30, create_using=nx.DiGraph)
+    budget = PathBudget(max_seconds=0.1)
+    paths = bounded_simple_paths(graph, 0, 29, budget=budget)
+    assert 100000 > sum(1 for _ in itertools.islice(paths, 100000))
+    assert budget.exhausted
+
+
+def test_budget_invalid() -> None:
+    """Path search: invalid budget."""
+    with pytest.raises(ValueError):
+        PathBudget(max_paths=0)
+
+
+def test_paths_subgraph(graph: nx.DiGraph) -> None:
+    """Path search: union of the paths includes the edges of all simple paths."""
+    for cutoff in (1, 3, 5):
+        expected = set(pair for path in nx.all_simple_paths(graph, 0, 11, cutoff=cutoff)
+                       for pair in nx.utils.pairwise(path))
+        assert expected <= set(paths_subgraph(graph, 0, 11, cutoff).edges())
+
+
+def test_paths_subgraph_pruned() -> None:
+    """Path search: union of the paths excludes edges beyond the cutoff."""
+    graph = nx.DiGraph([(1, 2), (2, 4), (4, 6), (6, 5), (1, 3), (3, 5), (5, 8), (8, 9)])
+    assert [(1, 3), (3, 5), (5, 8)] == sorted(paths_subgraph(graph, 1, 8, 4).edges())
+    assert 7 == paths_subgraph(graph, 1, 8, 5).number_of_edges()
+    assert 0 == paths_subgraph(graph, 1, 1, 5).number_of_edges()
+
+
+def test_widest_paths() -> None:
+    """Path search: widest paths, with the fewest edges."""
+    graph = nx.DiGraph()
+    graph.add_edge(1, 2, capacity=10)
+    graph.add_edge(2, 4, capacity=10)
+    graph.add_edge(1, 3, capacity=10)
+    graph.add_edge(3, 4, capacity=7)
+    graph.add_edge(1, 4, capacity=1)
+    graph.add_edge(2, 5, capacity=10)
+    graph.add_edge(5, 4, capacity=10)
+    assert 10 == max_bottleneck(graph, 1, 4)
+    assert [[1, 2, 4]] == list(widest_paths(graph, 1, 4))
+    assert max_bottleneck(graph, 4, 1) is None
+    assert [] == list(widest_paths(graph, 4, 1))
@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: GPL-2.0-only
 #
+import copy
 from unittest.mock import Mock
 
 import pytest
@@ -378,3 +379,18 @@ class TestPermissionMap:
         assert "new_class" in permmap._permmap
         assert 1 == len(permmap._permmap['new_class'])
         self.validate_permmap_entry(permmap._permmap, 'new_class', 'new_class_perm', 'u', 1, True)
+
+    def test_differences(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """PermMap differences of mappings from another map."""
+        permmap = PermissionMap("tests/library/perm_map")
+        other = copy.deepcopy(permmap)
+        assert not permmap.differences(other)
+
+        other.set_weight("infoflow2", "low_w", 10)
+        other.set_direction("infoflow", "med_r", "n")
+        other.exclude_permission("infoflow3", "null")
+        other.map_policy(compiled_policy)
+        expected = {("infoflow2", "low_w"), ("infoflow", "med_r"), ("infoflow3", "null"),
+                    ("infoflow2", "new_perm"), ("new_class", "new_class_perm")}
+        assert expected == permmap.differences(other)
+        assert expected == other.differences(permmap)
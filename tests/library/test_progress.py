@@ -0,0 +1,54 @@
+"""Progress reporting and cancellation unit tests."""
+# SPDX-License-Identifier: GPL-2.0-only
+#
+import pytest
+import setools
+from setools.progress import track
+
+
+def test_iterate() -> None:
+    """Progress reports the start, every interval, and the end of a phase."""
+    reports: list[tuple[str, int, int | None]] = []
+    progress = setools.Progress(lambda *args: reports.append(args), interval=2)
+
+    assert list(progress.iterate("Phase", range(5), 5)) == [0, 1, 2, 3, 4]
+    assert reports == [("Phase", 0, 5), ("Phase", 2, 5), ("Phase", 4, 5), ("Phase", 5, 5)]
+    assert progress.phase == "Phase"
+
+
+def test_track_disabled() -> None:
+    """Tracking without a Progress returns the items unchanged."""
+    items = [1, 2, 3]
+    assert track(None, "Phase", items) is items
+
+
+def test_invalid_interval() -> None:
+    """Progress with an invalid interval."""
+    with pytest.raises(ValueError):
+        setools.Progress(interval=0)
+
+
+def test_cancel() -> None:
+    """Canceling stops the iteration at the next item."""
+    progress = setools.Progress()
+    seen: list[int] = []
+    with pytest.raises(setools.exception.AnalysisCanceled):
+        for i in progress.iterate("Phase", range(10)):
+            seen.append(i)
+            if i == 2:
+                progress.cancel()
+
+    assert seen == [0, 1, 2]
+
+
+@pytest.mark.obj_args("tests/library/terulequery.conf")
+def test_query_canceled(compiled_policy: setools.SELinuxPolicy) -> None:
+    """A query canceled by its progress callback."""
+    def cancel(phase: str, count: int, total: int | None) -> None:
+        if count:
+            q.progress.cancel()  # type: ignore[union-attr]
+
+    q = setools.TERuleQuery(compiled_policy)
+    q.progress = setools.Progress(cancel, interval=1)
+    with pytest.raises(setools.exception.AnalysisCanceled):
+        list(q.results())
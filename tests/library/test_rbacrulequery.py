@@ -132,3 +132,8 @@ class TestRBACRuleQuery:
         # this will have to be updated as number of
         # role allows change in the test policy
         assert num == 9
+
+    def test_parallel(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """RBAC rule query with the scan split across worker processes."""
+        q = RBACRuleQuery(compiled_policy, ruletype=[RRT.allow])
+        assert list(q.results()) == q.parallel_results(workers=2)
@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: GPL-2.0-only
+import networkx as nx
+
+from setools.reachability import ReachabilityIndex, bounded_reach_counts
+
+
+def test_reachability() -> None:
+    """Reachability index: same reachability as networkx."""
+    graph = nx.gnp_random_graph(40, 0.05, seed=7, directed=True)
+    graph.add_edge(3, 3)
+    index = ReachabilityIndex(graph)
+
+    assert len(graph) == len(index)
+    for node in graph:
+        descendants = nx.descendants(graph, node)
+        ancestors = nx.ancestors(graph, node)
+        # a node reaches itself only on a cycle
+        if any(node in nx.descendants(graph, n) or n == node
+               for n in graph.successors(node)):
+            descendants.add(node)
+            ancestors.add(node)
+
+        assert descendants == set(index.descendants(node))
+        assert ancestors == set(index.ancestors(node))
+        for other in graph:
+            assert (other in descendants) == index.reachable(node, other)
+
+
+def test_reachability_missing_node() -> None:
+    """Reachability index: nodes not in the graph."""
+    index = ReachabilityIndex(nx.DiGraph([(1, 2)]))
+    assert index.reachable(1, 2)
+    assert not index.reachable(2, 1)
+    assert not index.reachable(1, 3)
+    assert not index.reachable(3, 1)
+    assert [] == list(index.descendants(3))
+    assert [] == list(index.ancestors(3))
+
+
+def test_bounded_reach_counts() -> None:
+    """Bounded reach: same counts as a search from each node."""
+    graph = nx.gnp_random_graph(40, 0.05, seed=11, directed=True)
+    for u, v in graph.edges():
+        graph.edges[u, v]["capacity"] = (u + v) % 10 + 1
+
+    targets = set(range(0, 40, 3))
+    jobs = [(False, None), (True, None), (False, 5), (True, 5)]
+    for depth in (1, 3, None):
+        expected = []
+        for reverse, min_capacity in jobs:
+            view = nx.subgraph_view(
+                graph.reverse(copy=False) if reverse else graph,
+                filter_edge=lambda u, v: min_capacity is None or
+                graph.edges[(v, u) if reverse else (u, v)]["capacity"] >= min_capacity)
+            expected.append([len(set(nx.single_source_shortest_path_length(view, n, depth))
+                                 & targets - {n}) for n in graph])
+
+        assert expected == bounded_reach_counts(graph, jobs, depth=depth, targets=targets)
+        assert expected == bounded_reach_counts(graph, jobs, depth=depth, targets=targets,
+                                                workers=2)
+
+    assert [] == bounded_reach_counts(graph, [], workers=2)
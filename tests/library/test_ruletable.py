@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: GPL-2.0-only
+import tracemalloc
+
+from setools.ruletable import RuleTable
+
+
+def test_rule_ids() -> None:
+    """Rule table: rules have stable ids."""
+    table = RuleTable[str]()
+    assert table.id("allow a b:file read;") == 0
+    assert table.id("allow a c:file read;") == 1
+    assert table.id("allow a b:file read;") == 0
+    assert len(table) == 2
+    assert table.rule(1) == "allow a c:file read;"
+    assert table.rules(table.ids((1, 0, 1))) == ["allow a c:file read;", "allow a b:file read;",
+                                                 "allow a c:file read;"]
+
+
+def test_interned_ids() -> None:
+    """Rule table: equal packed rule ids are shared until the index is released."""
+    table = RuleTable[str]()
+    a, b = table.id("a"), table.id("b")
+    ids = table.ids([a, b])
+    assert list(table.unpack(ids)) == [a, b]
+    assert table.ids((a, b)) is ids
+    assert table.ids(iter([a, b])) is ids
+    assert table.ids((b, a)) != ids
+    assert list(table.unpack(table.ids(()))) == []
+
+    table.release()
+    assert not table._interned
+    assert table.ids((a, b)) == ids
+    assert table.rules(ids) == ["a", "b"]
+
+
+def test_memory() -> None:
+    """Rule table: packed rule ids use less memory than lists of the rules."""
+    table = RuleTable[object]()
+    rules = [object() for _ in range(30000)]
+    for rule in rules:
+        table.id(rule)
+
+    # distinct rules for every edge, so no memory is saved by sharing
+    edges = [(i, i + 1, i + 2) for i in range(20000)]
+
+    tracemalloc.start()
+    try:
+        rule_lists = [[rules[i] for i in edge] for edge in edges]
+        lists_size = tracemalloc.get_traced_memory()[0]
+        del rule_lists
+
+        tracemalloc.clear_traces()
+        packed = [table.ids(edge) for edge in edges]
+        table.release()
+        packed_size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    assert [table.rules(ids) for ids in packed[:2]] == [rules[0:3], rules[1:4]]
+    assert packed_size < lists_size
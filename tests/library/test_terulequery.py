@@ -27,6 +27,13 @@ class TestTERuleQuery:
 
         assert rules == q_rules
 
+    def test_rules(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """TE rule query of a subset of rules."""
+        rules = [r for r in compiled_policy.terules() if r.ruletype == TRT.allow][:3]
+
+        q = TERuleQuery(compiled_policy)
+        assert sorted(rules) == sorted(q.results(rules=rules))
+
     def test_source_direct(self, compiled_policy: setools.SELinuxPolicy) -> None:
         """TE rule query with exact, direct, source match."""
         q = TERuleQuery(
@@ -69,6 +76,17 @@ class TestTERuleQuery:
         util.validate_rule(r[1], TRT.allow, "test4a2", "test4a2", tclass="infoflow",
                            perms=set(["low_r"]))
 
+    def test_source_regex_matches(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """TE rule query regex source criteria precomputed symbol matches."""
+        q = TERuleQuery(
+            compiled_policy, source="test4(s|t)", source_indirect=True, source_regex=True)
+
+        assert q._source_regex_matches == frozenset(("test4s1", "test4t1"))
+
+        q.source_regex = False
+        q.source = "test4a1"
+        assert q._source_regex_matches is None
+
     def test_target_direct(self, compiled_policy: setools.SELinuxPolicy) -> None:
         """TE rule query with exact, direct, target match."""
         q = TERuleQuery(
@@ -287,6 +305,14 @@ class TestTERuleQuery:
         util.validate_rule(r[1], TRT.type_transition, "test302source", "test302t2",
                            tclass="infoflow7", default="test302t2")
 
+    def test_parallel(self, compiled_policy: setools.SELinuxPolicy) -> None:
+        """TE rule query with the scan split across worker processes."""
+        q = TERuleQuery(compiled_policy, source="test2s", ruletype=[TRT.allow])
+        assert list(q.results()) == q.parallel_results(workers=2)
+
+        q = TERuleQuery(compiled_policy, boolean="test200")
+        assert list(q.results()) == q.parallel_results(workers=3)
+
 
 @pytest.mark.obj_args("tests/library/terulequery2.conf")
 class TestTERuleQueryXperm: